@@ -1,40 +1,29 @@
-from pyjap.logger import LOG
+from pyjra.logger import LOG
 # LOG.print_to_console()
 LOG.print_to_file()
 
-from pyjap.sql import SQLHandler
+from pyjra.sql import SQLHandler
+from pyjra.deploy import SQLDeployer
 
-import os
-import pyodbc
-
-directory = "C:/Users/JoshAppleton/OneDrive - Euler DataOps & Analytics Ltd/Documents/Guide Dogs/Integrations/SQL"
-local = SQLHandler(environment='gdba_test'
+directories = [
+    "sql/jra",
+    "C:/Users/JoshAppleton/OneDrive - Euler DataOps & Analytics Ltd/Documents/Guide Dogs/Integrations/SQL"
+]
+local = SQLHandler(environment='gdba_test', pool_size = 8
     # driver = '{SQL Server}',
     # server = 'NUCLEUS',
     # database = 'personal',
     # encrypt = 'no'
 )
+deployer = SQLDeployer(local, parallel = 8)
 ################################################################
-filenames = os.listdir(directory)
-filenames = [filename for filename in filenames if filename.endswith('.sql') and filename.startswith(('ufn_', 'usp_', 'vw_', 'v_'))]
-print('\n'.join(filenames))
+scripts = deployer.read_scripts(directories)
+print('\n'.join(script['file'] for script in scripts.values()))
 if input(f"Load the above files to {local}? (Y/n)\n") == "Y":
-    for filename in filenames:
-        LOG.info(f"Loading file {filename}...")
-        try:
-            with open(directory + '/' + filename, 'r') as file:
-                lines = file.read().splitlines()
-                go = (lines[-1] == 'GO')
-                local.execute_query('\n'.join(lines[0:len(lines) - int(go)]), commit = True)
-        except UnicodeDecodeError as error:
-            msg = f'Could not load {filename}. {error}'
-            LOG.error(msg)
-            print(msg)
-        except pyodbc.ProgrammingError as error:
-            msg = f'Error creating {filename}. {error}'
-            LOG.error(msg)
-            print(msg)
-        else:
-            LOG.info(f"Loaded file {filename}.")
+    results = deployer.deploy(scripts)
+    for object_name, error in results['failed'].items():
+        print(f'Error creating {object_name}. {error}')
+    print(f"{len(results['deployed'])} deployed, {len(results['skipped'])} unchanged, {len(results['failed'])} failed.")
 else:
-    print("Cancelled: no files have been loaded.")
\ No newline at end of file
+    print("Cancelled: no files have been loaded.")
+local.close_pool()
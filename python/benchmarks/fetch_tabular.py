@@ -0,0 +1,78 @@
+"""
+# fetch_tabular.py
+
+Version: 1.0
+Authors: JRA
+Date: 2026-10-17
+
+#### Explanation:
+Times fetching a result set into a Tabular end to end, from the cursor to the returned object, before and after Tabular.from_trusted.
+
+- before: `cursor.fetchall()` followed by `Tabular(...)`, as SQLHandler.execute_query did originally.
+- after: `SQLHandler.execute_query`, which fetches into Tabular.from_trusted with empty strings read as None.
+
+The database is replaced by the fake driver of the tests, which hands back prepared rows, so the timings are of pyjra alone and not of the network or the server.
+
+#### Usage:
+>>> python benchmarks/fetch_tabular.py --rows 1000000 --repeat 3
+
+#### History:
+- 1.0 JRA (2026-10-17): Initial version.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+import fake_pyodbc
+sys.modules['pyodbc'] = fake_pyodbc
+
+from pyjra.logger import LOG
+from pyjra.sql import SQLHandler
+from pyjra.utilities import Tabular
+
+DESCRIPTION = [('id', int), ('name', str), ('amount', float), ('created', datetime)]
+
+def make_rows(count: int) -> list[tuple]:
+    start = datetime(2026, 1, 1)
+    return [(i, '' if i % 10 == 0 else f"name{i}", i*0.5, start + timedelta(seconds = i)) for i in range(count)]
+
+def before() -> Tabular:
+    cursor = fake_pyodbc.connect('').cursor()
+    cursor.execute("SELECT * FROM [benchmark]")
+    selection = cursor.fetchall()
+    return Tabular(
+        data = [tuple(row) for row in selection],
+        columns = [col[0] for col in cursor.description],
+        datatypes = [col[1] for col in cursor.description]
+    )
+
+def after() -> Tabular:
+    return SQLHandler(server = 'server', database = 'database').execute_query("SELECT * FROM [benchmark]")
+
+def main():
+    parser = argparse.ArgumentParser(description = "Times fetching a result set into a Tabular.")
+    parser.add_argument('--rows', type = int, default = 1000000)
+    parser.add_argument('--repeat', type = int, default = 3)
+    args = parser.parse_args()
+    LOG.set_level('WARNING')
+
+    rows = make_rows(args.rows)
+    fake_pyodbc.RESULTS['[benchmark]'] = (DESCRIPTION, rows)
+    print(f"Fetching {args.rows} rows of {len(DESCRIPTION)} columns, best of {args.repeat}.")
+    results = {}
+    for label, function in [('before', before), ('after', after)]:
+        timings = []
+        for _ in range(args.repeat):
+            start = perf_counter()
+            results[label] = function()
+            timings.append(perf_counter() - start)
+        print(f"{label:>6}: {min(timings):.3f} s")
+    assert results['before'].data == results['after'].data, "The two paths returned different data."
+    return
+
+if __name__ == '__main__':
+    main()
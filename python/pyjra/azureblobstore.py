@@ -1,9 +1,9 @@
 """
 # azureblobstore.py
 
-Version: 1.7
+Version: 1.8
 Authors: JRA
-Date: 2024-03-26
+Date: 2026-10-17
 
 #### Explanation:
 Contains the AzureBlobHandler class for handling Azure blobs.
@@ -15,6 +15,7 @@ Contains the AzureBlobHandler class for handling Azure blobs.
 - keyring: For storage and retrieval of keys.
 - pandas: The DataFrame can be used as a storage medium.
 - io.StringIO: For streaming.
+- typing.Iterable: Type hints.
 - azure.storage.blob: Provides storage clients.
 
 #### Artefacts:
@@ -24,6 +25,7 @@ Contains the AzureBlobHandler class for handling Azure blobs.
 >>> from pyjra.azureblobstore import AzureBlobHandler
 
 #### History:
+- 1.8 JRA (2026-10-17): AzureBlobHandler v1.8.
 - 1.7 JRA (2024-03-26): AzureBlobHandler v1.7.
 - 1.6 JRA (2024-03-22): AzureBlobHandler v1.6.
 - 1.5 JRA (2024-03-19): AzureBlobHandler v1.5 and implemented LOG v2.0.
@@ -44,6 +46,7 @@ import keyring as kr
 import pandas as pd
 from io import StringIO
 from io import BytesIO
+from typing import Iterable
 from azure.storage.blob import BlobServiceClient, ContainerClient, BlobClient
 from azure.core.exceptions import ResourceNotFoundError
     
@@ -51,9 +54,9 @@ class AzureBlobHandler:
     """
     ## AzureBlobHandler
 
-    Version: 1.7
+    Version: 1.8
     Authors: JRA
-    Date: 2024-03-26
+    Date: 2026-10-17
 
     #### Explanation:
     Handles Azure blobs.
@@ -71,6 +74,7 @@ class AzureBlobHandler:
     - get_blob_csv_as_stream (func): Retrieves the content of a blob as a string stream.
     - get_blob_csv_as_dataframe (func): Retrieves the content of a CSV blob as a DataFrame.
     - get_blob_as_tabular (func): Supports retrieval of csv, xls and xlsx blobs as Tabular objects.
+    - __sheet_to_tabular (func): Converts the rows of a spreadsheet to a Tabular of strings.
     - copy_blob (func): Copies a blob from one location to another.
     - delete_blob (func): Deletes a blob from a container.
     - rename_blob (func): Renames a blob within a container.
@@ -86,6 +90,7 @@ class AzureBlobHandler:
     ['folder/file.ext', 'data.csv']
 
     #### History:
+    - 1.8 JRA (2026-10-17): get_blob_as_tabular v1.1 and __sheet_to_tabular v1.0.
     - 1.7 JRA (2024-03-26): copy_blob v1.1, write_to_blob v1.0 and write_to_blob_csv v1.5.
     - 1.6 JRA (2024-03-22): get_blob_as_byte_stream v1.0 and get_blob_as_tabular v1.0.
     - 1.5 JRA (2024-03-19): write_to_blob_csv v1.4.
@@ -385,9 +390,9 @@ class AzureBlobHandler:
         """
         ### get_blob_as_tabular
 
-        Version: 1.0
+        Version: 1.1
         Authors: JRA
-        Date: 2024-03-22
+        Date: 2026-10-17
 
         #### Explanation:
         Supports retrieval of csv, xls and xlsx blobs as Tabular objects.
@@ -395,6 +400,7 @@ class AzureBlobHandler:
         #### Requirements:
         - AzureBlobHandler.get_blob_csv_as_stream (func)
         - AzureBlobHandler.get_blob_as_byte_stream (func)
+        - AzureBlobHandler.__sheet_to_tabular (func)
         - xlrd.open_workbook (func)
         - openpyxl.load_workbook (func)
 
@@ -415,6 +421,7 @@ class AzureBlobHandler:
         <Tabular>
 
         #### History:
+        - 1.1 JRA (2026-10-17): Spreadsheets are read with __sheet_to_tabular.
         - 1.0 JRA (2024-03-22): Initial version.
         """
         file_extension = blob.split('.')[-1].lower()
@@ -436,13 +443,9 @@ class AzureBlobHandler:
             from xlrd import open_workbook
             data = self.get_blob_as_byte_stream(container = container, blob = blob)
             data = open_workbook(file_contents = data.read()).sheet_by_index(sheet_index)
-            col_count = data.ncols
-            data = [tuple(data.row_values(r)) for r in range(data.nrows)]
-            for r, row in enumerate(data):
-                data[r] = (None if value == '' else value for value in row)
-            data = Tabular(
-                data = data,
-                datatypes = [str]*col_count,
+            data = self.__sheet_to_tabular(
+                rows = (data.row_values(r) for r in range(data.nrows)),
+                col_count = data.ncols,
                 header = header,
                 name = blob
             )
@@ -451,9 +454,9 @@ class AzureBlobHandler:
             data = self.get_blob_as_byte_stream(container = container, blob = blob)
             data = load_workbook(filename = data)
             data = data[data.sheetnames[sheet_index]]
-            data = Tabular(
-                data = [tuple(row) for row in data.iter_rows(values_only = True)],
-                datatypes = [str]*data.max_column,
+            data = self.__sheet_to_tabular(
+                rows = data.iter_rows(values_only = True),
+                col_count = data.max_column,
                 header = header,
                 name = blob
             )
@@ -463,6 +466,47 @@ class AzureBlobHandler:
             raise NotImplementedError(error)
         return data
 
+    @staticmethod
+    def __sheet_to_tabular(rows: Iterable, col_count: int, header: bool = True, name: str = None) -> Tabular:
+        """
+        ### __sheet_to_tabular
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Converts the rows of a spreadsheet to a Tabular of strings in a single pass. Spreadsheet readers already guarantee a rectangular shape, so the Tabular is built with Tabular.from_trusted rather than being validated.
+
+        #### Requirements:
+        - Tabular.from_trusted (func)
+
+        #### Parameters:
+        - rows (Iterable): The rows of cell values.
+        - col_count (int): The number of columns of the sheet.
+        - header (bool): If true, the first row is used as column names. Defaults to true.
+        - name (str): The name to assign to the Tabular. Defaults to None.
+
+        #### Returns:
+        - (Tabular)
+
+        #### Usage:
+        >>> AzureBlobHandler.__sheet_to_tabular(sheet.iter_rows(values_only = True), sheet.max_column)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        data = [tuple(None if value is None or value == '' else str(value) for value in row) for row in rows]
+        columns = [f"Column{c + 1}" for c in range(col_count)]
+        if header and len(data) > 0:
+            columns = [column or columns[c] for c, column in enumerate(data.pop(0))]
+        return Tabular.from_trusted(
+            data = data,
+            columns = columns,
+            datatypes = [str]*col_count,
+            name = name
+        )
+
     def copy_blob(
         self, 
         source_container: str, 
@@ -0,0 +1,506 @@
+"""
+# deploy.py
+
+Version: 1.2
+Authors: JRA
+Date: 2026-10-17
+
+#### Explanation:
+Contains the SQLDeployer class for deploying SQL object scripts, such as functions, procedures and views, to SQL Server databases.
+
+#### Requirements:
+- pyjra.logger.LOG: For logging.
+- pyjra.sql.SQLHandler: To interface with the database.
+- re: Splits scripts into batches and finds object names and references.
+- hashlib.sha256: Fingerprints scripts so unchanged ones are skipped.
+- os: Lists and reads script files.
+- concurrent.futures: Deploys independent objects concurrently.
+- argparse: Command line entry point.
+
+#### Artefacts:
+- SQLDeployer (class): Deploys SQL object scripts in dependency order over parallel connections.
+- main (func): Command line entry point.
+
+#### Usage:
+>>> from pyjra.deploy import SQLDeployer
+or
+>>> python -m pyjra.deploy sql/jra sql/client --environment dev --parallel 8
+
+#### History:
+- 1.2 JRA (2026-10-17): SQLDeployer v1.2.
+- 1.1 JRA (2026-10-17): SQLDeployer v1.1.
+- 1.0 JRA (2026-10-17): Initial version.
+"""
+from pyjra.sql import SQLHandler
+
+from pyjra.logger import LOG
+LOG.define_logging_level('deploy', 15)
+LOG.set_level(min(LOG.level, 15))
+
+import re as regex
+from hashlib import sha256
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures import FIRST_COMPLETED
+import argparse
+
+class SQLDeployer:
+    """
+    ## SQLDeployer
+
+    Version: 1.2
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Deploys SQL object scripts in dependency order. Scripts are split into batches on every `GO` separator, the objects each script references are found from the names of the other scripts, and objects whose dependencies are deployed are run concurrently, each on a connection spawned from the handler's pool. The hash of each deployed script is recorded in a control table, so scripts that have not changed since their last deployment are skipped.
+
+    #### Artefacts:
+    - handler (SQLHandler): The handler of the database to deploy to. Should be created with a pool_size of at least parallel.
+    - parallel (int): The number of objects deployed at once.
+    - control_table (str): The bracket wrapped name of the control table of deployed hashes, or None to not track deployments.
+    - prefixes (tuple[str]): The prefixes of the files to deploy.
+    - __init__ (func): Initialises the deployer.
+    - split_batches (func): Splits a script into batches on its `GO` separators.
+    - read_scripts (func): Reads the scripts to deploy from directories.
+    - dependencies (func): Finds which of the scripts each script depends on.
+    - __deployed_hashes (func): Reads the hashes of deployed scripts from the control table.
+    - __deploy_script (func): Deploys a single script on its own connection.
+    - deploy (func): Deploys scripts in dependency order.
+
+    #### Usage:
+    >>> deployer = SQLDeployer(SQLHandler(environment = 'dev', pool_size = 8), parallel = 8)
+    >>> deployer.deploy(deployer.read_scripts(['sql/jra', 'sql/client']))
+    {'deployed': ['[jra].[ufn_gradient_hex]', '[jra].[usp_select_to_html]'], 'skipped': [...], 'failed': {}}
+
+    #### History:
+    - 1.2 JRA (2026-10-17): deploy v1.1.
+    - 1.1 JRA (2026-10-17): __deployed_hashes v1.1.
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(
+        self,
+        handler: SQLHandler,
+        parallel: int = 4,
+        control_table: str = '[dbo].[pyjra_deployments]',
+        prefixes: tuple[str] = ('ufn_', 'usp_', 'vw_', 'v_')
+    ):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the deployer.
+
+        #### Parameters:
+        - handler (SQLHandler): The handler of the database to deploy to.
+        - parallel (int): The number of objects deployed at once. Defaults to 4.
+        - control_table (str): The bracket wrapped name of the control table of deployed hashes. It is created if it does not exist. If None, deployments are not tracked and every script is deployed. Defaults to '[dbo].[pyjra_deployments]'.
+        - prefixes (tuple[str]): The prefixes of the files to deploy. Defaults to functions, procedures and views.
+
+        #### Usage:
+        >>> deployer = SQLDeployer(SQLHandler(environment = 'dev', pool_size = 8), parallel = 8)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if parallel < 1:
+            error = "The number of parallel deployments must be at least 1."
+            LOG.error(error)
+            raise ValueError(error)
+        self.handler = handler
+        self.parallel = parallel
+        self.control_table = control_table
+        self.prefixes = tuple(prefixes)
+        if handler.pool is None and parallel > 1:
+            LOG.warning(f"{handler} has no connection pool, so every script opens a new connection.")
+        return
+
+    @staticmethod
+    def split_batches(script: str) -> list[str]:
+        """
+        ### split_batches
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Splits a script into batches on every line that is a `GO` separator, as SQL Server tools do. A count after `GO` repeats the batch, and empty batches are dropped.
+
+        #### Parameters:
+        - script (str): The script to split.
+
+        #### Returns:
+        - batches (list[str])
+
+        #### Usage:
+        >>> SQLDeployer.split_batches("CREATE TABLE [t] ([c] int)\\nGO\\nINSERT INTO [t] VALUES (1)\\nGO 2")
+        ['CREATE TABLE [t] ([c] int)', 'INSERT INTO [t] VALUES (1)', 'INSERT INTO [t] VALUES (1)']
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        batches = []
+        start = 0
+        for separator in regex.finditer(r"^[ \t]*GO(?:[ \t]+(\d+))?[ \t]*(?:--[^\n]*)?$", script, flags = regex.IGNORECASE | regex.MULTILINE):
+            batch = script[start:separator.start()].strip()
+            if batch != '':
+                batches.extend([batch]*int(separator.group(1) or 1))
+            start = separator.end()
+        batch = script[start:].strip()
+        if batch != '':
+            batches.append(batch)
+        return batches
+
+    def read_scripts(self, directories: str|list[str]) -> dict[str, dict]:
+        """
+        ### read_scripts
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads the scripts to deploy from directories. Only `.sql` files starting with one of the prefixes are read. Each script is split into batches, hashed and named after the object it creates, or its file if no object is created. If the same object is scripted in more than one directory, the later directory takes precedence, so client folders can override shared ones.
+
+        #### Requirements:
+        - SQLDeployer.split_batches
+
+        #### Parameters:
+        - directories (str|list[str]): The directories to read.
+
+        #### Returns:
+        - scripts (dict[str, dict]): The file, object name, batches, comment-free code and hash of each script, keyed by the lowercase object name.
+
+        #### Usage:
+        >>> deployer.read_scripts(['sql/jra', 'sql/client'])
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(directories, str):
+            directories = [directories]
+        scripts = {}
+        for directory in directories:
+            for filename in sorted(os.listdir(directory)):
+                if not (filename.lower().endswith('.sql') and filename.startswith(self.prefixes)):
+                    continue
+                file = os.path.join(directory, filename)
+                with open(file, 'rb') as f:
+                    content = f.read()
+                try:
+                    text = content.decode('utf-16') if content.startswith((b'\xff\xfe', b'\xfe\xff')) else content.decode('utf-8-sig')
+                except UnicodeDecodeError as e:
+                    LOG.error(f"Could not read {file}. {e}")
+                    continue
+                code = regex.sub(r"--[^\n]*|/\*.*?\*/", ' ', text, flags = regex.DOTALL)
+                name = regex.search(
+                    r"\bCREATE\s+(?:OR\s+ALTER\s+)?(?:PROCEDURE|PROC|FUNCTION|VIEW|TRIGGER|TYPE|TABLE|SYNONYM)\s+((?:\[[^\]]+\]|\w+)(?:\s*\.\s*(?:\[[^\]]+\]|\w+))?)",
+                    code,
+                    flags = regex.IGNORECASE
+                ) or regex.search(r"\bALTER\s+(?:PROCEDURE|PROC|FUNCTION|VIEW|TRIGGER)\s+((?:\[[^\]]+\]|\w+)(?:\s*\.\s*(?:\[[^\]]+\]|\w+))?)", code, flags = regex.IGNORECASE)
+                if name is None:
+                    object_name = os.path.splitext(filename)[0]
+                else:
+                    object_name = '.'.join(f"[{part.strip().strip('[]')}]" for part in name.group(1).split('.'))
+                key = object_name.lower()
+                if key in scripts:
+                    LOG.warning(f"{file} overrides {scripts[key]['file']} for {object_name}.")
+                scripts[key] = {
+                    'file': file,
+                    'object_name': object_name,
+                    'batches': self.split_batches(text),
+                    'code': code,
+                    'hash': sha256(content).hexdigest()
+                }
+        LOG.deploy(f"Read {len(scripts)} scripts from {len(directories)} directories.")
+        return scripts
+
+    @staticmethod
+    def dependencies(scripts: dict[str, dict]) -> dict[str, set[str]]:
+        """
+        ### dependencies
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Finds which of the scripts each script depends on. A script depends on another if the bare name of the other's object appears as a word in its code, outside of comments.
+
+        #### Parameters:
+        - scripts (dict[str, dict]): The scripts, as returned by SQLDeployer.read_scripts.
+
+        #### Returns:
+        - dependencies (dict[str, set[str]]): The keys of the scripts each script depends on.
+
+        #### Usage:
+        >>> SQLDeployer.dependencies(scripts)['[jra].[usp_select_to_html]']
+        {'[jra].[ufn_gradient_hex]'}
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        names = {}
+        for key, script in scripts.items():
+            names.setdefault(key.split('.')[-1].strip('[]'), set()).add(key)
+        dependencies = {}
+        for key, script in scripts.items():
+            words = set(regex.findall(r"\w+", script['code'].lower()))
+            dependencies[key] = {dependency for word in words & names.keys() for dependency in names[word]} - {key}
+        return dependencies
+
+    def __deployed_hashes(self) -> dict[str, str]:
+        """
+        ### __deployed_hashes
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Creates the control table if it does not exist and reads the hashes of deployed scripts whose objects still exist.
+
+        #### Requirements:
+        - SQLHandler.execute_query
+
+        #### Returns:
+        - hashes (dict[str, str]): The hash of each deployed script, keyed by lowercase object name.
+
+        #### Usage:
+        >>> deployer.__deployed_hashes()
+        {'[jra].[ufn_age]': '9f86d0...'}
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Passes the control table name as a one-value tuple.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.handler.execute_query(
+            query = f"""IF OBJECT_ID(?) IS NULL
+CREATE TABLE {self.control_table} (
+\t[object_name] nvarchar(256) NOT NULL PRIMARY KEY,
+\t[file] nvarchar(512) NULL,
+\t[hash] char(64) NOT NULL,
+\t[deployed] datetime2 NOT NULL DEFAULT SYSUTCDATETIME()
+)""",
+            values = (self.control_table,),
+            commit = True,
+            use_cache = False
+        )
+        result = self.handler.execute_query(
+            query = f"SELECT [object_name], [hash] FROM {self.control_table} WHERE OBJECT_ID([object_name]) IS NOT NULL",
+            use_cache = False
+        )
+        if result is None:
+            return {}
+        return {object_name.lower(): hash for object_name, hash in result.data}
+
+    def __deploy_script(self, script: dict):
+        """
+        ### __deploy_script
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Deploys a single script in one transaction on a handler spawned from the deployer's handler. Every result of each batch is read, so errors in any statement are raised. If deployments are tracked, the hash of the script is recorded in the same transaction.
+
+        #### Requirements:
+        - SQLHandler.spawn
+        - SQLHandler.connect_to_mssql
+        - SQLHandler.close_connection
+
+        #### Parameters:
+        - script (dict): The script, as returned by SQLDeployer.read_scripts.
+
+        #### Usage:
+        >>> deployer.__deploy_script(scripts['[jra].[ufn_age]'])
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        worker = self.handler.spawn()
+        worker.connect_to_mssql(auto_commit = False)
+        try:
+            LOG.deploy(f"Deploying {script['object_name']} from {script['file']}...")
+            for batch in script['batches']:
+                worker.cursor.execute(batch)
+                while worker.cursor.nextset():
+                    pass
+            if self.control_table is not None:
+                worker.cursor.execute(
+                    f"""MERGE {self.control_table} AS [t]
+USING (SELECT ? AS [object_name], ? AS [file], ? AS [hash]) AS [s]
+ON [t].[object_name] = [s].[object_name]
+WHEN MATCHED THEN
+\tUPDATE SET [file] = [s].[file], [hash] = [s].[hash], [deployed] = SYSUTCDATETIME()
+WHEN NOT MATCHED THEN
+\tINSERT ([object_name], [file], [hash]) VALUES ([s].[object_name], [s].[file], [s].[hash]);""",
+                    script['object_name'], script['file'], script['hash']
+                )
+        except Exception as e:
+            LOG.error(f"Failed to deploy {script['object_name']} from {script['file']}. {e}")
+            worker.close_connection(commit = False)
+            raise
+        worker.close_connection(commit = True)
+        LOG.deploy(f"Deployed {script['object_name']}.")
+        return
+
+    def deploy(self, scripts: dict[str, dict], force: bool = False) -> dict:
+        """
+        ### deploy
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Deploys scripts in dependency order. A script is deployed once every script it depends on has been deployed or skipped, and up to `parallel` scripts are deployed at once. Scripts whose hash matches the control table are skipped unless forced. If a script fails, the scripts that depend on it are not deployed. If scripts depend on each other in a cycle, the cycle is broken by deploying the script with the fewest outstanding dependencies first.
+
+        #### Requirements:
+        - SQLDeployer.dependencies
+        - SQLDeployer.__deployed_hashes
+        - SQLDeployer.__deploy_script
+        - concurrent.futures.ThreadPoolExecutor
+
+        #### Parameters:
+        - scripts (dict[str, dict]): The scripts, as returned by SQLDeployer.read_scripts.
+        - force (bool): If true, unchanged scripts are deployed too. Defaults to false.
+
+        #### Returns:
+        - results (dict): The object names that were deployed and skipped, and the errors of those that failed, keyed by object name.
+
+        #### Usage:
+        >>> deployer.deploy(deployer.read_scripts('sql/jra'))
+        {'deployed': ['[jra].[ufn_age]'], 'skipped': [...], 'failed': {}}
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Waits for running scripts to finish before returning, so none are left out of the results.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        pending = self.dependencies(scripts)
+        dependents = {key: [] for key in scripts}
+        for key, dependencies in pending.items():
+            for dependency in dependencies:
+                dependents[dependency].append(key)
+        hashes = self.__deployed_hashes() if self.control_table is not None and not force else {}
+        results = {'deployed': [], 'skipped': [], 'failed': {}}
+        finished = set()
+
+        def resolve(key: str) -> list[str]:
+            finished.add(key)
+            ready = []
+            for dependent in dependents[key]:
+                pending[dependent].discard(key)
+                if len(pending[dependent]) == 0 and dependent not in finished:
+                    ready.append(dependent)
+            return ready
+
+        def block(key: str):
+            for dependent in dependents[key]:
+                if dependent not in finished:
+                    finished.add(dependent)
+                    results['failed'][scripts[dependent]['object_name']] = RuntimeError(f"Dependency {scripts[key]['object_name']} failed.")
+                    block(dependent)
+            return
+
+        LOG.deploy(f"Deploying {len(scripts)} scripts to {self.handler} over {self.parallel} connections...")
+        ready = [key for key, dependencies in pending.items() if len(dependencies) == 0]
+        running = {}
+        with ThreadPoolExecutor(max_workers = self.parallel, thread_name_prefix = 'pyjra-deploy') as executor:
+            while len(finished) < len(scripts) or len(running) > 0:
+                while len(ready) > 0:
+                    key = ready.pop()
+                    if key in finished:
+                        continue
+                    elif hashes.get(key) == scripts[key]['hash']:
+                        LOG.deploy(f"Skipping unchanged {scripts[key]['object_name']}.")
+                        results['skipped'].append(scripts[key]['object_name'])
+                        ready.extend(resolve(key))
+                    else:
+                        finished.add(key)
+                        running[executor.submit(self.__deploy_script, scripts[key])] = key
+                if len(running) == 0:
+                    cycle = [key for key in scripts if key not in finished]
+                    if len(cycle) == 0:
+                        break
+                    key = min(cycle, key = lambda key: len(pending[key]))
+                    LOG.warning(f"Circular dependencies remain among {', '.join(scripts[key]['object_name'] for key in cycle)}. Deploying {scripts[key]['object_name']} first.")
+                    pending[key].clear()
+                    ready.append(key)
+                    continue
+                done, _ = wait(running, return_when = FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        results['failed'][scripts[key]['object_name']] = error
+                        block(key)
+                    else:
+                        results['deployed'].append(scripts[key]['object_name'])
+                        ready.extend(resolve(key))
+        LOG.deploy(f"Deployed {len(results['deployed'])} scripts, skipped {len(results['skipped'])} unchanged and {len(results['failed'])} failed.")
+        return results
+
+def main(arguments: list[str] = None) -> int:
+    """
+    ### main
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Command line entry point that deploys the scripts of one or more directories.
+
+    #### Requirements:
+    - SQLHandler
+    - SQLDeployer
+
+    #### Parameters:
+    - arguments (list[str]): The command line arguments. Defaults to those of the process.
+
+    #### Returns:
+    - (int): The exit code, 1 if any script failed.
+
+    #### Usage:
+    >>> python -m pyjra.deploy sql/jra sql/client --environment dev --parallel 8
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    parser = argparse.ArgumentParser(prog = 'python -m pyjra.deploy', description = "Deploys SQL object scripts in dependency order.")
+    parser.add_argument('directories', nargs = '+', help = "The directories of scripts to deploy. Later directories override earlier ones.")
+    parser.add_argument('--environment', help = "The keyring environment of the database.")
+    parser.add_argument('--connection-string', help = "The connection string of the database.")
+    parser.add_argument('--parallel', type = int, default = 4, help = "The number of objects deployed at once.")
+    parser.add_argument('--force', action = 'store_true', help = "Deploy unchanged scripts too.")
+    parser.add_argument('--prefixes', nargs = '+', default = ['ufn_', 'usp_', 'vw_', 'v_'], help = "The prefixes of the files to deploy.")
+    parser.add_argument('--control-table', default = '[dbo].[pyjra_deployments]', help = "The control table of deployed hashes.")
+    arguments = parser.parse_args(arguments)
+
+    handler = SQLHandler(
+        connection_string = arguments.connection_string,
+        environment = arguments.environment,
+        pool_size = arguments.parallel
+    )
+    deployer = SQLDeployer(handler, arguments.parallel, arguments.control_table, tuple(arguments.prefixes))
+    try:
+        results = deployer.deploy(deployer.read_scripts(arguments.directories), force = arguments.force)
+    finally:
+        handler.close_pool()
+    for object_name in results['deployed']:
+        print(f"Deployed {object_name}.")
+    for object_name, error in results['failed'].items():
+        print(f"Failed {object_name}. {error}")
+    print(f"{len(results['deployed'])} deployed, {len(results['skipped'])} unchanged, {len(results['failed'])} failed.")
+    return int(len(results['failed']) > 0)
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,9 +1,9 @@
 """
 # sql.py
 
-Version: 3.2
+Version: 3.46
 Authors: JRA
-Date: 2024-03-19
+Date: 2026-10-17
 
 #### Explanation:
 Contains the sqlhandler class for operating on SQL Server databases.
@@ -11,18 +11,95 @@ Contains the sqlhandler class for operating on SQL Server databases.
 #### Requirements:
 - pyjra.logger.LOG: For logging.
 - pyjra.utilities.extract_param: For reading parameter values from connection strings.
+- pyjra.utilities.SpilledTabular: For results spilled to disk.
 - pandas: For DataFrames.
 - keyring: For storing and retrieving of keys.
 - pyodbc: To interface with the database.
 - time.sleep: Pause between connection retries.
+- time.monotonic: Measures idle time of pooled connections and the latency of calls.
+- threading: Synchronises pooled connections and parallel workers, and prewarms databases in the background.
+- random.random: Jitters retry delays.
+- math.ceil: Nearest rank percentiles of query metrics.
+- concurrent.futures.ThreadPoolExecutor: Runs parallel partitions of inserts and selects.
+- uuid: Unique staging table and file names, and inference of uniqueidentifier columns.
+- decimal.Decimal: Inference of decimal columns.
+- numbers.Integral: Inference of integer columns.
+- datetime: Serialisation of dates for bulk files and watermarks.
+- csv.writer: Writes bulk files.
+- tempfile.gettempdir: Default directory for staging bulk files.
+- os: Staging file paths and clean up, and atomic replacement of watermark files.
+- json: Serialises watermarks.
+- collections: Stores idle pooled connections and cached results.
+- sys.getsizeof: Estimates the size of cached results.
+- re: Normalises and inspects queries for caching.
+- array.array: Typed column buffers for columnar results.
+- typing: Type hints for callables and iterators.
+- itertools: Lazy batching of iterables.
+- functools.partial: Binds arguments of work passed to threads.
+- contextlib: Session scopes.
+- asyncio: Event loop integration for AsyncSQLHandler.
 
 #### Artefacts:
+- ConnectionPool (class): Thread-safe pool of reusable database connections.
+- PartitionError (class): Raised when partitions of a parallel operation fail.
+- QueryCancelled (class): Raised when a query is cancelled or times out.
+- CancelHandle (class): Lets another thread cancel a running query.
+- QueryCache (class): Cache of read query results with TTL and LRU eviction.
+- RetryPolicy (class): Retries transient failures with exponential backoff, jitter and a deadline.
+- QueryMetrics (class): Records the latency and volume of calls as percentiles.
+- WatermarkStore (class): Persists watermarks of incremental extractions to a file or control table.
 - SQLHandler (class): Operates on SQL Server databases.
+- AsyncSQLHandler (class): Asyncio front-end for SQLHandler.
 
 #### Usage:
 >>> from pyjra.sql import SQLHandler
+>>> from pyjra.sql import AsyncSQLHandler
 
 #### History:
+- 3.46 JRA (2026-10-17): SQLHandler v3.43.
+- 3.45 JRA (2026-10-17): SQLHandler v3.42.
+- 3.44 JRA (2026-10-17): SQLHandler v3.41.
+- 3.43 JRA (2026-10-17): SQLHandler v3.40.
+- 3.42 JRA (2026-10-17): SQLHandler v3.39.
+- 3.41 JRA (2026-10-17): SQLHandler v3.38 and AsyncSQLHandler v1.3.
+- 3.40 JRA (2026-10-17): SQLHandler v3.37.
+- 3.39 JRA (2026-10-17): SQLHandler v3.36.
+- 3.38 JRA (2026-10-17): SQLHandler v3.35.
+- 3.37 JRA (2026-10-17): WatermarkStore v1.1.
+- 3.36 JRA (2026-10-17): SQLHandler v3.34.
+- 3.35 JRA (2026-10-17): SQLHandler v3.33.
+- 3.34 JRA (2026-10-17): SQLHandler v3.32.
+- 3.33 JRA (2026-10-17): SQLHandler v3.31.
+- 3.32 JRA (2026-10-17): SQLHandler v3.30.
+- 3.31 JRA (2026-10-17): SQLHandler v3.29.
+- 3.30 JRA (2026-10-17): SQLHandler v3.28.
+- 3.29 JRA (2026-10-17): AsyncSQLHandler v1.2.
+- 3.28 JRA (2026-10-17): SQLHandler v3.27.
+- 3.27 JRA (2026-10-17): SQLHandler v3.26.
+- 3.26 JRA (2026-10-17): SQLHandler v3.25.
+- 3.25 JRA (2026-10-17): SQLHandler v3.24.
+- 3.24 JRA (2026-10-17): Added QueryCancelled, CancelHandle, SQLHandler v3.23 and AsyncSQLHandler v1.1.
+- 3.23 JRA (2026-10-17): SQLHandler v3.22.
+- 3.22 JRA (2026-10-17): SQLHandler v3.21.
+- 3.21 JRA (2026-10-17): SQLHandler v3.20.
+- 3.20 JRA (2026-10-17): SQLHandler v3.19.
+- 3.19 JRA (2026-10-17): Added WatermarkStore and SQLHandler v3.18.
+- 3.18 JRA (2026-10-17): Added QueryMetrics and SQLHandler v3.17.
+- 3.17 JRA (2026-10-17): Added RetryPolicy and SQLHandler v3.16.
+- 3.16 JRA (2026-10-17): SQLHandler v3.15.
+- 3.15 JRA (2026-10-17): SQLHandler v3.14.
+- 3.14 JRA (2026-10-17): SQLHandler v3.13.
+- 3.13 JRA (2026-10-17): SQLHandler v3.12.
+- 3.12 JRA (2026-10-17): SQLHandler v3.11.
+- 3.11 JRA (2026-10-17): Added QueryCache v1.1 and SQLHandler v3.10.
+- 3.10 JRA (2026-10-17): SQLHandler v3.9.
+- 3.9 JRA (2026-10-17): Added QueryCache and SQLHandler v3.8.
+- 3.8 JRA (2026-10-17): Added AsyncSQLHandler and SQLHandler v3.7.
+- 3.7 JRA (2026-10-17): SQLHandler v3.6.
+- 3.6 JRA (2026-10-17): Added PartitionError and SQLHandler v3.5.
+- 3.5 JRA (2026-10-17): SQLHandler v3.4.
+- 3.4 JRA (2026-10-17): SQLHandler v3.3.
+- 3.3 JRA (2026-10-17): Added ConnectionPool and SQLHandler v3.2.
 - 3.2 JRA (2024-03-19): Implemented LOG v2.0.
 - 3.1 JRA (2024-02-23): Tabular implementation bug fixes.
 - 3.0 JRA (2024-02-19): Implemented Tabular and removed select_to_dataframe and query_columns.
@@ -32,721 +109,5965 @@ Contains the sqlhandler class for operating on SQL Server databases.
 """
 from pyjra.utilities import extract_param
 from pyjra.utilities import Tabular
+from pyjra.utilities import SpilledTabular
 
 from pyjra.logger import LOG
 LOG.define_logging_level('SQL', 17)
 LOG.set_level(min(LOG.level, 17))
 
 import pandas as pd
+import numpy as np
 import keyring as kr
 import pyodbc
 from time import sleep
+from time import monotonic
+from threading import Condition
+from threading import Lock
+from threading import Semaphore
+from threading import local as thread_local
+from threading import Thread
+from random import random
+from math import ceil
+from math import isnan
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+from uuid import UUID
+from decimal import Decimal
+from numbers import Integral
+from datetime import datetime, date, time, timezone
+from csv import writer as csv_writer
+from tempfile import gettempdir
+import os
+import json
+from collections import deque
+from collections import OrderedDict
+from sys import getsizeof
+import re as regex
+from array import array
+from typing import Callable
+from typing import Iterator
+from typing import Iterable
+from typing import AsyncIterator
+from functools import partial
+from contextlib import contextmanager
+from contextlib import nullcontext
+import asyncio
+from itertools import chain
+from itertools import islice
 
-class SQLHandler:
+class ConnectionPool:
     """
-    ## SQLHandler
-        
-    Version: 3.1
+    ## ConnectionPool
+
+    Version: 1.0
     Authors: JRA
-    Date: 2024-02-23
+    Date: 2026-10-17
 
     #### Explanation:
-    Operates on SQL Server databases.
+    Thread-safe pool of reusable database connections. Connections are created lazily up to the size of the pool, checked for health when borrowed after being idle and closed once they have been idle for too long.
 
     #### Artefacts:
-    - __connection_string (str): Connection string.
-    - __params (dict): Connection parameters.
-    - connected (bool): If true, indicates a successful active connection.
-    - conn (pyodbc.Connection): Connection object.
-    - cursor (pyodbc.Cursor)
-    - __init__ (func): Initialises the handler.
-    - __str__ (func): Returns the server and database of the handler.
-    - __bool__ (func): Returns True when the handler is successfully connected.
-    - __schema_table_to_object_name (func): Standardises a given schema and object to a bracket wrapped, stop separated string.
-    - connect_to_mssql (func): Establishes a connection to the SQL Server.
-    - rollback (func): Rolls back the current transaction.
-    - commit (func): Commits the current transaction.
-    - close_connection (func): Closes the open connection.
-    - execute_query (func): Executes a SQL query and returns output - if any - as a pyjra.utilities.Tabular.
-    - insert (func): Inserts data into a specified table.
-    - create_table (func): Creates a table in the database.
+    - size (int): The maximum number of connections the pool will hold open.
+    - idle_timeout (float): Idle connections older than this number of seconds are closed.
+    - ping_after (float): Borrowed connections that have been idle for at least this number of seconds are health checked.
+    - checkout_timeout (float): The number of seconds to wait for a connection when the pool is exhausted.
+    - __factory (Callable): Opens a new connection.
+    - __idle (collections.deque): The idle connections with the time they were returned.
+    - __open (int): The number of connections currently open, both idle and borrowed.
+    - __closed (bool): If true, the pool no longer hands out connections.
+    - __condition (threading.Condition): Synchronises access to the pool.
+    - __init__ (func): Initialises the pool.
+    - __len__ (func): Returns the number of open connections.
+    - __healthy (func): Checks that a connection is still usable.
+    - __discard (func): Closes a connection and releases its slot in the pool.
+    - evict_idle (func): Closes connections that have been idle for longer than the idle timeout.
+    - get (func): Borrows a connection from the pool.
+    - put (func): Returns a borrowed connection to the pool.
+    - close (func): Closes all idle connections and stops the pool handing out connections.
 
     #### Usage:
-    >>> executor = SQLHandler(environment = 'dev')
-    >>> executor.execute_query("SELECT 'value' AS [column]").to_dict(0)
-    {'column': 'value'}
-
-    #### Tasklist:
-    - Add a execute query method that returns a dictionary representing the first row. Would be useful for a list of values or parameters, such as the weekly summary for func-personal.
+    >>> pool = ConnectionPool(lambda: pyodbc.connect(connection_string), size = 4)
+    >>> conn = pool.get()
+    >>> pool.put(conn)
 
     #### History:
-    - 3.1 JRA (2024-02-23): Tabular implementation bug fixes.
-    - 3.0 JRA (2024-02-19): Implemented Tabular and removed select_to_dataframe and query_columns.
-    - 2.0 JRA (2024-02-12): Revamped error handling.
-    - 1.1 JRA (2024-02-09): Added retry_wait.
-    - 1.0 JRA (2024-02-09): Initial version.
+    - 1.0 JRA (2026-10-17): Initial version.
     """
     def __init__(
         self,
-        connection_string: str = None,
-        environment: str = None,
-        driver: str = None,
-        server: str = None,
-        port: int = None,
-        database: str = None,
-        uid: str = None,
-        pwd: str = None,
-        encrypt: str = 'yes',
-        trust_server_certificate: str = 'no',
-        connection_timeout: int = 30,
-        retry_wait: int = None
+        factory: Callable[[], pyodbc.Connection],
+        size: int = 5,
+        idle_timeout: float = 300,
+        ping_after: float = 30,
+        checkout_timeout: float = None
     ):
         """
         ### __init__
 
-        Version: 1.1
+        Version: 1.0
         Authors: JRA
-        Date: 2024-02-09
+        Date: 2026-10-17
 
         #### Explanation:
-        Initialises the handler.
+        Initialises the pool. No connections are opened until they are first borrowed.
 
         #### Parameters:
-        - connection_string (str): The connection string to use. Defaults to environment or other parameters if not supplied.
-        - environment (str): The environment to get keyring keys from. Defaults to other parameters if not supplied.
-        - driver (str): The ODBC driver to use. No default driver.
-        - server (str): The server to connect to.
-        - port (int): The port to connect via.
-        - database (str): The database to connect to.
-        - uid (str): The user identifier.
-        - pwd (str): The user password.
-        - encrypt (str): If 'yes', encryption is used.
-        - connection_timeout (int): Timeout limit to use during connections.
-        - retry_wait (int): If populated, connections to the database are retried once on failure after this number of seconds. Defaults to no retry.
+        - factory (Callable): Function with no arguments that opens a new connection.
+        - size (int): The maximum number of open connections. Defaults to 5.
+        - idle_timeout (float): Idle connections older than this number of seconds are closed. Defaults to 300.
+        - ping_after (float): Connections idle for at least this number of seconds are health checked before being handed out. Defaults to 30.
+        - checkout_timeout (float): The number of seconds to wait for a free connection before raising a TimeoutError. Defaults to waiting indefinitely.
 
         #### Usage:
-        >>> executor = SQLHandler(environment = 'dev')
+        >>> pool = ConnectionPool(lambda: pyodbc.connect(connection_string), size = 4)
 
         #### History:
-        - 1.1 JRA (2024-02-09): Added retry_wait.
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if connection_string is None and environment is None and (server is None or database is None):
-            error = "Not enough information given to start SQLHandler."
-            LOG.critical(error)
+        if size < 1:
+            error = "The size of a ConnectionPool must be at least 1."
+            LOG.error(error)
             raise ValueError(error)
-        self.__connection_string = connection_string
-        self.__params = {
-            'driver': driver,
-            'server': server,
-            'port': port,
-            'database': database,
-            'uid': uid,
-            'pwd': pwd,
-            'encrypt': encrypt,
-            'trustservercertificate': trust_server_certificate,
-            'connectiontimeout': connection_timeout
-        }
-        self.connected = False
-        self.conn = None
-        self.description = ()
-        self.retry_wait = retry_wait
-        if self.__connection_string is not None:
-            LOG.sql("Reading parameters from connection string.")
-            for param in [param for param, value in self.__params.items() if value is None]:
-                self.__params[param] = extract_param(self.__connection_string, param+'=', ';')
-        elif environment is not None:
-            LOG.sql("Getting parameters from keyring.")
-            for param in [param for param, value in self.__params.items() if value is None]:
-                value = kr.get_password(environment, param)
-                if value is None:
-                    LOG.warning(f'No value found for {param} in {environment} environment.')
-                else:
-                    self.__params[param] = value
-
-        if self.__connection_string is None:
-            self.__connection_string = ""
-            for param, value in [(param, value) for param, value in self.__params.items() if value is not None]:
-                self.__connection_string += f"{param}={value};"
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.ping_after = ping_after
+        self.checkout_timeout = checkout_timeout
+        self.__factory = factory
+        self.__idle = deque()
+        self.__open = 0
+        self.__closed = False
+        self.__condition = Condition()
         return
-    
-    def __str__(self) -> str:
+
+    def __len__(self) -> int:
         """
-        ### __str__
+        ### __len__
 
         Version: 1.0
         Authors: JRA
-        Date: 2024-02-09
+        Date: 2026-10-17
 
         #### Explanation:
-        Returns the server and database of the handler.
+        Returns the number of open connections, both idle and borrowed.
 
         #### Returns:
-        - (str)
+        - (int)
 
         #### Usage:
-        >>> print(executor)
-        "[server].[database]"
+        >>> len(pool)
+        2
 
         #### History:
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        # To return detailed information, could set this to return the following format:
-        # [SQL(server='server', database='database', etc...)]
-        return f'[{self.__params["server"]}].[{self.__params["database"]}]'
-    
-    def __bool__(self) -> bool:
+        return self.__open
+
+    def __healthy(self, conn: pyodbc.Connection) -> bool:
         """
-        ### __bool__
+        ### __healthy
 
         Version: 1.0
         Authors: JRA
-        Date: 2024-02-09
+        Date: 2026-10-17
 
         #### Explanation:
-        Returns True when the handler is successfully connected.
+        Checks that a connection is still usable by running a trivial query on it.
+
+        #### Parameters:
+        - conn (pyodbc.Connection): The connection to check.
 
         #### Returns:
-        - self.connected (bool)
+        - (bool): True if the connection responded.
 
         #### Usage:
-        >>> bool(executor)
+        >>> pool.__healthy(conn)
+        True
 
         #### History:
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        return self.connected
-    
-    def __schema_table_to_object_name(self, schema: str, table: str) -> str:
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+        except pyodbc.Error as e:
+            LOG.warning(f"Pooled connection failed health check. {e}")
+            return False
+        return True
+
+    def __discard(self, conn: pyodbc.Connection):
         """
-        ### __schema_table_to_object_name
-        
-        Version: 1.1
+        ### __discard
+
+        Version: 1.0
         Authors: JRA
-        Date: 2024-02-13
+        Date: 2026-10-17
 
         #### Explanation:
-        Standardises a given schema and object to a bracket wrapped, stop separated string.
+        Closes a connection and releases its slot in the pool. Must be called whilst holding the pool condition.
 
         #### Parameters:
-        - schema (str)
-        - table (str)
+        - conn (pyodbc.Connection): The connection to close.
+
+        #### Usage:
+        >>> pool.__discard(conn)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        try:
+            conn.close()
+        except pyodbc.Error as e:
+            LOG.warning(f"Failed to close pooled connection cleanly. {e}")
+        self.__open -= 1
+        self.__condition.notify()
+        return
+
+    def evict_idle(self) -> int:
+        """
+        ### evict_idle
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes connections that have been idle for longer than the idle timeout.
 
         #### Returns:
-        - (str)
+        - evicted (int): The number of connections closed.
 
         #### Usage:
-        >>> executor.__schema_table_to_object_name('schema', 'table')
-        '[schema].[table]'
+        >>> pool.evict_idle()
+        1
 
         #### History:
-        - 1.1 JRA (2024-02-13): Added support for inputs that are already wrapped.
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if schema is None or schema == '':
-            schema = ''
-        elif not (schema.startswith('[') and schema.endswith(']')):
-            schema = '[' + schema + '].'
-        if not (table.startswith('[') and table.endswith(']')):
-            table = '[' + table + ']'
-        return f"{schema}{table}"
-    
-    def connect_to_mssql(self, auto_commit: bool = False, retry_wait: int = None) -> pyodbc.Cursor|None:
+        evicted = 0
+        with self.__condition:
+            cutoff = monotonic() - self.idle_timeout
+            while len(self.__idle) > 0 and self.__idle[0][1] < cutoff:
+                conn, _ = self.__idle.popleft()
+                self.__discard(conn)
+                evicted += 1
+        if evicted > 0:
+            LOG.sql(f"Evicted {evicted} idle pooled connection{'s' if evicted > 1 else ''}.")
+        return evicted
+
+    def get(self) -> pyodbc.Connection:
         """
-        ### connect_to_mssql
+        ### get
 
-        Version: 2.0
+        Version: 1.0
         Authors: JRA
-        Date: 2024-02-12
+        Date: 2026-10-17
 
         #### Explanation:
-        Establishes a connection to the SQL Server.
+        Borrows a connection from the pool. The most recently returned idle connection is preferred, a new connection is opened if there is spare capacity, otherwise this blocks until a connection is returned.
 
-        #### Parameters:
-        - auto_commit (bool): If true, transactions are committed by default. Default is false.
-        - retry_wait (int): If populated, connections to the database are retried once on failure after this number of seconds. Defaults to no retry.
+        #### Requirements:
+        - ConnectionPool.evict_idle (func)
+        - ConnectionPool.__healthy (func)
 
         #### Returns:
-        - self.cursor (pyodbc.Cursor)
+        - conn (pyodbc.Connection)
 
         #### Usage:
-        >>> executor.connect_to_mssql()
-        <executor.cursor>
+        >>> conn = pool.get()
 
         #### History:
-        - 2.0 JRA (2024-02-12): Revamped error handling.
-        - 1.1 JRA (2024-02-09): Added retry_wait.
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if self.connected:
-            LOG.error(f"Connection to {str(self)} already open.")
-            return
-        LOG.sql(f'Attempting to connect to {self}...')
-        retry = True
+        self.evict_idle()
+        deadline = None if self.checkout_timeout is None else monotonic() + self.checkout_timeout
         while True:
-            try:
-                self.conn = pyodbc.connect(self.__connection_string, autocommit = auto_commit)
-            except pyodbc.OperationalError as e:
-                LOG.error(f"A database operational error occurred while connecting to {self}. {e}")
-                retry_wait = retry_wait or self.retry_wait
-                if retry and retry_wait is not None:
-                    retry = False
-                    LOG.sql(f"Waiting {retry_wait} seconds before retrying connection.")
-                    sleep(retry_wait)
-                else:
+            with self.__condition:
+                while True:
+                    if self.__closed:
+                        error = "Cannot borrow from a closed ConnectionPool."
+                        LOG.error(error)
+                        raise RuntimeError(error)
+                    if len(self.__idle) > 0:
+                        conn, returned = self.__idle.pop()
+                        break
+                    if self.__open < self.size:
+                        conn, returned = None, None
+                        self.__open += 1
+                        break
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        error = f"Timed out waiting for a pooled connection after {self.checkout_timeout} seconds."
+                        LOG.error(error)
+                        raise TimeoutError(error)
+                    self.__condition.wait(remaining)
+
+            if conn is None:
+                try:
+                    conn = self.__factory()
+                except Exception:
+                    with self.__condition:
+                        self.__open -= 1
+                        self.__condition.notify()
                     raise
-            except pyodbc.InterfaceError as e:
-                LOG.error(f"A database interface error occurred while connecting to {self}. {e}")
-                raise
-            except Exception as e:
-                LOG.critical(f"Unexpected {type(e)} error occurred whilst connecting to {self}. {e}")
-                raise
-            else:
-                self.cursor = self.conn.cursor()
-                self.connected = True
-                LOG.sql(f"Successfully connected to {self}.")
-                break
-        return self.cursor
-    
-    def rollback(self):
+                LOG.sql(f"Opened pooled connection {self.__open} of {self.size}.")
+                return conn
+            if monotonic() - returned < self.ping_after or self.__healthy(conn):
+                return conn
+            with self.__condition:
+                self.__discard(conn)
+
+    def put(self, conn: pyodbc.Connection, discard: bool = False):
         """
-        ### rollback
+        ### put
 
-        Version: 1.0
+        Version: 1.1
         Authors: JRA
-        Date: 2024-02-09
+        Date: 2026-10-17
 
         #### Explanation:
-        Rolls back transactions.
+        Returns a borrowed connection to the pool. The caller is responsible for ending any open transaction first.
+
+        #### Requirements:
+        - ConnectionPool.__discard (func)
+
+        #### Parameters:
+        - conn (pyodbc.Connection): The connection to return.
+        - discard (bool): If true, the connection is closed instead of being kept for reuse. Defaults to false.
 
         #### Usage:
-        >>> executor.rollback()
+        >>> pool.put(conn)
 
         #### History:
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if not self.connected:
-            LOG.warning("No open connection to roll back.")
-            return
-        LOG.sql(f"Rolling back transaction to {str(self)}.")
-        self.conn.rollback()
+        with self.__condition:
+            if discard or self.__closed:
+                self.__discard(conn)
+            else:
+                self.__idle.append((conn, monotonic()))
+                self.__condition.notify()
         return
-    
-    def commit(self):
+
+    def close(self):
         """
-        ### commit
+        ### close
 
         Version: 1.0
         Authors: JRA
-        Date: 2024-02-09
+        Date: 2026-10-17
 
         #### Explanation:
-        Commits transactions.
+        Closes all idle connections and stops the pool handing out connections. Borrowed connections are closed as they are returned.
+
+        #### Requirements:
+        - ConnectionPool.__discard (func)
 
         #### Usage:
-        >>> executor.commit()
+        >>> pool.close()
 
         #### History:
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if not self.connected:
-            LOG.warning("No open connection to commit.")
-            return
-        LOG.sql(f"Committing transaction to {str(self)}.")
-        self.conn.commit()
+        with self.__condition:
+            self.__closed = True
+            while len(self.__idle) > 0:
+                conn, _ = self.__idle.pop()
+                self.__discard(conn)
+            self.__condition.notify_all()
+        LOG.sql("Closed connection pool.")
         return
 
-    def close_connection(self, commit: bool = True):
+class PartitionError(RuntimeError):
+    """
+    ## PartitionError
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Raised when one or more partitions of a parallel operation fail. The failures are gathered so that every partition is reported, not just the first.
+
+    #### Artefacts:
+    - failures (dict[int, Exception]): The error raised by each failed partition, keyed by partition number.
+    - rows (int): The number of rows that were committed despite the failures.
+    - __init__ (func): Initialises the error.
+
+    #### Usage:
+    >>> try:
+            executor.insert('schema', 'table', data, parallel = 4, atomic = False)
+        except PartitionError as e:
+            e.failures
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(self, message: str, failures: dict[int, Exception], rows: int = 0):
         """
-        ### close_connection
+        ### __init__
 
         Version: 1.0
         Authors: JRA
-        Date: 2024-02-09
+        Date: 2026-10-17
 
         #### Explanation:
-        Closes the open connection.
-
-        #### Requirements:
-        - SQLHandler.commit
-        - SQLHandler.rollback
+        Initialises the error.
 
         #### Parameters:
-        - commit (bool): If true, transaction is committed. Defaults to true.
+        - message (str): The error message.
+        - failures (dict[int, Exception]): The error raised by each failed partition.
+        - rows (int): The number of rows that were committed. Defaults to 0.
 
         #### Usage:
-        >>> executor.close_connection()
+        >>> raise PartitionError("2 of 8 partitions failed.", failures, rows)
 
         #### History:
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if not self.connected:
-            LOG.error("No open connection to close.")
-            return
-        if commit:
-            self.commit()
-        else:
+        super().__init__(message)
+        self.failures = failures
+        self.rows = rows
+        return
+
+class QueryCancelled(RuntimeError):
+    """
+    ## QueryCancelled
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Raised when a query is cancelled through a CancelHandle or exceeds its timeout. It is not a pyodbc error, so retry policies do not retry it.
+
+    #### Artefacts:
+    - timed_out (bool): If true, the query exceeded its timeout, otherwise it was cancelled.
+    - __init__ (func): Initialises the error.
+
+    #### Usage:
+    >>> try:
+            executor.execute_query("SELECT * FROM [dbo].[big]", timeout = 30)
+        except QueryCancelled as e:
+            ...
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(self, message: str, timed_out: bool = False):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the error.
+
+        #### Parameters:
+        - message (str): The error message.
+        - timed_out (bool): If true, the query exceeded its timeout. Defaults to false.
+
+        #### Usage:
+        >>> raise QueryCancelled("Query on [server].[database] timed out after 30 seconds.", timed_out = True)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        super().__init__(message)
+        self.timed_out = timed_out
+        return
+
+class CancelHandle:
+    """
+    ## CancelHandle
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Lets another thread cancel the queries of a call. The handle is bound to the cursor of each query run with it, and cancelling it calls `cursor.cancel()` on that cursor, which stops the query on the server. Once cancelled, a handle stays cancelled, so any later query run with it is cancelled before it starts.
+
+    #### Artefacts:
+    - cancelled (bool): If true, the handle has been cancelled.
+    - __cursor (pyodbc.Cursor|None): The cursor of the most recent query run with the handle.
+    - __lock (threading.Lock): Synchronises binding and cancelling.
+    - __init__ (func): Initialises the handle.
+    - bind (func): Binds the handle to the cursor of a query.
+    - cancel (func): Cancels the bound query.
+
+    #### Usage:
+    >>> handle = CancelHandle()
+    >>> Timer(60, handle.cancel).start()
+    >>> executor.execute_query("EXEC [dbo].[usp_slow]", cancel = handle)
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(self):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the handle.
+
+        #### Usage:
+        >>> handle = CancelHandle()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.cancelled = False
+        self.__cursor = None
+        self.__lock = Lock()
+        return
+
+    def bind(self, cursor: pyodbc.Cursor) -> bool:
+        """
+        ### bind
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Binds the handle to the cursor of a query about to run.
+
+        #### Parameters:
+        - cursor (pyodbc.Cursor): The cursor of the query.
+
+        #### Returns:
+        - (bool): False if the handle has already been cancelled and the query should not run.
+
+        #### Usage:
+        >>> handle.bind(executor.cursor)
+        True
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        with self.__lock:
+            self.__cursor = cursor
+            return not self.cancelled
+
+    def cancel(self) -> bool:
+        """
+        ### cancel
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Cancels the bound query, if any is running, and any later query run with the handle. Safe to call from any thread.
+
+        #### Returns:
+        - (bool): True if a bound cursor was cancelled.
+
+        #### Usage:
+        >>> handle.cancel()
+        True
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        with self.__lock:
+            self.cancelled = True
+            cursor = self.__cursor
+        if cursor is None:
+            return False
+        try:
+            cursor.cancel()
+        except pyodbc.Error as e:
+            LOG.warning(f"Could not cancel query. {e}")
+            return False
+        LOG.sql("Cancelled query.")
+        return True
+
+class QueryCache:
+    """
+    ## QueryCache
+
+    Version: 1.1
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Thread-safe cache of read query results. Entries are keyed by the normalised query text and its values, expire after a time to live, and the least recently used entries are evicted to keep the cache within a size bound in bytes. Entries can be invalidated by the name of any table their query reads from.
+
+    #### Artefacts:
+    - max_bytes (int): The approximate maximum size of all cached results.
+    - ttl (float): The default number of seconds an entry remains valid.
+    - hits (int): The number of lookups answered from the cache.
+    - misses (int): The number of lookups not answered from the cache.
+    - evictions (int): The number of entries evicted to stay within max_bytes.
+    - bytes (int): The approximate size of all cached results.
+    - __entries (collections.OrderedDict): The cached entries, least recently used first.
+    - __lock (threading.Lock): Synchronises access to the cache.
+    - __init__ (func): Initialises the cache.
+    - __len__ (func): Returns the number of cached entries.
+    - normalise (func): Standardises whitespace outside of string literals in a query.
+    - tables (func): Finds the names of the tables referenced by a query.
+    - is_read (func): Checks whether a query only reads data.
+    - __key (func): Builds the key of a query and its values.
+    - __size (func): Estimates the size of a result in bytes.
+    - get (func): Retrieves a cached result.
+    - put (func): Caches a result.
+    - invalidate (func): Removes entries that reference a table, or all entries.
+    - stats (func): Returns the counters of the cache.
+
+    #### Usage:
+    >>> executor = SQLHandler(environment = 'dev', cache = QueryCache(max_bytes = 2**28, ttl = 60))
+    >>> executor.execute_query("SELECT * FROM [dbo].[table]")
+    >>> executor.cache.stats()
+    {'hits': 0, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': 1024}
+
+    #### History:
+    - 1.1 JRA (2026-10-17): put v1.1.
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(self, max_bytes: int = 2**26, ttl: float = 60):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the cache.
+
+        #### Parameters:
+        - max_bytes (int): The approximate maximum size of all cached results. Defaults to 64MiB.
+        - ttl (float): The default number of seconds an entry remains valid. Defaults to 60.
+
+        #### Usage:
+        >>> cache = QueryCache(max_bytes = 2**28, ttl = 60)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+        return
+
+    def __len__(self) -> int:
+        """
+        ### __len__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the number of cached entries.
+
+        #### Returns:
+        - (int)
+
+        #### Usage:
+        >>> len(cache)
+        1
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return len(self.__entries)
+
+    @staticmethod
+    def normalise(query: str) -> str:
+        """
+        ### normalise
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Standardises whitespace outside of string literals in a query and removes any trailing semicolon, so that trivially different formatting of the same query shares a cache entry.
+
+        #### Parameters:
+        - query (str): The query to normalise.
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> QueryCache.normalise("SELECT  *\\n FROM [table];")
+        'SELECT * FROM [table]'
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        parts = regex.split(r"('(?:[^']|'')*')", query)
+        for p in range(0, len(parts), 2):
+            parts[p] = regex.sub(r"\s+", " ", parts[p])
+        return ''.join(parts).strip().rstrip(';').strip()
+
+    @staticmethod
+    def tables(query: str) -> set[str]:
+        """
+        ### tables
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Finds the names of the tables referenced by a query, without schema or brackets and in lower case.
+
+        #### Parameters:
+        - query (str): The query to search.
+
+        #### Returns:
+        - (set[str])
+
+        #### Usage:
+        >>> QueryCache.tables("SELECT * FROM [dbo].[table] JOIN [other] ON 1 = 1")
+        {'table', 'other'}
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        names = regex.findall(
+            r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE|MERGE|INSERT)\s+((?:\[[^\]]+\]|[\w#@$]+)(?:\s*\.\s*(?:\[[^\]]+\]|[\w#@$]+))*)",
+            regex.sub(r"'(?:[^']|'')*'", "''", query),
+            flags = regex.IGNORECASE
+        )
+        return {regex.split(r"\s*\.\s*", name)[-1].strip('[]').lower() for name in names}
+
+    @staticmethod
+    def is_read(query: str) -> bool:
+        """
+        ### is_read
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Checks whether a query only reads data, so that its result may be cached.
+
+        #### Parameters:
+        - query (str): The query to check.
+
+        #### Returns:
+        - (bool)
+
+        #### Usage:
+        >>> QueryCache.is_read("SELECT * FROM [table]")
+        True
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        query = regex.sub(r"'(?:[^']|'')*'", "''", query).strip()
+        if not regex.match(r"(SELECT|WITH)\b", query, flags = regex.IGNORECASE):
+            return False
+        return regex.search(r"\b(INSERT|UPDATE|DELETE|MERGE|INTO|EXEC|EXECUTE|CREATE|ALTER|DROP|TRUNCATE|NEWID|RAND|GETDATE|SYSDATETIME)\b", query, flags = regex.IGNORECASE) is None
+
+    def __key(self, query: str, values: tuple = None) -> tuple:
+        """
+        ### __key
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Builds the key of a query and its values.
+
+        #### Parameters:
+        - query (str): The query.
+        - values (tuple): The values substituted into the query. Defaults to None.
+
+        #### Returns:
+        - (tuple)
+
+        #### Usage:
+        >>> cache.__key("SELECT ?", (1,))
+        ('SELECT ?', (1,))
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if values is not None and not isinstance(values, (tuple, list)):
+            values = (values,)
+        return (self.normalise(query), None if values is None else tuple(values))
+
+    @staticmethod
+    def __size(data: list[tuple]) -> int:
+        """
+        ### __size
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Estimates the size of a result in bytes from the sizes of its rows and values.
+
+        #### Parameters:
+        - data (list[tuple]): The rows of the result.
+
+        #### Returns:
+        - (int)
+
+        #### Usage:
+        >>> QueryCache.__size([(1, 'a')])
+        176
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return getsizeof(data) + sum(getsizeof(row) + sum(getsizeof(value) for value in row) for row in data)
+
+    def get(self, query: str, values: tuple = None, name: str = None) -> Tabular|None:
+        """
+        ### get
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Retrieves a cached result as a new Tabular, without validation. Expired entries are removed.
+
+        #### Requirements:
+        - QueryCache.__key (func)
+        - Tabular.tabular_from_tabular (func)
+
+        #### Parameters:
+        - query (str): The query.
+        - values (tuple): The values substituted into the query. Defaults to None.
+        - name (str): The name to assign to the result. Defaults to None.
+
+        #### Returns:
+        - (Tabular|None): None if there is no valid entry.
+
+        #### Usage:
+        >>> cache.get("SELECT * FROM [table]")
+        <Tabular>
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        key = self.__key(query, values)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry['expires'] < monotonic():
+                del self.__entries[key]
+                self.bytes -= entry['bytes']
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+        return Tabular.tabular_from_tabular(
+            data = list(entry['data']),
+            columns = list(entry['columns']),
+            datatypes = list(entry['datatypes']),
+            row_count = len(entry['data']),
+            col_count = len(entry['columns']),
+            row_based = True,
+            name = name
+        )
+
+    def put(self, query: str, values: tuple, result: Tabular, ttl: float = None):
+        """
+        ### put
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Caches a result, evicting the least recently used entries until it fits. Results larger than the whole cache are not stored. The result itself is not modified.
+
+        #### Requirements:
+        - QueryCache.__key (func)
+        - QueryCache.__size (func)
+        - QueryCache.tables (func)
+
+        #### Parameters:
+        - query (str): The query.
+        - values (tuple): The values substituted into the query.
+        - result (Tabular): The result of the query.
+        - ttl (float): The number of seconds the entry remains valid. Defaults to the cache default.
+
+        #### Usage:
+        >>> cache.put("SELECT * FROM [table]", None, result)
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Supports column-based results without transposing them.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        entry = {
+            'data': tuple(result.data) if result.row_based else tuple(zip(*result.data)),
+            'columns': tuple(result.columns),
+            'datatypes': tuple(result.datatypes),
+            'tables': self.tables(query),
+            'expires': monotonic() + (self.ttl if ttl is None else ttl)
+        }
+        entry['bytes'] = self.__size(entry['data'])
+        if entry['bytes'] > self.max_bytes:
+            LOG.sql(f"Result of {entry['bytes']} bytes is too large to cache.")
+            return
+        key = self.__key(query, values)
+        with self.__lock:
+            previous = self.__entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous['bytes']
+            while self.bytes + entry['bytes'] > self.max_bytes and len(self.__entries) > 0:
+                _, evicted = self.__entries.popitem(last = False)
+                self.bytes -= evicted['bytes']
+                self.evictions += 1
+            self.__entries[key] = entry
+            self.bytes += entry['bytes']
+        return
+
+    def invalidate(self, table: str = None) -> int:
+        """
+        ### invalidate
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Removes entries whose query references a table, or all entries if no table is given. The schema of the table is ignored, so entries may be removed unnecessarily but never kept wrongly.
+
+        #### Parameters:
+        - table (str): The name of the table, optionally with schema and brackets. Defaults to all entries.
+
+        #### Returns:
+        - removed (int): The number of entries removed.
+
+        #### Usage:
+        >>> cache.invalidate('[dbo].[table]')
+        1
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        with self.__lock:
+            if table is None:
+                keys = list(self.__entries.keys())
+            else:
+                table = regex.split(r"\s*\.\s*", table)[-1].strip('[]').lower()
+                keys = [key for key, entry in self.__entries.items() if table in entry['tables']]
+            for key in keys:
+                self.bytes -= self.__entries.pop(key)['bytes']
+        if len(keys) > 0:
+            LOG.sql(f"Invalidated {len(keys)} cached result{'s' if len(keys) > 1 else ''}{'' if table is None else ' of ' + table}.")
+        return len(keys)
+
+    def stats(self) -> dict:
+        """
+        ### stats
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the counters of the cache.
+
+        #### Returns:
+        - (dict): The hits, misses, evictions, number of entries and approximate size in bytes.
+
+        #### Usage:
+        >>> cache.stats()
+        {'hits': 10, 'misses': 2, 'evictions': 0, 'entries': 2, 'bytes': 2048}
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.__entries),
+                'bytes': self.bytes
+            }
+
+class RetryPolicy:
+    """
+    ## RetryPolicy
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Retries operations that fail with transient errors, such as a paused serverless database waking up, login timeouts, deadlocks and throttling. Delays grow exponentially between attempts up to a maximum, are jittered so that concurrent clients do not retry in step, and stop once a total deadline would be exceeded. Errors are classified as transient by their SQLSTATE or by the native error number in their message, and operational errors are always treated as transient.
+
+    #### Artefacts:
+    - TRANSIENT_STATES (tuple[str]): SQLSTATEs of transient errors.
+    - TRANSIENT_CODES (tuple[int]): Native SQL Server and Azure SQL error numbers of transient errors.
+    - attempts (int): The maximum number of attempts, including the first.
+    - base_delay (float): The number of seconds to wait before the first retry.
+    - max_delay (float): The maximum number of seconds to wait between attempts.
+    - multiplier (float): The factor the delay grows by after each attempt.
+    - jitter (float): The fraction of each delay that is randomised, between 0 and 1.
+    - deadline (float): The maximum number of seconds to spend on all attempts, or None for no limit.
+    - codes (set[int]): The native error numbers treated as transient.
+    - __init__ (func): Initialises the policy.
+    - is_transient (func): Checks whether an error is worth retrying.
+    - delay (func): Returns the delay before a retry.
+    - run (func): Runs an operation, retrying it on transient errors.
+
+    #### Usage:
+    >>> executor = SQLHandler(environment = 'dev', retry_policy = RetryPolicy(attempts = 8, deadline = 180))
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    TRANSIENT_STATES = ('08001', '08S01', 'HYT00', 'HYT01', '40001')
+    TRANSIENT_CODES = (
+        233, 1205, 4060, 4221, 10053, 10054, 10060, 10928, 10929, 40143, 40197, 40501, 40540, 40613, 49918, 49919, 49920
+    )
+
+    def __init__(
+        self,
+        attempts: int = 6,
+        base_delay: float = 1,
+        max_delay: float = 30,
+        multiplier: float = 2,
+        jitter: float = 0.5,
+        deadline: float = 120,
+        codes: Iterable[int] = None
+    ):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the policy.
+
+        #### Parameters:
+        - attempts (int): The maximum number of attempts, including the first. Defaults to 6.
+        - base_delay (float): The number of seconds to wait before the first retry. Defaults to 1.
+        - max_delay (float): The maximum number of seconds to wait between attempts. Defaults to 30.
+        - multiplier (float): The factor the delay grows by after each attempt. Defaults to 2.
+        - jitter (float): The fraction of each delay that is randomised, between 0 and 1. Defaults to 0.5.
+        - deadline (float): The maximum number of seconds to spend on all attempts, or None for no limit. Defaults to 120.
+        - codes (Iterable[int]): The native error numbers treated as transient. Defaults to TRANSIENT_CODES.
+
+        #### Usage:
+        >>> policy = RetryPolicy(attempts = 8, deadline = 180)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if attempts < 1:
+            error = "A RetryPolicy must make at least 1 attempt."
+            LOG.error(error)
+            raise ValueError(error)
+        if not 0 <= jitter <= 1:
+            error = "The jitter of a RetryPolicy must be between 0 and 1."
+            LOG.error(error)
+            raise ValueError(error)
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.codes = set(self.TRANSIENT_CODES if codes is None else codes)
+        return
+
+    def is_transient(self, error: BaseException) -> bool:
+        """
+        ### is_transient
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Checks whether an error is worth retrying. Operational errors, errors with a transient SQLSTATE and errors whose message contains a transient native error number in brackets are transient.
+
+        #### Parameters:
+        - error (BaseException): The error to classify.
+
+        #### Returns:
+        - (bool)
+
+        #### Usage:
+        >>> policy.is_transient(pyodbc.ProgrammingError('42000', "[42000] Database 'db' on server 'server' is not currently available. (40613)"))
+        True
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if not isinstance(error, pyodbc.Error):
+            return False
+        if isinstance(error, pyodbc.OperationalError):
+            return True
+        if len(error.args) > 0 and str(error.args[0]) in self.TRANSIENT_STATES:
+            return True
+        message = ' '.join(str(arg) for arg in error.args)
+        return any(int(code) in self.codes for code in regex.findall(r"\((\d+)\)", message))
+
+    def delay(self, attempt: int) -> float:
+        """
+        ### delay
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the number of seconds to wait after a failed attempt, growing exponentially with the attempt number up to max_delay, less a random share of up to jitter of it.
+
+        #### Parameters:
+        - attempt (int): The number of the attempt that failed, starting at 1.
+
+        #### Returns:
+        - (float)
+
+        #### Usage:
+        >>> RetryPolicy(jitter = 0).delay(3)
+        4
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        delay = min(self.max_delay, self.base_delay*self.multiplier**(attempt - 1))
+        return delay*(1 - self.jitter*random())
+
+    def run(self, action: Callable, description: str = 'operation'):
+        """
+        ### run
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Runs an operation, retrying it after a delay whenever it fails with a transient error, until it succeeds, the attempts are used up or the next attempt would start after the deadline. The last error is raised if every attempt fails.
+
+        #### Requirements:
+        - RetryPolicy.is_transient
+        - RetryPolicy.delay
+
+        #### Parameters:
+        - action (Callable): The operation, called with no arguments.
+        - description (str): Describes the operation in log messages. Defaults to 'operation'.
+
+        #### Returns:
+        - The result of the operation.
+
+        #### Usage:
+        >>> policy.run(lambda: pyodbc.connect(connection_string), 'connecting to [server].[database]')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        start = monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return action()
+            except Exception as e:
+                if attempt >= self.attempts or not self.is_transient(e):
+                    raise
+                wait = self.delay(attempt)
+                if self.deadline is not None and monotonic() - start + wait > self.deadline:
+                    LOG.error(f"Gave up {description} after {attempt} attempts, the next would exceed the deadline of {self.deadline} seconds.")
+                    raise
+                LOG.warning(f"Attempt {attempt} of {self.attempts} {description} failed with a transient error, retrying in {wait:.1f} seconds. {e}")
+                sleep(wait)
+
+class QueryMetrics:
+    """
+    ## QueryMetrics
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Thread-safe recorder of the latency and volume of SQLHandler calls. Each call records its connect, execute and fetch times, the number of rows returned or inserted and their approximate size in bytes, tagged with the operation and the name given to the call. The most recent samples of each operation and name are kept to summarise as percentiles. Records can also be pushed to a hook, such as a logger or metrics sink, as they are made.
+
+    #### Artefacts:
+    - max_samples (int): The maximum number of samples kept per operation and name.
+    - hook (Callable[[dict], None]|None): Called with each record.
+    - __samples (dict): The recent samples and running totals of each operation and name.
+    - __lock (threading.Lock): Synchronises access to the samples.
+    - __init__ (func): Initialises the recorder.
+    - estimate_bytes (func): Estimates the size of rows in bytes from a sample of them.
+    - record (func): Records a call.
+    - stats (func): Summarises the recorded calls as percentiles.
+    - reset (func): Forgets all recorded calls.
+    - log_record (func): Hook that writes a record to the log.
+
+    #### Usage:
+    >>> executor = SQLHandler(environment = 'dev', metrics = QueryMetrics(hook = QueryMetrics.log_record))
+    >>> executor.execute_query("SELECT * FROM [dbo].[table]", name = 'table')
+    >>> executor.stats()['execute_query:table']['total']
+    {'p50': 0.012, 'p95': 0.012, 'p99': 0.012}
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    PHASES = ('connect', 'execute', 'fetch', 'total')
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, max_samples: int = 10000, hook: Callable[[dict], None] = None):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the recorder.
+
+        #### Parameters:
+        - max_samples (int): The maximum number of samples kept per operation and name. Defaults to 10000.
+        - hook (Callable[[dict], None]): Called with each record as it is made. Errors raised by the hook are logged and ignored. Defaults to None.
+
+        #### Usage:
+        >>> metrics = QueryMetrics(hook = QueryMetrics.log_record)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if max_samples < 1:
+            error = "QueryMetrics must keep at least 1 sample."
+            LOG.error(error)
+            raise ValueError(error)
+        self.max_samples = max_samples
+        self.hook = hook
+        self.__samples = {}
+        self.__lock = Lock()
+        return
+
+    @staticmethod
+    def estimate_bytes(data: Tabular|list[tuple], sample: int = 100) -> int:
+        """
+        ### estimate_bytes
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Estimates the size of rows in bytes from the sizes of the values of up to `sample` rows, scaled up to all rows, so the cost does not grow with the data.
+
+        #### Parameters:
+        - data (Tabular|list[tuple]): The rows to measure.
+        - sample (int): The maximum number of rows to measure. Defaults to 100.
+
+        #### Returns:
+        - (int)
+
+        #### Usage:
+        >>> QueryMetrics.estimate_bytes([(1, 'a')]*1000)
+        78000
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if data is None:
+            return 0
+        if isinstance(data, Tabular):
+            count = data.row_count
+            if count == 0:
+                return 0
+            step = max(1, count//sample)
+            rows = [data.data[index] for index in range(0, count, step)][:sample] if data.row_based else list(zip(*(column[::step][:sample] for column in data.data)))
+        else:
+            count = len(data)
+            if count == 0:
+                return 0
+            step = max(1, count//sample)
+            rows = data[::step][:sample]
+        if len(rows) == 0:
+            return 0
+        return count*sum(sum(getsizeof(value) for value in row) for row in rows)//len(rows)
+
+    def record(
+        self,
+        operation: str,
+        name: str = None,
+        connect: float = 0,
+        execute: float = 0,
+        fetch: float = 0,
+        rows: int = 0,
+        bytes: int = 0,
+        cached: bool = False
+    ) -> dict:
+        """
+        ### record
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Records a call and passes the record to the hook, if any.
+
+        #### Parameters:
+        - operation (str): The SQLHandler method that made the call.
+        - name (str): The name given to the call. Defaults to None.
+        - connect (float): The number of seconds spent connecting. Defaults to 0.
+        - execute (float): The number of seconds spent executing. Defaults to 0.
+        - fetch (float): The number of seconds spent fetching results. Defaults to 0.
+        - rows (int): The number of rows returned or inserted. Defaults to 0.
+        - bytes (int): The approximate size of the rows in bytes. Defaults to 0.
+        - cached (bool): If true, the call was answered from the cache. Defaults to false.
+
+        #### Returns:
+        - record (dict)
+
+        #### Usage:
+        >>> metrics.record('execute_query', 'table', connect = 0.01, execute = 0.2, fetch = 0.05, rows = 100, bytes = 6400)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        record = {
+            'operation': operation,
+            'name': name,
+            'connect': connect,
+            'execute': execute,
+            'fetch': fetch,
+            'total': connect + execute + fetch,
+            'rows': rows,
+            'bytes': bytes,
+            'cached': cached
+        }
+        key = operation if name is None else f"{operation}:{name}"
+        with self.__lock:
+            entry = self.__samples.get(key)
+            if entry is None:
+                entry = {'count': 0, 'rows': 0, 'bytes': 0, 'cached': 0, 'samples': deque(maxlen = self.max_samples)}
+                self.__samples[key] = entry
+            entry['count'] += 1
+            entry['rows'] += rows
+            entry['bytes'] += bytes
+            entry['cached'] += int(cached)
+            entry['samples'].append(tuple(record[phase] for phase in self.PHASES))
+        if self.hook is not None:
+            try:
+                self.hook(record)
+            except Exception as e:
+                LOG.warning(f"Metrics hook failed on a record of {key}. {e}")
+        return record
+
+    def stats(self) -> dict[str, dict]:
+        """
+        ### stats
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Summarises the recorded calls of each operation and name. Counts, rows, bytes and cache hits are totals over all calls, and the p50, p95 and p99 of each phase are the nearest rank percentiles of the recent samples.
+
+        #### Returns:
+        - (dict[str, dict]): Keyed by operation, or by operation and name separated by a colon.
+
+        #### Usage:
+        >>> metrics.stats()
+        {'execute_query:table': {'count': 1, 'rows': 100, 'bytes': 6400, 'cached': 0, 'connect': {'p50': 0.01, 'p95': 0.01, 'p99': 0.01}, ...}}
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        with self.__lock:
+            entries = {key: (dict(entry), list(entry['samples'])) for key, entry in self.__samples.items()}
+        stats = {}
+        for key, (entry, samples) in entries.items():
+            stats[key] = {'count': entry['count'], 'rows': entry['rows'], 'bytes': entry['bytes'], 'cached': entry['cached']}
+            for index, phase in enumerate(self.PHASES):
+                values = sorted(sample[index] for sample in samples)
+                stats[key][phase] = {
+                    f"p{percentile}": values[max(0, ceil(percentile*len(values)/100) - 1)]
+                    for percentile in self.PERCENTILES
+                }
+        return stats
+
+    def reset(self):
+        """
+        ### reset
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Forgets all recorded calls.
+
+        #### Usage:
+        >>> metrics.reset()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        with self.__lock:
+            self.__samples.clear()
+        return
+
+    @staticmethod
+    def log_record(record: dict):
+        """
+        ### log_record
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Hook that writes a record to the log at the SQL level.
+
+        #### Parameters:
+        - record (dict): The record made by QueryMetrics.record.
+
+        #### Usage:
+        >>> metrics = QueryMetrics(hook = QueryMetrics.log_record)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        LOG.sql(
+            f"{record['operation']}{'' if record['name'] is None else ' ' + record['name']}: "
+            f"{record['rows']} rows, ~{record['bytes']} bytes in {record['total']:.3f}s "
+            f"(connect {record['connect']:.3f}s, execute {record['execute']:.3f}s, fetch {record['fetch']:.3f}s)"
+            f"{', cached' if record['cached'] else ''}."
+        )
+        return
+
+class WatermarkStore:
+    """
+    ## WatermarkStore
+
+    Version: 1.1
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Persists the watermarks of incremental extractions, being the highest value of a monotonically increasing column, such as a rowversion, modified date or identity, that has been extracted. Watermarks are stored either in a local JSON file, replaced atomically on every write so a crash never leaves it partially written, or in a control table, updated with a single MERGE. Values keep their type, so rowversions, dates and decimals compare correctly when read back.
+
+    #### Artefacts:
+    - file (str|None): The path of the JSON file of watermarks, if stored locally.
+    - handler (SQLHandler|None): The handler of the database of the control table, if stored in the database.
+    - control_table (str): The bracket wrapped name of the control table of watermarks.
+    - __created (bool): If true, the control table is known to exist.
+    - __lock (threading.Lock): Synchronises reads and writes of the file.
+    - __init__ (func): Initialises the store.
+    - encode (func): Serialises a watermark to text, keeping its type.
+    - decode (func): Deserialises a watermark from text.
+    - __read_file (func): Reads all watermarks of the file.
+    - __create_table (func): Creates the control table if it does not exist.
+    - get (func): Retrieves a watermark.
+    - set (func): Stores a watermark.
+
+    #### Usage:
+    >>> store = WatermarkStore(file = 'watermarks.json')
+    >>> store = WatermarkStore(handler = executor, control_table = '[etl].[watermarks]')
+    >>> for batch in executor.extract_incremental('dbo', 'orders', 'modified', store):
+            ...
+
+    #### History:
+    - 1.1 JRA (2026-10-17): __create_table v1.1 and get v1.1.
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(self, file: str = None, handler: 'SQLHandler' = None, control_table: str = '[dbo].[pyjra_watermarks]'):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the store. Watermarks are stored in the file if given, otherwise in the control table of the handler's database.
+
+        #### Parameters:
+        - file (str): The path of the JSON file of watermarks. It is created on the first write. Defaults to None.
+        - handler (SQLHandler): The handler of the database of the control table. Required if file is not given. Defaults to None.
+        - control_table (str): The bracket wrapped name of the control table of watermarks. It is created if it does not exist. Defaults to '[dbo].[pyjra_watermarks]'.
+
+        #### Usage:
+        >>> store = WatermarkStore(file = 'watermarks.json')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if file is None and handler is None:
+            error = "A WatermarkStore needs a file or a handler."
+            LOG.error(error)
+            raise ValueError(error)
+        self.file = file
+        self.handler = handler
+        self.control_table = control_table
+        self.__created = False
+        self.__lock = Lock()
+        return
+
+    @staticmethod
+    def encode(value) -> str:
+        """
+        ### encode
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Serialises a watermark to JSON text tagged with its type. Bytes, such as rowversions, are stored as hexadecimal, and dates, times, decimals and unique identifiers as their string forms.
+
+        #### Parameters:
+        - value: The watermark.
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> WatermarkStore.encode(b'\\x00\\x00\\x00\\x00\\x00\\x00\\x07\\xd1')
+        '{"type": "bytes", "value": "00000000000007d1"}'
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            tagged = {'type': 'bytes', 'value': bytes(value).hex()}
+        elif isinstance(value, datetime):
+            tagged = {'type': 'datetime', 'value': value.isoformat()}
+        elif isinstance(value, date):
+            tagged = {'type': 'date', 'value': value.isoformat()}
+        elif isinstance(value, time):
+            tagged = {'type': 'time', 'value': value.isoformat()}
+        elif isinstance(value, Decimal):
+            tagged = {'type': 'decimal', 'value': str(value)}
+        elif isinstance(value, UUID):
+            tagged = {'type': 'uuid', 'value': str(value)}
+        elif isinstance(value, (bool, int, float, str)):
+            tagged = {'type': type(value).__name__, 'value': value}
+        else:
+            error = f"Watermarks of type {type(value)} cannot be stored."
+            LOG.error(error)
+            raise ValueError(error)
+        return json.dumps(tagged)
+
+    @staticmethod
+    def decode(text: str):
+        """
+        ### decode
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Deserialises a watermark from the JSON text written by WatermarkStore.encode.
+
+        #### Parameters:
+        - text (str): The serialised watermark.
+
+        #### Returns:
+        - The watermark, of its original type.
+
+        #### Usage:
+        >>> WatermarkStore.decode('{"type": "date", "value": "2026-10-17"}')
+        datetime.date(2026, 10, 17)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        tagged = json.loads(text)
+        value = tagged['value']
+        return {
+            'bytes': bytes.fromhex,
+            'datetime': datetime.fromisoformat,
+            'date': date.fromisoformat,
+            'time': time.fromisoformat,
+            'decimal': Decimal,
+            'uuid': UUID
+        }.get(tagged['type'], lambda value: value)(value)
+
+    def __read_file(self) -> dict[str, str]:
+        """
+        ### __read_file
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads all serialised watermarks of the file.
+
+        #### Returns:
+        - (dict[str, str]): The serialised watermarks by key. Empty if the file does not exist.
+
+        #### Usage:
+        >>> self.__read_file()
+        {'[dbo].[orders].[modified]': '{"type": "datetime", "value": "2026-10-17T09:30:00"}'}
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if not os.path.exists(self.file):
+            return {}
+        with open(self.file, 'r', encoding = 'utf-8') as file:
+            return json.load(file)
+
+    def __create_table(self):
+        """
+        ### __create_table
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Creates the control table if it does not exist, once per store.
+
+        #### Requirements:
+        - SQLHandler.execute_query
+
+        #### Usage:
+        >>> self.__create_table()
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Passes the control table name as a one-value tuple.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if self.__created:
+            return
+        self.handler.execute_query(
+            query = f"""IF OBJECT_ID(?) IS NULL
+CREATE TABLE {self.control_table} (
+\t[key] nvarchar(450) NOT NULL PRIMARY KEY,
+\t[watermark] nvarchar(4000) NOT NULL,
+\t[updated] datetime2 NOT NULL DEFAULT SYSUTCDATETIME()
+)""",
+            values = (self.control_table,),
+            commit = True,
+            use_cache = False
+        )
+        self.__created = True
+        return
+
+    def get(self, key: str):
+        """
+        ### get
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Retrieves a watermark.
+
+        #### Requirements:
+        - WatermarkStore.__read_file
+        - WatermarkStore.__create_table
+        - WatermarkStore.decode
+        - SQLHandler.execute_query
+
+        #### Parameters:
+        - key (str): The key of the watermark.
+
+        #### Returns:
+        - The watermark, or None if none has been stored.
+
+        #### Usage:
+        >>> store.get('[dbo].[orders].[modified]')
+        datetime.datetime(2026, 10, 17, 9, 30)
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Passes the key as a one-value tuple.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if self.file is not None:
+            with self.__lock:
+                text = self.__read_file().get(key)
+        else:
+            self.__create_table()
+            result = self.handler.execute_query(
+                query = f"SELECT [watermark] FROM {self.control_table} WHERE [key] = ?",
+                values = (key,),
+                use_cache = False
+            )
+            text = None if result is None or result.row_count == 0 else result.data[0][0]
+        return None if text is None else self.decode(text)
+
+    def set(self, key: str, value):
+        """
+        ### set
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Stores a watermark atomically. The file is rewritten to a temporary file in the same directory that then replaces it, and the control table is updated with a single MERGE.
+
+        #### Requirements:
+        - WatermarkStore.encode
+        - WatermarkStore.__read_file
+        - WatermarkStore.__create_table
+        - SQLHandler.execute_query
+
+        #### Parameters:
+        - key (str): The key of the watermark.
+        - value: The watermark.
+
+        #### Usage:
+        >>> store.set('[dbo].[orders].[modified]', datetime(2026, 10, 17, 9, 30))
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        text = self.encode(value)
+        if self.file is not None:
+            with self.__lock:
+                watermarks = self.__read_file()
+                watermarks[key] = text
+                staged = f"{self.file}.{uuid4().hex[:8]}.tmp"
+                try:
+                    with open(staged, 'w', encoding = 'utf-8') as file:
+                        json.dump(watermarks, file, indent = 4)
+                        file.flush()
+                        os.fsync(file.fileno())
+                    os.replace(staged, self.file)
+                finally:
+                    if os.path.exists(staged):
+                        os.remove(staged)
+        else:
+            self.__create_table()
+            self.handler.execute_query(
+                query = f"""MERGE {self.control_table} WITH (HOLDLOCK) AS [t]
+USING (SELECT ? AS [key], ? AS [watermark]) AS [s]
+ON [t].[key] = [s].[key]
+WHEN MATCHED THEN
+\tUPDATE SET [watermark] = [s].[watermark], [updated] = SYSUTCDATETIME()
+WHEN NOT MATCHED THEN
+\tINSERT ([key], [watermark]) VALUES ([s].[key], [s].[watermark]);""",
+                values = (key, text),
+                commit = True
+            )
+        LOG.sql(f"Stored watermark of {key}: {value}.")
+        return
+
+class SQLHandler:
+    """
+    ## SQLHandler
+        
+    Version: 3.43
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Operates on SQL Server databases.
+
+    #### Artefacts:
+    - __connection_string (str): Connection string.
+    - __params (dict): Connection parameters.
+    - connected (bool): If true, indicates a successful active connection.
+    - conn (pyodbc.Connection): Connection object.
+    - cursor (pyodbc.Cursor)
+    - pool (ConnectionPool|None): The pool connections are borrowed from, if pooling is enabled.
+    - cache (QueryCache|None): The cache of read query results, if caching is enabled.
+    - metrics (QueryMetrics|None): The recorder of call latency and volume, if instrumentation is enabled.
+    - __connect_seconds (float): The total number of seconds spent connecting, read by instrumented calls.
+    - __catalog (dict): The catalog cache of object columns and datatypes and of type limits.
+    - __init__ (func): Initialises the handler.
+    - __str__ (func): Returns the server and database of the handler.
+    - __bool__ (func): Returns True when the handler is successfully connected.
+    - __schema_table_to_object_name (func): Standardises a given schema and object to a bracket wrapped, stop separated string.
+    - __open_connection (func): Opens a new connection to the SQL Server, retrying once if configured.
+    - connect_to_mssql (func): Establishes a connection to the SQL Server.
+    - rollback (func): Rolls back the current transaction.
+    - commit (func): Commits the current transaction.
+    - close_connection (func): Closes the open connection.
+    - close_pool (func): Closes all pooled connections.
+    - release_connection (func): Rolls back and releases the open connection after a failed call.
+    - session (func): Scope in which all calls share one connection and transaction.
+    - __discard_connection (func): Drops the open connection without ending its transaction.
+    - __reset_option (func): Turns a SET option back off on the open connection.
+    - prewarm (func): Wakes the database in the background.
+    - stats (func): Summarises the latency and volume of calls.
+    - query_timeout (int|None): The default number of seconds a query may run for.
+    - spill_bytes (int|None): The estimated size of a query result beyond which it is spilled to disk.
+    - spill_directory (str|None): The directory results are spilled to.
+    - rejected (Tabular|None): The rows rejected by the latest insert with isolate_errors, with their error messages.
+    - __check_interrupted (func): Raises QueryCancelled for errors caused by a timeout or cancellation.
+    - __run (func): Executes a SQL query on the open cursor, logging any failures.
+    - __describe (func): Reads the column names and Python types of the current result set.
+    - __typed_columns (func): Stores integer and float columns without nulls as typed arrays.
+    - __fetch_columnar (func): Reads the current result set straight into a column-based Tabular.
+    - __fetch_spilling (func): Reads the current result set, spilling it to disk once it passes a size.
+    - execute_query (func): Executes a SQL query and returns output - if any - as a pyjra.utilities.Tabular.
+    - __record_query (func): Records the metrics of an executed query.
+    - execute_batch (func): Executes several queries in one round trip and returns every result set.
+    - iter_query (func): Executes a SQL query and yields the output in pyjra.utilities.Tabular batches.
+    - extract_incremental (func): Streams the rows of a table past its stored watermark.
+    - paginate (func): Pages through the results of a query with keyset pagination.
+    - __range_boundaries (func): Splits the range of a partition column evenly.
+    - parallel_select (func): Reads a query over several connections at once, partitioned on a column.
+    - __insert_batches (func): Standardises data to insert into its columns and an iterator of row batches.
+    - __utc_datetimes (func): Converts the timezone aware datetimes of a batch to UTC.
+    - spawn (func): Creates a handler for the same database that shares the connection pool.
+    - __input_sizes (func): Computes parameter size hints for a batch of rows to insert.
+    - __executemany (func): Sends a batch of rows, setting and clearing parameter size hints around it.
+    - __insert_isolating (func): Inserts a batch, bisecting it on failure to isolate the rows that cannot be inserted.
+    - __parallel_insert (func): Inserts batches concurrently over several connections.
+    - insert (func): Inserts data into a specified table.
+    - upsert (func): Inserts or updates data in a table through a staged MERGE.
+    - get_table_schema (func): Retrieves the columns and datatypes of a table from the catalog cache.
+    - table_exists (func): Checks whether a table exists using the catalog cache.
+    - __type_max_length (func): Retrieves the maximum length of a string type from the catalog cache.
+    - refresh_catalog (func): Forgets cached catalog entries.
+    - __forget_tables (func): Forgets the catalog entries of tables referenced by a DDL query.
+    - infer_datatypes (func): Infers tight SQL Server datatypes from the values of each column.
+    - __column_datatype (func): Infers the SQL Server datatype of a single column.
+    - to_tvp (func): Converts data to a table-valued parameter.
+    - __has_table_values (func): Checks whether any value of a query is a table-valued parameter.
+    - __python_datatype (func): Maps a Python type to a SQL Server datatype.
+    - create_table_type (func): Creates a user-defined table type for table-valued parameters.
+    - create_table (func): Creates a table in the database.
+    - write_bulk_file (func): Serialises data to a CSV file readable by BULK INSERT.
+    - __bulk_insert_command (func): Builds the BULK INSERT statement for a staged file.
+    - bulk_insert (func): Inserts data through the bulk load path from a staged file.
+
+    #### Usage:
+    >>> executor = SQLHandler(environment = 'dev')
+    >>> executor.execute_query("SELECT 'value' AS [column]").to_dict(0)
+    {'column': 'value'}
+    >>> pooled = SQLHandler(environment = 'dev', pool_size = 4)
+
+    #### Tasklist:
+    - Add a execute query method that returns a dictionary representing the first row. Would be useful for a list of values or parameters, such as the weekly summary for func-personal.
+
+    #### History:
+    - 3.43 JRA (2026-10-17): Added __typed_columns; execute_query v3.18 and __fetch_columnar v1.3.
+    - 3.42 JRA (2026-10-17): write_bulk_file v1.2.
+    - 3.41 JRA (2026-10-17): Added __utc_datetimes; __column_datatype v1.2, infer_datatypes v1.2 and __insert_batches v1.2.
+    - 3.40 JRA (2026-10-17): paginate v1.2, execute_query v3.17, __fetch_columnar v1.2 and __fetch_spilling v1.2.
+    - 3.39 JRA (2026-10-17): parallel_select v1.2.
+    - 3.38 JRA (2026-10-17): Added release_connection; execute_query v3.16.
+    - 3.37 JRA (2026-10-17): execute_query v3.15 and bulk_insert v1.2.
+    - 3.36 JRA (2026-10-17): create_table_type v1.1.
+    - 3.35 JRA (2026-10-17): get_table_schema v1.1 and __type_max_length v1.1.
+    - 3.34 JRA (2026-10-17): session v1.1 and __insert_isolating v1.2.
+    - 3.33 JRA (2026-10-17): execute_batch v1.3.
+    - 3.32 JRA (2026-10-17): __init__ v1.9, execute_query v3.14, paginate v1.1 and parallel_select v1.1.
+    - 3.31 JRA (2026-10-17): Added __reset_option; upsert turns NOCOUNT back off.
+    - 3.30 JRA (2026-10-17): Added __executemany, which clears parameter size hints after each batch.
+    - 3.29 JRA (2026-10-17): infer_datatypes works column-wise.
+    - 3.28 JRA (2026-10-17): Fetched results read empty strings as None again.
+    - 3.27 JRA (2026-10-17): write_bulk_file writes datetimes to millisecond precision in UTC.
+    - 3.26 JRA (2026-10-17): Parallel atomic inserts move their staging tables in one transaction.
+    - 3.25 JRA (2026-10-17): Added isolate_errors and rejects to insert.
+    - 3.24 JRA (2026-10-17): Added spill_bytes and spill_directory for spilling oversized results to disk.
+    - 3.23 JRA (2026-10-17): __init__ v1.6, spawn v1.6, connect_to_mssql v2.4, __run v1.2, execute_query v3.11, execute_batch v1.1 and iter_query v1.3. Added query_timeout and __check_interrupted.
+    - 3.22 JRA (2026-10-17): Added execute_batch.
+    - 3.21 JRA (2026-10-17): Added paginate.
+    - 3.20 JRA (2026-10-17): __run v1.1 and execute_query v3.10. Added to_tvp, __has_table_values, __python_datatype and create_table_type.
+    - 3.19 JRA (2026-10-17): Added parallel_select and __range_boundaries.
+    - 3.18 JRA (2026-10-17): Added extract_incremental.
+    - 3.17 JRA (2026-10-17): __init__ v1.5, connect_to_mssql v2.3, execute_query v3.9, iter_query v1.2, spawn v1.5, insert v2.9 and upsert v1.1. Added stats and __record_query.
+    - 3.16 JRA (2026-10-17): __init__ v1.4, __open_connection v1.1, connect_to_mssql v2.2, spawn v1.4 and execute_query v3.8. Added __discard_connection and prewarm.
+    - 3.15 JRA (2026-10-17): Added session, close_connection v1.2, execute_query v3.7 and insert v2.8.
+    - 3.14 JRA (2026-10-17): Added upsert.
+    - 3.13 JRA (2026-10-17): Added __input_sizes, __parallel_insert v1.1 and insert v2.7.
+    - 3.12 JRA (2026-10-17): Added infer_datatypes and __column_datatype, create_table v2.4, insert v2.6 and bulk_insert v1.1.
+    - 3.11 JRA (2026-10-17): execute_query v3.6 and iter_query v1.1.
+    - 3.10 JRA (2026-10-17): Added columnar fetches with execute_query v3.5 and __fetch_columnar.
+    - 3.9 JRA (2026-10-17): Added the catalog cache with get_table_schema, table_exists, refresh_catalog, __type_max_length, __forget_tables, create_table v2.3, execute_query v3.4 and spawn v1.3.
+    - 3.8 JRA (2026-10-17): Added result caching with __init__ v1.3, execute_query v3.3, insert v2.5 and spawn v1.2.
+    - 3.7 JRA (2026-10-17): Renamed __worker to spawn and made it public.
+    - 3.6 JRA (2026-10-17): Added bulk loading with write_bulk_file, __bulk_insert_command and bulk_insert.
+    - 3.5 JRA (2026-10-17): Added parallel inserts with insert v2.4, __insert_batches v1.1, __worker and __parallel_insert.
+    - 3.4 JRA (2026-10-17): Added batched inserts with insert v2.3 and __insert_batches.
+    - 3.3 JRA (2026-10-17): Added streaming with execute_query v3.2, iter_query, __run and __describe.
+    - 3.2 JRA (2026-10-17): Added connection pooling with __init__ v1.2, connect_to_mssql v2.1, close_connection v1.1, __open_connection and close_pool.
+    - 3.1 JRA (2024-02-23): Tabular implementation bug fixes.
+    - 3.0 JRA (2024-02-19): Implemented Tabular and removed select_to_dataframe and query_columns.
+    - 2.0 JRA (2024-02-12): Revamped error handling.
+    - 1.1 JRA (2024-02-09): Added retry_wait.
+    - 1.0 JRA (2024-02-09): Initial version.
+    """
+    def __init__(
+        self,
+        connection_string: str = None,
+        environment: str = None,
+        driver: str = None,
+        server: str = None,
+        port: int = None,
+        database: str = None,
+        uid: str = None,
+        pwd: str = None,
+        encrypt: str = 'yes',
+        trust_server_certificate: str = 'no',
+        connection_timeout: int = 30,
+        retry_wait: int = None,
+        pool_size: int = None,
+        pool_idle_timeout: float = 300,
+        cache: QueryCache = None,
+        retry_policy: RetryPolicy = None,
+        prewarm: bool = False,
+        metrics: QueryMetrics = None,
+        query_timeout: int = None,
+        spill_bytes: int = None,
+        spill_directory: str = None
+    ):
+        """
+        ### __init__
+
+        Version: 1.9
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the handler.
+
+        #### Parameters:
+        - connection_string (str): The connection string to use. Defaults to environment or other parameters if not supplied.
+        - environment (str): The environment to get keyring keys from. Defaults to other parameters if not supplied.
+        - driver (str): The ODBC driver to use. No default driver.
+        - server (str): The server to connect to.
+        - port (int): The port to connect via.
+        - database (str): The database to connect to.
+        - uid (str): The user identifier.
+        - pwd (str): The user password.
+        - encrypt (str): If 'yes', encryption is used.
+        - connection_timeout (int): Timeout limit to use during connections.
+        - retry_wait (int): If populated and retry_policy is not, connections to the database are retried once on failure after this number of seconds. Defaults to no retry.
+        - pool_size (int): If populated, up to this many connections are kept open and reused between calls. Defaults to no pooling.
+        - pool_idle_timeout (float): Pooled connections idle for longer than this number of seconds are closed. Defaults to 300.
+        - cache (QueryCache): If populated, results of read queries are cached here. May be shared between handlers. Defaults to no caching.
+        - retry_policy (RetryPolicy): If populated, connections are retried on transient errors under this policy, as are queries run with `retry` that open their own connection. Defaults to the retry_wait behaviour.
+        - prewarm (bool): If true, the database is woken in the background as soon as the handler is created. See SQLHandler.prewarm. Defaults to false.
+        - metrics (QueryMetrics): If populated, the connect, execute and fetch times, rows and approximate bytes of each call are recorded here. May be shared between handlers. Defaults to no instrumentation.
+        - query_timeout (int): If populated, queries run for longer than this number of seconds are cancelled by the driver and raise QueryCancelled. Can be overridden per call. Defaults to no timeout.
+        - spill_bytes (int): If populated, query results estimated to be larger than this number of bytes are spilled to disk and returned as a memory-mapped SpilledTabular. Can be overridden per call. Defaults to no spilling.
+        - spill_directory (str): The directory results are spilled to. Defaults to the system temporary directory.
+
+        #### Usage:
+        >>> executor = SQLHandler(environment = 'dev')
+        >>> executor = SQLHandler(environment = 'dev', retry_policy = RetryPolicy(deadline = 180), prewarm = True)
+
+        #### History:
+        - 1.9 JRA (2026-10-17): Queries are only retried when run with retry.
+        - 1.8 JRA (2026-10-17): Added the rejected attribute.
+        - 1.7 JRA (2026-10-17): Added spill_bytes and spill_directory.
+        - 1.6 JRA (2026-10-17): Added query_timeout.
+        - 1.5 JRA (2026-10-17): Added metrics.
+        - 1.4 JRA (2026-10-17): Added retry_policy and prewarm.
+        - 1.3 JRA (2026-10-17): Added cache.
+        - 1.2 JRA (2026-10-17): Added pool_size and pool_idle_timeout.
+        - 1.1 JRA (2024-02-09): Added retry_wait.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if connection_string is None and environment is None and (server is None or database is None):
+            error = "Not enough information given to start SQLHandler."
+            LOG.critical(error)
+            raise ValueError(error)
+        self.__connection_string = connection_string
+        self.__params = {
+            'driver': driver,
+            'server': server,
+            'port': port,
+            'database': database,
+            'uid': uid,
+            'pwd': pwd,
+            'encrypt': encrypt,
+            'trustservercertificate': trust_server_certificate,
+            'connectiontimeout': connection_timeout
+        }
+        self.connected = False
+        self.conn = None
+        self.description = ()
+        self.retry_wait = retry_wait
+        self.retry_policy = retry_policy
+        if retry_policy is None and retry_wait is not None:
+            self.retry_policy = RetryPolicy(attempts = 2, base_delay = retry_wait, multiplier = 1, jitter = 0, deadline = None)
+        if self.__connection_string is not None:
+            LOG.sql("Reading parameters from connection string.")
+            for param in [param for param, value in self.__params.items() if value is None]:
+                self.__params[param] = extract_param(self.__connection_string, param+'=', ';')
+        elif environment is not None:
+            LOG.sql("Getting parameters from keyring.")
+            for param in [param for param, value in self.__params.items() if value is None]:
+                value = kr.get_password(environment, param)
+                if value is None:
+                    LOG.warning(f'No value found for {param} in {environment} environment.')
+                else:
+                    self.__params[param] = value
+
+        if self.__connection_string is None:
+            self.__connection_string = ""
+            for param, value in [(param, value) for param, value in self.__params.items() if value is not None]:
+                self.__connection_string += f"{param}={value};"
+
+        self.cache = cache
+        self.metrics = metrics
+        self.query_timeout = query_timeout
+        self.spill_bytes = spill_bytes
+        self.spill_directory = spill_directory
+        self.rejected = None
+        self.__connect_seconds = 0.0
+        self.__catalog = {'objects': {}, 'types': {}}
+        self.__session_depth = 0
+        self.pool = None
+        if pool_size is not None:
+            LOG.sql(f"Pooling up to {pool_size} connections to {self}.")
+            self.pool = ConnectionPool(
+                factory = self.__open_connection,
+                size = pool_size,
+                idle_timeout = pool_idle_timeout
+            )
+        if prewarm:
+            self.prewarm()
+        return
+    
+    def __str__(self) -> str:
+        """
+        ### __str__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2024-02-09
+
+        #### Explanation:
+        Returns the server and database of the handler.
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> print(executor)
+        "[server].[database]"
+
+        #### History:
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        # To return detailed information, could set this to return the following format:
+        # [SQL(server='server', database='database', etc...)]
+        return f'[{self.__params["server"]}].[{self.__params["database"]}]'
+    
+    def __bool__(self) -> bool:
+        """
+        ### __bool__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2024-02-09
+
+        #### Explanation:
+        Returns True when the handler is successfully connected.
+
+        #### Returns:
+        - self.connected (bool)
+
+        #### Usage:
+        >>> bool(executor)
+
+        #### History:
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        return self.connected
+    
+    def __schema_table_to_object_name(self, schema: str, table: str) -> str:
+        """
+        ### __schema_table_to_object_name
+        
+        Version: 1.1
+        Authors: JRA
+        Date: 2024-02-13
+
+        #### Explanation:
+        Standardises a given schema and object to a bracket wrapped, stop separated string.
+
+        #### Parameters:
+        - schema (str)
+        - table (str)
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> executor.__schema_table_to_object_name('schema', 'table')
+        '[schema].[table]'
+
+        #### History:
+        - 1.1 JRA (2024-02-13): Added support for inputs that are already wrapped.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if schema is None or schema == '':
+            schema = ''
+        elif not (schema.startswith('[') and schema.endswith(']')):
+            schema = '[' + schema + '].'
+        if not (table.startswith('[') and table.endswith(']')):
+            table = '[' + table + ']'
+        return f"{schema}{table}"
+    
+    def __open_connection(self, auto_commit: bool = False, retry_wait: int = None) -> pyodbc.Connection:
+        """
+        ### __open_connection
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Opens a new connection to the SQL Server, retrying transient failures under the handler's retry policy. Split out of connect_to_mssql so that it can also serve as the factory of the connection pool.
+
+        #### Requirements:
+        - RetryPolicy.run
+
+        #### Parameters:
+        - auto_commit (bool): If true, transactions are committed by default. Default is false.
+        - retry_wait (int): If populated, connections to the database are retried once on failure after this number of seconds instead of following the handler's retry policy. Defaults to None.
+
+        #### Returns:
+        - conn (pyodbc.Connection)
+
+        #### Usage:
+        >>> executor.__open_connection()
+        <pyodbc.Connection>
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Retries follow the handler's retry policy.
+        - 1.0 JRA (2026-10-17): Initial version, moved from connect_to_mssql v2.0.
+        """
+        def connect() -> pyodbc.Connection:
+            LOG.sql(f'Attempting to connect to {self}...')
+            try:
+                conn = pyodbc.connect(self.__connection_string, autocommit = auto_commit)
+            except pyodbc.OperationalError as e:
+                LOG.error(f"A database operational error occurred while connecting to {self}. {e}")
+                raise
+            except pyodbc.InterfaceError as e:
+                LOG.error(f"A database interface error occurred while connecting to {self}. {e}")
+                raise
+            except pyodbc.Error as e:
+                LOG.error(f"A database error occurred while connecting to {self}. {e}")
+                raise
+            except Exception as e:
+                LOG.critical(f"Unexpected {type(e)} error occurred whilst connecting to {self}. {e}")
+                raise
+            LOG.sql(f"Successfully connected to {self}.")
+            return conn
+
+        policy = self.retry_policy
+        if retry_wait is not None:
+            policy = RetryPolicy(attempts = 2, base_delay = retry_wait, multiplier = 1, jitter = 0, deadline = None)
+        if policy is None:
+            return connect()
+        return policy.run(connect, f"connecting to {self}")
+
+    def connect_to_mssql(self, auto_commit: bool = False, retry_wait: int = None) -> pyodbc.Cursor|None:
+        """
+        ### connect_to_mssql
+
+        Version: 2.4
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Establishes a connection to the SQL Server. If the handler is pooled, a warm connection is borrowed from the pool instead. The connection's query timeout is set to the handler's. If the handler is instrumented, the time taken is added to the handler's connect time.
+
+        #### Requirements:
+        - SQLHandler.__open_connection
+        - ConnectionPool.get
+
+        #### Parameters:
+        - auto_commit (bool): If true, transactions are committed by default. Default is false.
+        - retry_wait (int): If populated, connections to the database are retried once on failure after this number of seconds instead of following the handler's retry policy. Ignored for pooled handlers. Defaults to None.
+
+        #### Returns:
+        - self.cursor (pyodbc.Cursor)
+
+        #### Usage:
+        >>> executor.connect_to_mssql()
+        <executor.cursor>
+
+        #### History:
+        - 2.4 JRA (2026-10-17): Sets the query timeout.
+        - 2.3 JRA (2026-10-17): Measures connect time for metrics.
+        - 2.2 JRA (2026-10-17): Documented the retry policy.
+        - 2.1 JRA (2026-10-17): Borrows from the connection pool when pooling is enabled.
+        - 2.0 JRA (2024-02-12): Revamped error handling.
+        - 1.1 JRA (2024-02-09): Added retry_wait.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if self.connected:
+            LOG.error(f"Connection to {str(self)} already open.")
+            return
+        if self.metrics is not None:
+            start = monotonic()
+        if self.pool is not None:
+            self.conn = self.pool.get()
+            self.conn.autocommit = auto_commit
+        else:
+            self.conn = self.__open_connection(auto_commit, retry_wait)
+        self.conn.timeout = self.query_timeout or 0
+        self.cursor = self.conn.cursor()
+        self.connected = True
+        if self.metrics is not None:
+            self.__connect_seconds += monotonic() - start
+        return self.cursor
+    
+    def rollback(self):
+        """
+        ### rollback
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2024-02-09
+
+        #### Explanation:
+        Rolls back transactions.
+
+        #### Usage:
+        >>> executor.rollback()
+
+        #### History:
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if not self.connected:
+            LOG.warning("No open connection to roll back.")
+            return
+        LOG.sql(f"Rolling back transaction to {str(self)}.")
+        self.conn.rollback()
+        return
+    
+    def commit(self):
+        """
+        ### commit
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2024-02-09
+
+        #### Explanation:
+        Commits transactions.
+
+        #### Usage:
+        >>> executor.commit()
+
+        #### History:
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if not self.connected:
+            LOG.warning("No open connection to commit.")
+            return
+        LOG.sql(f"Committing transaction to {str(self)}.")
+        self.conn.commit()
+        return
+
+    def close_connection(self, commit: bool = True):
+        """
+        ### close_connection
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes the open connection. If the handler is pooled, the connection is returned to the pool instead. Inside a session, the connection is kept open and the transaction is left to the session.
+
+        #### Requirements:
+        - SQLHandler.commit
+        - SQLHandler.rollback
+        - ConnectionPool.put
+
+        #### Parameters:
+        - commit (bool): If true, transaction is committed. Defaults to true.
+
+        #### Usage:
+        >>> executor.close_connection()
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Does nothing inside a session.
+        - 1.1 JRA (2026-10-17): Returns pooled connections to the pool.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if not self.connected:
+            LOG.error("No open connection to close.")
+            return
+        if self.__session_depth > 0:
+            return
+        if commit:
+            self.commit()
+        else:
             self.rollback()
         self.description = self.cursor.description
         self.cursor.close()
-        self.conn.close()
+        if self.pool is not None:
+            self.pool.put(self.conn)
+            LOG.sql(f"Returned connection to {str(self)} to the pool.")
+        else:
+            self.conn.close()
+            LOG.sql(f"Closed connection to {str(self)}.")
+        self.conn = None
+        self.connected = False
+        return
+
+    def close_pool(self):
+        """
+        ### close_pool
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes all pooled connections. The handler falls back to opening a connection per call afterwards.
+
+        #### Requirements:
+        - ConnectionPool.close
+
+        #### Usage:
+        >>> executor.close_pool()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if self.pool is None:
+            LOG.warning(f"No connection pool to close for {str(self)}.")
+            return
+        if self.connected:
+            self.close_connection(commit = False)
+        self.pool.close()
+        self.pool = None
+        return
+
+    def release_connection(self):
+        """
+        ### release_connection
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Rolls back and releases the open connection after a failed call, discarding it if the rollback fails, so that a pooled connection is not kept by a handler that will not be used again. Does nothing without an open connection or inside a session.
+
+        #### Requirements:
+        - SQLHandler.close_connection
+        - SQLHandler.__discard_connection
+
+        #### Usage:
+        >>> worker.release_connection()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if not self.connected or self.__session_depth > 0:
+            return
+        try:
+            self.close_connection(commit = False)
+        except pyodbc.Error:
+            self.__discard_connection()
+        return
+
+    def __discard_connection(self):
+        """
+        ### __discard_connection
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Drops the open connection without committing or rolling back, for connections that may be broken. A pooled connection is discarded rather than returned to the pool.
+
+        #### Requirements:
+        - ConnectionPool.put
+
+        #### Usage:
+        >>> executor.__discard_connection()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        try:
+            self.cursor.close()
+        except pyodbc.Error:
+            pass
+        if self.pool is not None:
+            self.pool.put(self.conn, discard = True)
+        else:
+            try:
+                self.conn.close()
+            except pyodbc.Error as e:
+                LOG.warning(f"Failed to close connection to {str(self)} cleanly. {e}")
+        self.conn = None
         self.connected = False
-        LOG.sql(f"Closed connection to {str(self)}.")
         return
-    
-    # def select_to_dataframe(self, query: str, values: tuple = None) -> pd.DataFrame:
-    #     """
-    #     ### select_to_dataframe
 
-    #     Version: 1.2
-    #     Authors: JRA
-    #     Date: 2024-02-19
+    def __reset_option(self, option: str):
+        """
+        ### __reset_option
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Turns a SET option, such as NOCOUNT, back off on the open connection, so that it does not leak to later calls in a session or, through the pool, to other borrowers of the connection. A failure is logged rather than raised, so that it does not hide the outcome of the call that set the option.
+
+        #### Parameters:
+        - option (str): The name of the option.
+
+        #### Usage:
+        >>> self.__reset_option('NOCOUNT')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if not self.connected:
+            return
+        try:
+            self.cursor.execute(f"SET {option} OFF")
+        except pyodbc.Error as e:
+            LOG.warning(f"Could not turn {option} off on {self}. {e}")
+        return
+
+    def prewarm(self) -> Thread:
+        """
+        ### prewarm
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Wakes the database in the background by connecting, under the retry policy, and running a trivial query, so that a paused serverless database resumes while the job is still preparing its data. If the handler is pooled, the warm connection is left in the pool for the next call. Failures are logged rather than raised, since the next call will retry anyway.
+
+        #### Requirements:
+        - SQLHandler.__open_connection
+        - ConnectionPool.get
+        - ConnectionPool.put
+
+        #### Returns:
+        - thread (threading.Thread): The daemon thread doing the work, which can be joined to wait for the database.
+
+        #### Usage:
+        >>> warming = executor.prewarm()
+        >>> data = build_data()
+        >>> warming.join()
+        >>> executor.insert('schema', 'table', data)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        def ping():
+            start = monotonic()
+            try:
+                conn = self.pool.get() if self.pool is not None else self.__open_connection()
+            except Exception as e:
+                LOG.warning(f"Failed to prewarm {str(self)}. {e}")
+                return
+            healthy = True
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+                cursor.close()
+            except pyodbc.Error as e:
+                LOG.warning(f"Failed to prewarm {str(self)}. {e}")
+                healthy = False
+            if self.pool is not None:
+                self.pool.put(conn, discard = not healthy)
+            else:
+                conn.close()
+            if healthy:
+                LOG.sql(f"Prewarmed {str(self)} in {monotonic() - start:.1f} seconds.")
+            return
+
+        LOG.sql(f"Prewarming {str(self)} in the background...")
+        thread = Thread(target = ping, name = 'pyjra-prewarm', daemon = True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict[str, dict]:
+        """
+        ### stats
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Summarises the latency and volume of the calls recorded by the handler's metrics, which may include calls of other handlers sharing them.
+
+        #### Requirements:
+        - QueryMetrics.stats
+
+        #### Returns:
+        - (dict[str, dict]): The counts, rows, bytes and p50, p95 and p99 connect, execute, fetch and total times of each operation and name. Empty if the handler is not instrumented.
+
+        #### Usage:
+        >>> executor.stats()['execute_query:table']['total']['p95']
+        0.25
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if self.metrics is None:
+            return {}
+        return self.metrics.stats()
+
+    @contextmanager
+    def session(self, commit: bool = True) -> Iterator['SQLHandler']:
+        """
+        ### session
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Scope in which every call of the handler, such as execute_query, insert and create_table, shares one connection and one transaction. The connection is opened once on entry and the transaction is committed or rolled back on exit, so the commit arguments of calls inside the scope are ignored. If the scope exits with an error, the transaction is rolled back.
+
+        Nested sessions set a savepoint on entry. A nested session that exits with an error, or that was opened with commit false, rolls back to its savepoint only, leaving the rest of the transaction to the outer session. If rolling back to the savepoint fails, such as when the error has doomed the whole transaction, that failure is raised in place of the error, so callers cannot carry on as though only the nested work was undone.
+
+        #### Requirements:
+        - SQLHandler.connect_to_mssql
+        - SQLHandler.close_connection
+
+        #### Parameters:
+        - commit (bool): If true, the transaction is committed on exit. For nested sessions, false rolls back to the savepoint. Defaults to true.
+
+        #### Returns:
+        - (SQLHandler): The handler itself.
+
+        #### Usage:
+        >>> with executor.session() as s:
+                s.execute_query("DELETE FROM [schema].[table] WHERE [date] = ?", (today,))
+                s.insert('schema', 'table', data)
+                with s.session():
+                    s.execute_query("EXECUTE [schema].[usp_refresh]")
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Raises a failed rollback to the savepoint of a nested session rather than logging it.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        depth = self.__session_depth
+        savepoint = f"pyjra_session_{depth}"
+        if depth == 0:
+            if not self.connected:
+                self.connect_to_mssql(auto_commit = False)
+            elif self.conn.autocommit:
+                self.conn.autocommit = False
+            LOG.sql(f"Opened session on {self}.")
+        else:
+            LOG.sql(f"Saving transaction of session on {self} as {savepoint}.")
+            # SAVE TRANSACTION needs an open transaction. The driver runs with implicit transactions, so reading a table
+            # opens one, whereas BEGIN TRANSACTION would open a second that the driver's commit would not close.
+            self.cursor.execute(f"DECLARE @start int;\nIF @@TRANCOUNT = 0 SELECT @start = 1 FROM sys.objects WHERE 1 = 0;\nSAVE TRANSACTION [{savepoint}];")
+        self.__session_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.__session_depth -= 1
+            self.__catalog['objects'].clear()
+            if depth == 0:
+                LOG.error(f"Rolling back session on {self} after an error.")
+                if self.connected:
+                    self.close_connection(commit = False)
+            elif self.connected:
+                try:
+                    self.cursor.execute(f"ROLLBACK TRANSACTION [{savepoint}]")
+                except pyodbc.Error as e:
+                    LOG.error(f"Could not roll back to {savepoint} on {self}, so the work of the nested session cannot be undone on its own. {e}")
+                    raise
+            raise
+        self.__session_depth -= 1
+        if depth == 0:
+            if self.connected:
+                self.close_connection(commit = commit)
+            LOG.sql(f"Closed session on {self}.")
+        elif not commit:
+            LOG.sql(f"Rolling back session on {self} to {savepoint}.")
+            self.__catalog['objects'].clear()
+            self.cursor.execute(f"ROLLBACK TRANSACTION [{savepoint}]")
+        return
+    
+    # def select_to_dataframe(self, query: str, values: tuple = None) -> pd.DataFrame:
+    #     """
+    #     ### select_to_dataframe
+
+    #     Version: 1.2
+    #     Authors: JRA
+    #     Date: 2024-02-19
+
+    #     #### Explanation:
+    #     Executes a DQL script and returns the result as a DataFrame.
+
+    #     #### Requirements:
+    #     - SQLHandler.connect_to_mssql
+
+    #     #### Parameters:
+    #     - query (str): The query to run.
+    #     - values (tuple): The values to substitute into the query. Defaults to None.
+
+    #     #### Returns:
+    #     - (pandas.DataFrame): Output of query.
+
+    #     #### Usage:
+    #     >>> executor.select_to_dataframe("SELECT 'value' AS [column]")
+    #     <pandas.DataFrame>
+
+    #     #### History:
+    #     - 1.2 JRA (2024-02-19): Implemented Tabular.
+    #     - 1.1 JRA (2024-02-12): Error handling moved to connect_to_mssql.
+    #     - 1.0 JRA (2024-02-09): Initial version.
+    #     """
+    #     if not self.connected:
+    #         self.connect_to_mssql(auto_commit = False)
+    #     LOG.sql(f"Generating dataframe against {str(self)}.")
+    #     results = self.execute_query(query, values, commit = False)
+    #     return results.to_dataframe()
+    
+    def __check_interrupted(self, error: BaseException|None, timeout: int = None, cancel: CancelHandle = None):
+        """
+        ### __check_interrupted
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Raises QueryCancelled in place of an error caused by a timeout or a cancelled handle. Outside of a session, the connection is first rolled back and released, or discarded if that fails, so a pooled connection is not left mid-query. Inside a session, the session ends the transaction. Other errors are left to the caller.
+
+        #### Requirements:
+        - SQLHandler.close_connection
+        - SQLHandler.__discard_connection
+
+        #### Parameters:
+        - error (BaseException|None): The error raised by the query, or None if the query was stopped before it raised one.
+        - timeout (int): The timeout of the query in seconds. Defaults to the handler's query_timeout.
+        - cancel (CancelHandle): The cancel handle of the query, if any. Defaults to None.
+
+        #### Usage:
+        >>> self.__check_interrupted(e, timeout, cancel)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        timeout = self.query_timeout if timeout is None else timeout
+        timed_out = timeout is not None and timeout > 0 and isinstance(error, pyodbc.Error) and len(error.args) > 0 and str(error.args[0]) in ('HYT00', 'HYT01')
+        if not timed_out and (cancel is None or not cancel.cancelled):
+            return
+        message = f"Query on {self} {'timed out after ' + str(timeout) + ' seconds' if timed_out else 'was cancelled'}."
+        LOG.error(message)
+        if self.connected and self.__session_depth == 0:
+            try:
+                self.close_connection(commit = False)
+            except pyodbc.Error:
+                self.__discard_connection()
+        raise QueryCancelled(message, timed_out) from error
+
+    def __run(self, query: str, values: tuple = None, timeout: int = None, cancel: CancelHandle = None):
+        """
+        ### __run
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Executes a SQL query on the open cursor, logging any failures. Tabular values are passed as table-valued parameters. If the timeout differs from the connection's, the connection's timeout is changed and a new cursor is opened, since the driver applies it to new statements. A cancel handle is bound to the cursor before the query runs.
+
+        #### Requirements:
+        - SQLHandler.__has_table_values
+        - SQLHandler.to_tvp
+        - CancelHandle.bind
+        - SQLHandler.__check_interrupted
+
+        #### Parameters:
+        - query (str): The query to run.
+        - values (tuple): The values to substitute into the query. Defaults to None.
+        - timeout (int): The number of seconds the query may run for, or 0 for no limit. Defaults to the handler's query_timeout.
+        - cancel (CancelHandle): The handle that can cancel the query. Defaults to None.
+
+        #### Usage:
+        >>> executor.__run("SELECT 'value' AS [column]")
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Added timeout and cancel.
+        - 1.1 JRA (2026-10-17): Passes Tabular values as table-valued parameters.
+        - 1.0 JRA (2026-10-17): Initial version, moved from execute_query v3.1.
+        """
+        if self.__has_table_values(values):
+            if isinstance(values, Tabular):
+                values = (values,)
+            values = tuple(self.to_tvp(value) if isinstance(value, Tabular) else value for value in values)
+            LOG.sql(f"Running script against {str(self)}:\n{query}\nValues: {len(values)} values including table-valued parameters.")
+        else:
+            LOG.sql(f"Running script against {str(self)}:\n{query}\nValues: {values}.")
+        timeout = self.query_timeout if timeout is None else timeout
+        if (timeout or 0) != self.conn.timeout:
+            self.conn.timeout = timeout or 0
+            self.cursor.close()
+            self.cursor = self.conn.cursor()
+        if cancel is not None and not cancel.bind(self.cursor):
+            self.__check_interrupted(None, timeout, cancel)
+        try:
+            if values is None:
+                self.cursor.execute(query)
+            else:
+                self.cursor.execute(query, (values))
+        except pyodbc.ProgrammingError as e:
+            self.__check_interrupted(e, timeout, cancel)
+            LOG.error(f"Failed to parse script on {self}. {e}")
+            raise
+        except Exception as e:
+            self.__check_interrupted(e, timeout, cancel)
+            LOG.critical(f"Unexpected {type(e)} error occurred whilst executing query on {self}. {e}")
+            raise
+        return
+
+    def __describe(self) -> tuple[list[str]|None, list[type]|None]:
+        """
+        ### __describe
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads the column names and Python types of the current result set from the cursor description.
+
+        #### Returns:
+        - columns (list[str]|None): None if there is no result set.
+        - datatypes (list[type]|None): None if there is no result set.
+
+        #### Usage:
+        >>> executor.__describe()
+        (['column'], [<class 'str'>])
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version, moved from execute_query v3.1.
+        """
+        try:
+            columns = [col[0] for col in self.cursor.description]
+            datatypes = [col[1] for col in self.cursor.description]
+        except TypeError as e:
+            LOG.warning(f"No query results to read metadata of.")
+            columns = None
+            datatypes = None
+        except Exception as e:
+            LOG.critical(f"Unexpected {type(e)} error occurred whilst retrieving query results on {self}. {e}")
+            raise
+        return columns, datatypes
+
+    @staticmethod
+    def __typed_columns(buffers: list[list], columns: list[str], datatypes: list[type]) -> list:
+        """
+        ### __typed_columns
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Stores the integer and float columns of column-based data without nulls as typed arrays, as columnar results are returned. Integers beyond 64 bits are left as lists.
+
+        #### Requirements:
+        - array.array
+
+        #### Parameters:
+        - buffers (list[list]): The values of each column.
+        - columns (list[str]): The names of the columns.
+        - datatypes (list[type]): The Python types of the columns.
+
+        #### Returns:
+        - buffers (list)
+
+        #### Usage:
+        >>> SQLHandler.__typed_columns([[1, 2], ['a', 'b']], ['id', 'code'], [int, str])
+        [array('q', [1, 2]), ['a', 'b']]
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        for c, datatype in enumerate(datatypes):
+            if datatype in (int, float) and None not in buffers[c]:
+                try:
+                    buffers[c] = array('q' if datatype is int else 'd', buffers[c])
+                except OverflowError:
+                    LOG.sql(f"Column {columns[c]} exceeds 64 bits, so is stored as a list.")
+        return buffers
+
+    def __fetch_columnar(self, columns: list[str], datatypes: list[type], name: str = None, batch_size: int = 10000, blanks_as_none: bool = True) -> Tabular:
+        """
+        ### __fetch_columnar
+
+        Version: 1.3
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads the current result set straight into per-column buffers and returns a column-based Tabular without validation, using the types of the cursor description. Integer and float columns without nulls are stored as typed arrays, other columns as lists.
+
+        #### Requirements:
+        - SQLHandler.__typed_columns
+        - Tabular.tabular_from_tabular
+
+        #### Parameters:
+        - columns (list[str]): The columns of the result set.
+        - datatypes (list[type]): The Python types of the columns.
+        - name (str): The name to assign to the results. Defaults to None.
+        - batch_size (int): The number of rows to fetch at a time. Defaults to 10000.
+        - blanks_as_none (bool): If true, empty strings in text columns are read as None. Defaults to true.
+
+        #### Returns:
+        - (Tabular): Stored as a list of columns.
+
+        #### Usage:
+        >>> executor.__fetch_columnar(['column'], [int])
+
+        #### History:
+        - 1.3 JRA (2026-10-17): Stores typed arrays with __typed_columns.
+        - 1.2 JRA (2026-10-17): Added blanks_as_none.
+        - 1.1 JRA (2026-10-17): Empty strings in text columns are read as None.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        buffers = [[] for _ in columns]
+        row_count = 0
+        while True:
+            try:
+                rows = self.cursor.fetchmany(batch_size)
+            except Exception as e:
+                LOG.critical(f"Unexpected {type(e)} error occurred whilst retrieving query results on {self}. {e}")
+                raise
+            if len(rows) == 0:
+                break
+            row_count += len(rows)
+            for buffer, column in zip(buffers, zip(*rows)):
+                buffer.extend(column)
+        buffers = SQLHandler.__typed_columns(buffers, columns, datatypes)
+        if blanks_as_none:
+            buffers = Tabular.blanks_to_none(buffers, datatypes, row_based = False)
+        LOG.sql(f"Fetched {row_count} rows into columns from {str(self)}.")
+        return Tabular.tabular_from_tabular(
+            data = buffers,
+            columns = list(columns),
+            datatypes = list(datatypes),
+            row_count = row_count,
+            col_count = len(columns),
+            row_based = False,
+            name = name
+        )
+
+    def __fetch_spilling(self, columns: list[str], datatypes: list[type], name: str, batch_size: int, spill_bytes: int, blanks_as_none: bool = True) -> Tabular:
+        """
+        ### __fetch_spilling
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads the current result set in batches into memory until its estimated size passes `spill_bytes`. If it never does, the result is returned as a Tabular. Otherwise, the rows read so far and the rest of the result set are written to disk a batch at a time and returned as a SpilledTabular.
+
+        #### Requirements:
+        - QueryMetrics.estimate_bytes
+        - SpilledTabular.spill
+
+        #### Parameters:
+        - columns (list[str]): The columns of the result set.
+        - datatypes (list[type]): The datatypes of the result set.
+        - name (str): The name to assign to the results.
+        - batch_size (int): The number of rows fetched at a time.
+        - spill_bytes (int): The estimated size in bytes beyond which the result is spilled to disk.
+        - blanks_as_none (bool): If true, empty strings in text columns are read as None. Defaults to true.
+
+        #### Returns:
+        - (Tabular|SpilledTabular)
+
+        #### Usage:
+        >>> self.__fetch_spilling(columns, datatypes, 'orders', 10000, 2**30)
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Added blanks_as_none.
+        - 1.1 JRA (2026-10-17): Empty strings in text columns are read as None.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        rows = []
+        size = 0
+        while size <= spill_bytes:
+            batch = [tuple(row) for row in self.cursor.fetchmany(batch_size)]
+            if len(batch) == 0:
+                return Tabular.from_trusted(data = rows, columns = columns, datatypes = datatypes, name = name, blanks_as_none = blanks_as_none)
+            rows.extend(batch)
+            size += QueryMetrics.estimate_bytes(batch)
+        LOG.sql(f"Result of {len(rows)} rows from {self} passed {spill_bytes} bytes, spilling to disk...")
+        pending = [rows]
+        del rows
+
+        def batches() -> Iterator[list[tuple]]:
+            text = datatypes if blanks_as_none else None
+            yield Tabular.blanks_to_none(pending.pop(), text)
+            while True:
+                batch = self.cursor.fetchmany(batch_size)
+                if len(batch) == 0:
+                    return
+                yield Tabular.blanks_to_none([tuple(row) for row in batch], text)
+
+        return SpilledTabular.spill(batches(), columns, datatypes, name = name, directory = self.spill_directory)
+
+    def execute_query(
+        self, 
+        query: str, 
+        values: tuple = None, 
+        commit: bool = True, 
+        name: str = None,
+        stream: bool = False,
+        batch_size: int = 10000,
+        use_cache: bool = True,
+        cache_ttl: float = None,
+        columnar: bool = False,
+        timeout: int = None,
+        cancel: CancelHandle = None,
+        spill_bytes: int = None,
+        retry: bool = False,
+        blanks_as_none: bool = True
+    ) -> None|Tabular|Iterator[Tabular]:
+        """
+        ### execute_query
+
+        Version: 3.18
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Executes a SQL query. If the handler has a cache, results of read queries are served from and stored in it, and other queries invalidate cached results of the tables they reference. Inside a session or with table-valued parameters, the cache is not read or written, since results may include uncommitted changes or the values cannot be hashed. DDL queries also forget the catalog cache entries of the tables they reference.
+
+        Connecting follows the handler's retry policy. The query itself is only retried if `retry` is set, since a query that failed on a dropped connection may still have run, so only read-only or idempotent queries are safe to run again. It is then retried on a fresh connection when it fails with a transient error such as a deadlock, provided it opened its own connection. Queries on an already open connection or inside a session are never retried, since the work before them would be lost.
+
+        If the handler is instrumented, the connect, execute and fetch times, rows and approximate bytes of the query are recorded under `name`, including queries answered from the cache.
+
+        A query that exceeds its timeout or is cancelled through its cancel handle raises QueryCancelled. Cancelled queries are not retried. Outside of a session, a query that fails for any reason has its connection rolled back and released, or discarded if that fails, so a pooled connection is not kept by a failed call.
+
+        With a spill threshold, results are fetched in batches of `batch_size` rows, and once their estimated size passes the threshold they are written to disk and returned as a memory-mapped SpilledTabular, which is never cached. Columnar results are not spilled.
+
+        #### Requirements:
+        - QueryCache.is_read
+        - QueryCache.get
+        - QueryCache.put
+        - QueryCache.invalidate
+        - SQLHandler.__has_table_values
+        - SQLHandler.connect_to_mssql
+        - SQLHandler.__discard_connection
+        - SQLHandler.release_connection
+        - RetryPolicy.run
+        - SQLHandler.__forget_tables
+        - SQLHandler.__run
+        - SQLHandler.__check_interrupted
+        - SQLHandler.__describe
+        - SQLHandler.__fetch_columnar
+        - SQLHandler.__typed_columns
+        - SQLHandler.__fetch_spilling
+        - SQLHandler.iter_query
+        - SQLHandler.close_connection
+        - QueryMetrics.estimate_bytes
+        - QueryMetrics.record
+
+        #### Parameters:
+        - query (str): The query to run.
+        - values (tuple): The values to substitute into the query. Tabular values and lists of tuples, such as from SQLHandler.to_tvp, are passed as table-valued parameters. Defaults to None.
+        - commit (bool): If true, the query is committed. Ignored inside a session.
+        - name (str): The name to assign to the results and to tag metrics with.
+        - stream (bool): If true, the results are returned as an iterator of Tabular batches rather than a single Tabular. See SQLHandler.iter_query. Defaults to false.
+        - batch_size (int): The number of rows per batch when streaming. Defaults to 10000.
+        - use_cache (bool): If false, the cache is bypassed for this query. Streamed queries never use the cache. Defaults to true.
+        - cache_ttl (float): The number of seconds to cache this result for. Defaults to the cache default.
+        - columnar (bool): If true, the results are read straight into a column-based Tabular without validation, with integer and float columns as typed arrays. Faster and smaller for large results. Cached results are returned the same way. Defaults to false.
+        - timeout (int): The number of seconds the query may run for, or 0 for no limit. Defaults to the handler's query_timeout.
+        - cancel (CancelHandle): A handle that another thread can cancel the query with. Defaults to None.
+        - spill_bytes (int): The estimated size in bytes beyond which the results are spilled to disk, or 0 to never spill. Defaults to the handler's spill_bytes.
+        - retry (bool): If true, the query is retried under the handler's retry policy on transient errors. Only for read-only or idempotent queries. Defaults to false.
+        - blanks_as_none (bool): If true, empty strings in text columns are read as None. If false, they are kept and the cache is bypassed. Ignored when streaming. Defaults to true.
+
+        #### Returns:
+        - selection (None|Tabular|SpilledTabular|Iterator[Tabular]): The output selection of the query.
+
+        #### Usage:
+        >>> executor.execute_query("SELECT 'value' AS [column]")
+        >>> for batch in executor.execute_query("SELECT * FROM [table]", stream = True):
+                ...
+        >>> executor.execute_query("EXEC [dbo].[usp_orders] @ids = ?", (ids,))
+        >>> executor.execute_query("EXEC [dbo].[usp_slow]", timeout = 30, cancel = handle)
+        >>> executor.execute_query("SELECT * FROM [dbo].[orders]", retry = True)
+
+        #### History:
+        - 3.18 JRA (2026-10-17): Returns cached results column-based when columnar is set.
+        - 3.17 JRA (2026-10-17): Added blanks_as_none.
+        - 3.16 JRA (2026-10-17): Releases the connection through release_connection.
+        - 3.15 JRA (2026-10-17): Releases the connection when the query fails for any reason, not only when it is cancelled.
+        - 3.14 JRA (2026-10-17): Only retries the query itself when retry is set, connecting still follows the retry policy.
+        - 3.13 JRA (2026-10-17): Empty strings in text columns are read as None again, as they were before from_trusted.
+        - 3.12 JRA (2026-10-17): Added spill_bytes.
+        - 3.11 JRA (2026-10-17): Added timeout and cancel.
+        - 3.10 JRA (2026-10-17): Does not cache queries with table-valued parameters.
+        - 3.9 JRA (2026-10-17): Records metrics.
+        - 3.8 JRA (2026-10-17): Retries transient failures under the retry policy.
+        - 3.7 JRA (2026-10-17): Bypasses the cache inside a session.
+        - 3.6 JRA (2026-10-17): Results are built with Tabular.from_trusted.
+        - 3.5 JRA (2026-10-17): Added columnar.
+        - 3.4 JRA (2026-10-17): Forgets catalog cache entries of tables changed by DDL.
+        - 3.3 JRA (2026-10-17): Added use_cache and cache_ttl.
+        - 3.2 JRA (2026-10-17): Added stream and batch_size.
+        - 3.1 JRA (2024-02-23): Added support for queries with no returns.
+        - 3.0 JRA (2024-02-19): Refactored to use Tabular.
+        - 2.0 JRA (2024-02-12): Revamped error handling.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if stream:
+            return self.iter_query(query, values, commit = commit, name = name, batch_size = batch_size, timeout = timeout, cancel = cancel)
+
+        if self.metrics is not None:
+            start = monotonic()
+            connected = self.__connect_seconds
+        cacheable = False
+        if self.cache is not None and use_cache:
+            if QueryCache.is_read(query):
+                if self.__session_depth > 0 or self.__has_table_values(values) or not blanks_as_none:
+                    selection = None
+                else:
+                    selection = self.cache.get(query, values, name)
+                if selection is not None:
+                    LOG.sql(f"Returning cached result of script against {str(self)}:\n{query}\nValues: {values}.")
+                    if columnar:
+                        selection.transpose(row_based = False)
+                        selection.data = self.__typed_columns([list(column) for column in selection.data], selection.columns, selection.datatypes)
+                    if self.metrics is not None:
+                        self.metrics.record('execute_query', name, fetch = monotonic() - start, rows = selection.row_count, bytes = QueryMetrics.estimate_bytes(selection), cached = True)
+                    return selection
+                cacheable = self.__session_depth == 0 and not self.__has_table_values(values) and blanks_as_none
+            else:
+                for table in QueryCache.tables(query):
+                    self.cache.invalidate(table)
+        self.__forget_tables(query)
+
+        try:
+            if retry and not self.connected and self.retry_policy is not None:
+                self.connect_to_mssql(auto_commit = commit)
+                def run():
+                    if not self.connected:
+                        self.connect_to_mssql(auto_commit = commit)
+                    try:
+                        self.__run(query, values, timeout, cancel)
+                    except Exception as e:
+                        if self.retry_policy.is_transient(e):
+                            self.__discard_connection()
+                        raise
+                self.retry_policy.run(run, f"running query on {self}")
+            else:
+                if not self.connected:
+                    self.connect_to_mssql(auto_commit = commit)
+                self.__run(query, values, timeout, cancel)
+            if self.metrics is not None:
+                executed = monotonic()
+
+            spill_bytes = self.spill_bytes if spill_bytes is None else spill_bytes
+            if columnar or spill_bytes:
+                columns, datatypes = self.__describe()
+                selection = None
+                if columns is not None:
+                    try:
+                        if columnar:
+                            selection = self.__fetch_columnar(columns, datatypes, name, batch_size, blanks_as_none)
+                        else:
+                            selection = self.__fetch_spilling(columns, datatypes, name, batch_size, spill_bytes, blanks_as_none)
+                    except Exception as e:
+                        self.__check_interrupted(e, timeout, cancel)
+                        raise
+                    if cacheable and not isinstance(selection, SpilledTabular):
+                        self.cache.put(query, values, selection, cache_ttl)
+            else:
+                try:
+                    selection = self.cursor.fetchall()
+                except pyodbc.ProgrammingError as e:
+                    self.__check_interrupted(e, timeout, cancel)
+                    LOG.warning(f"Could not retrieve query results. {e}")
+                    selection = None
+                except Exception as e:
+                    self.__check_interrupted(e, timeout, cancel)
+                    LOG.critical(f"Unexpected {type(e)} error occurred whilst retrieving query results on {self}. {e}")
+                    raise
+
+                columns, datatypes = self.__describe()
+
+                if selection is not None:
+                    selection = Tabular.from_trusted(
+                        data = [tuple(row) for row in selection], 
+                        columns = columns,
+                        datatypes = datatypes,
+                        name = name,
+                        blanks_as_none = blanks_as_none
+                    )
+                    if cacheable:
+                        self.cache.put(query, values, selection, cache_ttl)
+        except BaseException:
+            self.release_connection()
+            raise
+
+        self.close_connection(commit)
+        if self.metrics is not None:
+            self.__record_query(name, start, connected, executed, selection)
+        return selection
+
+    def __record_query(self, name: str, start: float, connected: float, executed: float, selection: Tabular|None):
+        """
+        ### __record_query
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Records the metrics of a query that has been executed and fetched. The connect time is the growth of the handler's connect time since the query started, and is not counted in its execute time.
+
+        #### Requirements:
+        - QueryMetrics.estimate_bytes
+        - QueryMetrics.record
+
+        #### Parameters:
+        - name (str): The name given to the query.
+        - start (float): The monotonic time the query started.
+        - connected (float): The handler's connect time when the query started.
+        - executed (float): The monotonic time the query finished executing.
+        - selection (Tabular|None): The results of the query.
+
+        #### Usage:
+        >>> self.__record_query(name, start, connected, executed, selection)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        connect = self.__connect_seconds - connected
+        self.metrics.record(
+            'execute_query',
+            name,
+            connect = connect,
+            execute = max(0.0, executed - start - connect),
+            fetch = monotonic() - executed,
+            rows = 0 if selection is None else selection.row_count,
+            bytes = QueryMetrics.estimate_bytes(selection)
+        )
+        return
+
+    def execute_batch(
+        self,
+        queries: str|list[str|tuple[str, tuple]],
+        commit: bool = True,
+        names: list[str] = None,
+        timeout: int = None,
+        cancel: CancelHandle = None
+    ) -> list[Tabular]:
+        """
+        ### execute_batch
+
+        Version: 1.3
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Executes several queries as one batch in a single round trip and reads every result set they return with `cursor.nextset`, so many small lookups share one connection and one execute instead of a connect, execute and close cycle each. A single query, such as a stored procedure returning several result sets, may also be given.
+
+        The queries are joined into one batch after SET NOCOUNT ON, so statements that do not select, such as inserts, do not return result sets. NOCOUNT is turned back off afterwards, so it does not leak to later calls on the connection. Their values are concatenated in order. Statements that must begin a batch, such as CREATE PROCEDURE, cannot be included. The cache is not read, but the batch invalidates cached results of tables its queries change, and DDL queries forget their catalog cache entries.
+
+        #### Requirements:
+        - QueryCache.is_read
+        - QueryCache.tables
+        - QueryCache.invalidate
+        - SQLHandler.__forget_tables
+        - SQLHandler.connect_to_mssql
+        - SQLHandler.__run
+        - SQLHandler.__check_interrupted
+        - SQLHandler.__describe
+        - SQLHandler.__reset_option
+        - SQLHandler.close_connection
+        - QueryMetrics.estimate_bytes
+        - QueryMetrics.record
+
+        #### Parameters:
+        - queries (str|list[str|tuple[str, tuple]]): The queries to run, each optionally paired with its values.
+        - commit (bool): If true, the batch is committed. Ignored inside a session. Defaults to true.
+        - names (list[str]): The names to assign to the results, in order. Defaults to None.
+        - timeout (int): The number of seconds the batch may run for, or 0 for no limit. Defaults to the handler's query_timeout.
+        - cancel (CancelHandle): A handle that another thread can cancel the batch with. Defaults to None.
+
+        #### Returns:
+        - results (list[Tabular]): One Tabular per result set, in the order they were returned.
+
+        #### Usage:
+        >>> schemas, tables = executor.execute_batch([
+                "SELECT [name] FROM sys.schemas",
+                ("SELECT [name] FROM sys.tables WHERE [schema_id] = ?", (1,))
+            ])
+        >>> header, lines = executor.execute_batch("EXEC [dbo].[usp_invoice] 42")
+
+        #### History:
+        - 1.3 JRA (2026-10-17): Turns NOCOUNT back off after the batch.
+        - 1.2 JRA (2026-10-17): Empty strings in text columns are read as None.
+        - 1.1 JRA (2026-10-17): Added timeout and cancel.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(queries, (str, tuple)):
+            queries = [queries]
+        if len(queries) == 0:
+            return []
+        scripts = []
+        values = []
+        for query in queries:
+            if isinstance(query, tuple):
+                query, parameters = query
+                if parameters is not None and not isinstance(parameters, (tuple, list)):
+                    parameters = (parameters,)
+                values.extend(parameters or ())
+            scripts.append(query.strip().rstrip(';'))
+            if self.cache is not None and not QueryCache.is_read(query):
+                for table in QueryCache.tables(query):
+                    self.cache.invalidate(table)
+            self.__forget_tables(query)
+        script = "SET NOCOUNT ON;\n" + ";\n".join(scripts) + ";"
+
+        if self.metrics is not None:
+            start = monotonic()
+            connected = self.__connect_seconds
+        if not self.connected:
+            self.connect_to_mssql(auto_commit = commit)
+        results = []
+        try:
+            try:
+                self.__run(script, tuple(values) or None, timeout, cancel)
+                if self.metrics is not None:
+                    executed = monotonic()
+                while True:
+                    if self.cursor.description is not None:
+                        columns, datatypes = self.__describe()
+                        results.append(Tabular.from_trusted(
+                            data = [tuple(row) for row in self.cursor.fetchall()],
+                            columns = columns,
+                            datatypes = datatypes,
+                            name = names[len(results)] if names is not None and len(results) < len(names) else None,
+                            blanks_as_none = True
+                        ))
+                    if not self.cursor.nextset():
+                        break
+            finally:
+                self.__reset_option('NOCOUNT')
+        except Exception as e:
+            self.__check_interrupted(e, timeout, cancel)
+            LOG.error(f"Batch of {len(scripts)} queries on {self} failed after {len(results)} result sets. {e}")
+            if self.connected:
+                self.close_connection(commit = False)
+            raise
+        self.close_connection(commit)
+        LOG.sql(f"Batch of {len(scripts)} queries returned {len(results)} result sets.")
+        if self.metrics is not None:
+            connect = self.__connect_seconds - connected
+            self.metrics.record(
+                'execute_batch',
+                None,
+                connect = connect,
+                execute = max(0.0, executed - start - connect),
+                fetch = monotonic() - executed,
+                rows = sum(result.row_count for result in results),
+                bytes = sum(QueryMetrics.estimate_bytes(result) for result in results)
+            )
+        return results
+
+    def iter_query(
+        self, 
+        query: str, 
+        values: tuple = None, 
+        commit: bool = True, 
+        name: str = None,
+        batch_size: int = 10000,
+        timeout: int = None,
+        cancel: CancelHandle = None
+    ) -> Iterator[Tabular]:
+        """
+        ### iter_query
+
+        Version: 1.4
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Executes a SQL query and yields the results as Tabular batches of at most `batch_size` rows, fetched with `cursor.fetchmany`. Only one batch is held in memory at a time, so arbitrarily large results can be processed. The connection is held open until the iterator is exhausted or closed.
+
+        If the handler is instrumented, the metrics of the query are recorded under `name` once the iterator is exhausted. The fetch time only counts time spent fetching, not time spent by the consumer between batches.
+
+        A cancel handle can stop the query between or during fetches, raising QueryCancelled.
+
+        #### Requirements:
+        - SQLHandler.connect_to_mssql
+        - SQLHandler.__run
+        - SQLHandler.__check_interrupted
+        - SQLHandler.__describe
+        - SQLHandler.close_connection
+        - QueryMetrics.estimate_bytes
+        - QueryMetrics.record
+
+        #### Parameters:
+        - query (str): The query to run.
+        - values (tuple): The values to substitute into the query. Defaults to None.
+        - commit (bool): If true, the query is committed once the results have been read. Defaults to true.
+        - name (str): The name to assign to each batch and to tag metrics with.
+        - batch_size (int): The maximum number of rows per batch. Defaults to 10000.
+        - timeout (int): The number of seconds the query may run for before its first results, or 0 for no limit. Defaults to the handler's query_timeout.
+        - cancel (CancelHandle): A handle that another thread can cancel the query with. Defaults to None.
+
+        #### Returns:
+        - (Iterator[Tabular]): Yields nothing if the query has no results.
+
+        #### Usage:
+        >>> for batch in executor.iter_query("SELECT * FROM [table]", batch_size = 50000):
+                batch.to_dataframe()
+
+        #### History:
+        - 1.4 JRA (2026-10-17): Empty strings in text columns are read as None again, as they were before from_trusted.
+        - 1.3 JRA (2026-10-17): Added timeout and cancel.
+        - 1.2 JRA (2026-10-17): Records metrics.
+        - 1.1 JRA (2026-10-17): Batches are built with Tabular.from_trusted.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if batch_size < 1:
+            error = "The batch_size must be at least 1."
+            LOG.error(error)
+            raise ValueError(error)
+        if self.metrics is not None:
+            start = monotonic()
+            connected = self.__connect_seconds
+        if not self.connected:
+            self.connect_to_mssql(auto_commit = commit)
+        try:
+            self.__run(query, values, timeout, cancel)
+            if self.metrics is not None:
+                connect = self.__connect_seconds - connected
+                execute = max(0.0, monotonic() - start - connect)
+                fetch, returned, size = 0.0, 0, 0
+            columns, datatypes = self.__describe()
+            batches = 0
+            while columns is not None:
+                if self.metrics is not None:
+                    fetched = monotonic()
+                if cancel is not None and cancel.cancelled:
+                    self.__check_interrupted(None, timeout, cancel)
+                try:
+                    rows = self.cursor.fetchmany(batch_size)
+                except Exception as e:
+                    self.__check_interrupted(e, timeout, cancel)
+                    LOG.critical(f"Unexpected {type(e)} error occurred whilst retrieving query results on {self}. {e}")
+                    raise
+                if len(rows) == 0:
+                    break
+                batches += 1
+                LOG.sql(f"Fetched batch {batches} of {len(rows)} rows from {str(self)}.")
+                batch = Tabular.from_trusted(
+                    data = [tuple(row) for row in rows],
+                    columns = list(columns),
+                    datatypes = list(datatypes),
+                    name = name,
+                    blanks_as_none = True
+                )
+                if self.metrics is not None:
+                    fetch += monotonic() - fetched
+                    returned += batch.row_count
+                    size += QueryMetrics.estimate_bytes(batch)
+                yield batch
+        except BaseException:
+            if self.connected:
+                self.close_connection(commit = False)
+            raise
+        self.close_connection(commit)
+        if self.metrics is not None:
+            self.metrics.record('iter_query', name, connect = connect, execute = execute, fetch = fetch, rows = returned, bytes = size)
+        return
+    
+    # def query_columns(self, query: str = None, values: tuple = None):
+    #     """
+    #     ### query_columns
+
+    #     Version: 2.0
+    #     Authors: JRA
+    #     Date: 2024-02-12
+
+    #     #### Explanation:
+    #     Retrieves the columns of a query or the most recently executed query.
+
+    #     #### Requirements:
+    #     - SQLHandler.execute_query
+
+    #     #### Parameters:
+    #     - query (str): The query to execute if needed. Defaults to the previous query.
+    #     - values (tuple): The values to substitute into the query. Defaults to previous query.
+
+    #     #### Returns:
+    #     - cols (list[str]): A list of columns of the output of the select query.
+
+    #     #### Usage:
+    #     >>> executor.query_columns()
+    #     ['column']
+
+    #     #### History:
+    #     - 2.0 JRA (2024-02-09): Revamped error handling.
+    #     - 1.0 JRA (2024-02-09): Initial version.
+    #     """
+    #     if query is not None:
+    #         self.execute_query(query, values, commit = False)
+
+    #     try:
+    #         cols = [col[0] for col in self.description]
+    #     except TypeError as e:
+    #         LOG.warning(f"No query description available from {self}. {e}")
+    #         raise
+    #     except Exception as e:
+    #         LOG.critical(f"Unexpected {type(e)} error occurred when reading cursor description from {self}. {e}")
+    #         raise
+    #     else:
+    #         return cols
+
+    def extract_incremental(
+        self,
+        schema: str,
+        table: str,
+        watermark_column: str,
+        store: WatermarkStore|str = None,
+        columns: list[str] = None,
+        where: str = None,
+        name: str = None,
+        batch_size: int = 10000,
+        key: str = None
+    ) -> Iterator[Tabular]:
+        """
+        ### extract_incremental
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Extracts the rows of a table added or changed since the last extraction, in streamed Tabular batches. The table must have a monotonically increasing watermark column, such as a rowversion, modified date or identity. The current maximum of the column is read first and only rows above the stored watermark and up to that maximum are selected, so rows written during the extraction are left for the next one. Once every batch has been consumed, the maximum is stored as the new watermark. If the iterator is not exhausted, the watermark is not advanced and the same rows are extracted again next time. The first extraction reads the whole table.
+
+        Like iter_query, nothing runs until the first batch is requested.
+
+        #### Requirements:
+        - WatermarkStore.get
+        - WatermarkStore.set
+        - SQLHandler.__schema_table_to_object_name
+        - SQLHandler.execute_query
+        - SQLHandler.iter_query
+
+        #### Parameters:
+        - schema (str): The schema of the table.
+        - table (str): The table to extract from.
+        - watermark_column (str): The monotonically increasing column.
+        - store (WatermarkStore|str): The store of the watermark, or the path of a JSON file to store it in. Defaults to the control table of this database.
+        - columns (list[str]): The columns to extract. Defaults to all columns.
+        - where (str): An additional condition the extracted rows must meet. Defaults to None.
+        - name (str): The name to assign to each batch. Defaults to the table name.
+        - batch_size (int): The maximum number of rows per batch. Defaults to 10000.
+        - key (str): The key of the watermark in the store. Defaults to the object name and watermark column.
+
+        #### Returns:
+        - (Iterator[Tabular]): Yields nothing if there are no new rows.
+
+        #### Usage:
+        >>> for batch in executor.extract_incremental('dbo', 'orders', 'row_version', 'watermarks.json'):
+                target.insert('stage', 'orders', batch)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(store, str):
+            store = WatermarkStore(file = store)
+        elif store is None:
+            store = WatermarkStore(handler = self)
+        object_name = self.__schema_table_to_object_name(schema, table)
+        key = key or f"{object_name}.[{watermark_column}]"
+        column_list = '*' if columns is None else '[' + '], ['.join(columns) + ']'
+
+        last = store.get(key)
+        result = self.execute_query(
+            query = f"SELECT MAX([{watermark_column}]) FROM {object_name}{'' if where is None else ' WHERE ' + where}",
+            use_cache = False
+        )
+        upper = None if result is None or result.row_count == 0 else result.data[0][0]
+        if upper is None or (last is not None and upper <= last):
+            LOG.sql(f"No new rows in {object_name} past the watermark {last}.")
+            return
+
+        conditions = [f"[{watermark_column}] <= ?"]
+        values = [upper]
+        if last is not None:
+            conditions.insert(0, f"[{watermark_column}] > ?")
+            values.insert(0, last)
+        if where is not None:
+            conditions.append(f"({where})")
+        query = f"SELECT {column_list} FROM {object_name} WHERE {' AND '.join(conditions)}"
+        LOG.sql(f"Extracting rows of {object_name} with {watermark_column} past {last} up to {upper}...")
+        rows = 0
+        for batch in self.iter_query(query, tuple(values), name = name or table, batch_size = batch_size):
+            rows += batch.row_count
+            yield batch
+        store.set(key, upper)
+        LOG.sql(f"Extracted {rows} rows of {object_name}.")
+        return
+
+    def paginate(
+        self,
+        query: str,
+        key_columns: list[str],
+        page_size: int = 1000,
+        values: tuple = None,
+        descending: bool|list[bool] = False,
+        name: str = None
+    ) -> Iterator[Tabular]:
+        """
+        ### paginate
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Pages through the results of a query with keyset, or seek, pagination. Each page is selected as the first `page_size` rows, in the order of the key columns, after the last key of the previous page, so with an index on the keys every page costs the same however deep it is, unlike OFFSET and FETCH which read and discard every earlier row. Keys may be composite and each column may be sorted in either direction.
+
+        The key columns must be returned by the query, must not be null and must be unique together, otherwise rows may be skipped or repeated. The query is used as a derived table, so it must not end in an ORDER BY. Pages are selected lazily, each as its own query, so rows changed between pages are seen as of the page they fall in. Since pages are read-only, each is retried under the handler's retry policy on transient errors. Empty strings are kept until the last key of a page has been taken, so an empty string key is sought as itself rather than as null, and are then read as None as usual.
+
+        #### Requirements:
+        - SQLHandler.execute_query
+        - Tabular.blanks_to_none
+
+        #### Parameters:
+        - query (str): The query to page through.
+        - key_columns (list[str]): The columns that order and identify rows.
+        - page_size (int): The maximum number of rows per page. Defaults to 1000.
+        - values (tuple): The values to substitute into the query. Defaults to None.
+        - descending (bool|list[bool]): Whether each key column is sorted descending, or one flag for all of them. Defaults to false.
+        - name (str): The name to assign to each page.
+
+        #### Returns:
+        - (Iterator[Tabular]): Yields nothing if the query has no results.
+
+        #### Usage:
+        >>> for page in executor.paginate("SELECT * FROM [dbo].[orders]", ['order_date', 'order_id'], 5000, descending = [True, False]):
+                export(page)
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Seeks past empty string keys as themselves rather than as null.
+        - 1.1 JRA (2026-10-17): Retries pages on transient errors.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+        if isinstance(descending, bool):
+            descending = [descending]*len(key_columns)
+        if len(key_columns) == 0 or len(descending) != len(key_columns):
+            error = "paginate needs at least one key column and one sort direction per key column."
+            LOG.error(error)
+            raise ValueError(error)
+        if page_size < 1:
+            error = "The page_size must be at least 1."
+            LOG.error(error)
+            raise ValueError(error)
+        if values is not None and not isinstance(values, (tuple, list)):
+            values = (values,)
+        values = tuple(values or ())
+        keys = [f"[{column.strip('[]')}]" for column in key_columns]
+        order = ', '.join(f"{key} {'DESC' if desc else 'ASC'}" for key, desc in zip(keys, descending))
+        seeks = []
+        for k in range(len(keys)):
+            terms = [f"{key} = ?" for key in keys[:k]] + [f"{keys[k]} {'<' if descending[k] else '>'} ?"]
+            seeks.append('(' + ' AND '.join(terms) + ')')
+        first_page = f"SELECT TOP ({page_size}) * FROM (\n{query}\n) AS [page] ORDER BY {order}"
+        next_page = f"SELECT TOP ({page_size}) * FROM (\n{query}\n) AS [page] WHERE {' OR '.join(seeks)} ORDER BY {order}"
+
+        last = None
+        positions = None
+        pages = 0
+        while True:
+            if last is None:
+                page = self.execute_query(first_page, values or None, name = name, use_cache = False, retry = True, blanks_as_none = False)
+            else:
+                seek_values = tuple(value for k in range(len(keys)) for value in last[:k + 1])
+                page = self.execute_query(next_page, values + seek_values, name = name, use_cache = False, retry = True, blanks_as_none = False)
+            if page is None or page.row_count == 0:
+                break
+            pages += 1
+            page.transpose(row_based = True)
+            if positions is None:
+                lookup = [column.lower() for column in page.columns]
+                missing = [column for column in key_columns if column.strip('[]').lower() not in lookup]
+                if len(missing) > 0:
+                    error = f"The key columns {missing} are not returned by the query."
+                    LOG.error(error)
+                    raise ValueError(error)
+                positions = [lookup.index(column.strip('[]').lower()) for column in key_columns]
+            last = tuple(page.data[-1][position] for position in positions)
+            page.data = Tabular.blanks_to_none(page.data, page.datatypes)
+            LOG.sql(f"Read page {pages} of {page.row_count} rows, ending at key {last}.")
+            yield page
+            if page.row_count < page_size:
+                break
+        return
+
+    @staticmethod
+    def __range_boundaries(low, high, partitions: int) -> list|None:
+        """
+        ### __range_boundaries
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Splits the range between the minimum and maximum of a partition column into evenly spaced boundaries. Only numbers, dates and datetimes can be split.
+
+        #### Parameters:
+        - low: The minimum of the column.
+        - high: The maximum of the column.
+        - partitions (int): The number of partitions.
+
+        #### Returns:
+        - (list|None): The ascending, distinct upper bounds of every partition but the last, or None if the range cannot be split.
+
+        #### Usage:
+        >>> SQLHandler.__range_boundaries(0, 100, 4)
+        [25, 50, 75]
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(low, bool) or type(low) is not type(high):
+            return None
+        if isinstance(low, Integral):
+            boundaries = [low + (high - low)*index//partitions for index in range(1, partitions)]
+        elif isinstance(low, (float, Decimal, datetime, date)):
+            boundaries = [low + (high - low)*index/partitions for index in range(1, partitions)]
+        else:
+            return None
+        return sorted(set(boundary for boundary in boundaries if low <= boundary < high))
+
+    def parallel_select(
+        self,
+        query: str,
+        partition_column: str,
+        partitions: int = 4,
+        values: tuple = None,
+        name: str = None,
+        stream: bool = False,
+        boundaries: str = 'range'
+    ) -> Tabular|Iterator[Tabular]|None:
+        """
+        ### parallel_select
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads the results of a query over several connections at once. The query is split into ranges of a partition column and each range is selected concurrently on a handler spawned from this one, so large extracts are not limited to the throughput of one connection. Rows where the partition column is null are read with the first range.
+
+        With `boundaries = 'range'`, the minimum and maximum of the column are read and split evenly, which is cheap but suits evenly distributed numbers, dates and datetimes. With `boundaries = 'ntile'`, the upper bound of each NTILE of the column is read instead, which sorts the column once but gives evenly sized partitions of skewed or non-numeric columns. Columns that cannot be split evenly fall back to NTILE boundaries.
+
+        The partitions are separate queries, so they do not read one consistent snapshot unless the database uses snapshot isolation or the data is not changing. The query is used as a derived table, so it must not end in an ORDER BY, and the order of rows is by partition. Since partitions are read-only, each is retried under the handler's retry policy on transient errors. A PartitionError is raised once all partitions have finished if any of them failed, and the connection of a failed partition is released so the pool stays usable.
+
+        #### Requirements:
+        - SQLHandler.execute_query
+        - SQLHandler.__range_boundaries
+        - SQLHandler.spawn
+        - SQLHandler.release_connection
+        - concurrent.futures.ThreadPoolExecutor
+
+        #### Parameters:
+        - query (str): The query to read.
+        - partition_column (str): The column of the query to partition on. Ideally indexed.
+        - partitions (int): The number of partitions, threads and connections. Pooled handlers should have a pool_size of at least this. Defaults to 4.
+        - values (tuple): The values to substitute into the query. Defaults to None.
+        - name (str): The name to assign to the results.
+        - stream (bool): If true, the partitions are yielded as Tabular batches in order as soon as each and all before it have been read, rather than concatenated into a single Tabular. Defaults to false.
+        - boundaries (str): How partition boundaries are found, either 'range' or 'ntile'. Defaults to 'range'.
+
+        #### Returns:
+        - (Tabular|Iterator[Tabular]|None): The results, None if the query has no results.
+
+        #### Usage:
+        >>> executor = SQLHandler(environment = 'dev', pool_size = 8)
+        >>> executor.parallel_select("SELECT * FROM [dbo].[orders]", 'order_id', partitions = 8)
+        >>> for batch in executor.parallel_select("SELECT * FROM [dbo].[events]", 'event_date', boundaries = 'ntile', stream = True):
+                ...
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Releases the connection of a failed partition.
+        - 1.1 JRA (2026-10-17): Retries partitions on transient errors.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if boundaries not in ('range', 'ntile'):
+            error = f"Unknown boundaries {boundaries}, expected 'range' or 'ntile'."
+            LOG.error(error)
+            raise ValueError(error)
+        if values is not None and not isinstance(values, (tuple, list)):
+            values = (values,)
+        values = tuple(values or ())
+        column = f"[{partition_column.strip('[]')}]"
+        source = f"(\n{query}\n) AS [source]"
+
+        bounds = None
+        if partitions > 1 and boundaries == 'range':
+            result = self.execute_query(f"SELECT MIN({column}), MAX({column}) FROM {source}", values or None, use_cache = False)
+            low, high = result.data[0] if result is not None and result.row_count > 0 else (None, None)
+            if low is None:
+                bounds = []
+            else:
+                bounds = self.__range_boundaries(low, high, partitions)
+                if bounds is None:
+                    LOG.warning(f"Cannot split {partition_column} of type {type(low)} evenly, using NTILE boundaries.")
+        if partitions > 1 and bounds is None:
+            result = self.execute_query(
+                f"SELECT MAX([value]) FROM (SELECT {column} AS [value], NTILE({partitions}) OVER (ORDER BY {column}) AS [tile] FROM {source} WHERE {column} IS NOT NULL) AS [tiles] GROUP BY [tile] ORDER BY [tile]",
+                values or None,
+                use_cache = False
+            )
+            bounds = [] if result is None else [row[0] for row in result.data][:-1]
+        bounds = bounds or []
+
+        ranges = []
+        for index in range(len(bounds) + 1):
+            conditions, limits = [], []
+            if index > 0:
+                conditions.append(f"{column} > ?")
+                limits.append(bounds[index - 1])
+            if index < len(bounds):
+                conditions.append(f"{column} <= ?")
+                limits.append(bounds[index])
+            condition = ' AND '.join(conditions) or '1 = 1'
+            if index == 0:
+                condition = f"({condition} OR {column} IS NULL)"
+            ranges.append((f"SELECT * FROM {source} WHERE {condition}", values + tuple(limits)))
+        LOG.sql(f"Selecting {len(ranges)} partition{'s' if len(ranges) > 1 else ''} of {partition_column} from {self}...")
+
+        def partition(number: int, script: str, parameters: tuple) -> Tabular|None:
+            worker = self.spawn()
+            try:
+                return worker.execute_query(script, parameters or None, name = name, use_cache = False, retry = True)
+            except Exception as e:
+                LOG.error(f"Partition {number} of parallel select on {self} failed. {e}")
+                worker.release_connection()
+                raise
+
+        def results() -> Iterator[Tabular]:
+            failures = {}
+            rows = 0
+            with ThreadPoolExecutor(max_workers = len(ranges), thread_name_prefix = 'pyjra-select') as executor:
+                futures = [executor.submit(partition, number, script, parameters) for number, (script, parameters) in enumerate(ranges)]
+                for number, future in enumerate(futures):
+                    try:
+                        selection = future.result()
+                    except Exception as e:
+                        failures[number] = e
+                        continue
+                    if selection is not None and len(failures) == 0:
+                        rows += selection.row_count
+                        yield selection
+            if len(failures) > 0:
+                error = f"{len(failures)} partition{'s' if len(failures) > 1 else ''} of the parallel select on {self} failed."
+                LOG.error(error)
+                raise PartitionError(error, failures, rows)
+            LOG.sql(f"Selected {rows} rows over {len(ranges)} partitions.")
+            return
+
+        if stream:
+            return results()
+        selections = list(results())
+        if len(selections) == 0:
+            return None
+        data = []
+        for selection in selections:
+            selection.transpose(row_based = True)
+            data.extend(selection.data)
+        return Tabular.from_trusted(
+            data = data,
+            columns = selections[0].columns,
+            datatypes = selections[0].datatypes,
+            name = name
+        )
+
+    def __insert_batches(
+        self,
+        data: Tabular|pd.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular],
+        columns: list[str] = None,
+        batch_size: int = None,
+        partitions: int = None
+    ) -> tuple[list[str], Iterator[list[tuple]]]:
+        """
+        ### __insert_batches
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Standardises the data given to `insert` into its columns and an iterator of row batches. Iterables are consumed lazily so that only one batch is held in memory at a time. Timezone aware datetimes are converted to UTC, as `write_bulk_file` does, since pyodbc would otherwise send their wall-clock time.
+
+        #### Parameters:
+        - data (Tabular|pandas.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular]): The values to be inserted.
+        - columns (list[str]): The columns of the data. Required for iterables of tuples if the columns are to be named in the insert.
+        - batch_size (int): The maximum number of rows per batch. Defaults to all rows of a Tabular, DataFrame or list in one batch, or each Tabular of an iterable of Tabulars in one batch, or 10000 rows of an iterable of tuples.
+        - partitions (int): If populated and batch_size is not, a Tabular, DataFrame or list is split into this many equal batches. Defaults to None.
+
+        #### Returns:
+        - columns (list[str]): The columns of the data. Empty if unknown.
+        - batches (Iterator[list[tuple]])
+
+        #### Usage:
+        >>> columns, batches = executor.__insert_batches(data, batch_size = 10000)
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Converts timezone aware datetimes to UTC.
+        - 1.1 JRA (2026-10-17): Added partitions.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = Tabular(data = data)
+        elif isinstance(data, list):
+            data = Tabular(data = data, columns = columns)
+
+        if isinstance(data, Tabular):
+            data.transpose(row_based = True)
+            rows = data.data
+            size = batch_size or max(-(-len(rows)//(partitions or 1)), 1)
+            return list(data.columns), map(SQLHandler.__utc_datetimes, (rows[r:(r + size)] for r in range(0, len(rows), size)))
+
+        try:
+            data = iter(data)
+        except TypeError:
+            error = f"Invalid datatype passed to `data` argument of `SQLHandler.insert`."
+            LOG.error(error)
+            raise ValueError(error)
+        try:
+            first = next(data)
+        except StopIteration:
+            return list(columns or []), iter(())
+        data = chain((first,), data)
+
+        if isinstance(first, Tabular):
+            def batches():
+                for chunk in data:
+                    chunk.transpose(row_based = True)
+                    size = batch_size or max(chunk.row_count, 1)
+                    for r in range(0, chunk.row_count, size):
+                        yield chunk.data[r:(r + size)]
+            return list(first.columns), map(SQLHandler.__utc_datetimes, batches())
+        elif isinstance(first, tuple):
+            size = batch_size or 10000
+            def batches():
+                while True:
+                    batch = list(islice(data, size))
+                    if len(batch) == 0:
+                        return
+                    yield batch
+            return list(columns or []), map(SQLHandler.__utc_datetimes, batches())
+        else:
+            error = f"Invalid datatype {type(first)} in the iterable passed to `data` argument of `SQLHandler.insert`."
+            LOG.error(error)
+            raise ValueError(error)
+
+    @staticmethod
+    def __utc_datetimes(batch: list[tuple]) -> list[tuple]:
+        """
+        ### __utc_datetimes
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Converts the timezone aware datetimes of a batch to naive UTC datetimes, the instant a datetimeoffset column stores them at with an offset of +00:00. Columns are recognised as aware from their first non-null value, so batches without aware datetimes are returned as they are after reading one value per column.
+
+        #### Parameters:
+        - batch (list[tuple]): The rows of the batch.
+
+        #### Returns:
+        - batch (list[tuple])
+
+        #### Usage:
+        >>> SQLHandler.__utc_datetimes([(1, datetime(2026, 10, 17, 12, tzinfo = timezone(timedelta(hours = 1))))])
+        [(1, datetime(2026, 10, 17, 11))]
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if len(batch) == 0:
+            return batch
+        aware = []
+        for c in range(len(batch[0])):
+            value = next((row[c] for row in batch if row[c] is not None), None)
+            if isinstance(value, datetime) and value.tzinfo is not None:
+                aware.append(c)
+        if len(aware) == 0:
+            return batch
+        def utc(value):
+            return value.astimezone(timezone.utc).replace(tzinfo = None) if isinstance(value, datetime) and value.tzinfo is not None else value
+        return [tuple(utc(value) if c in aware else value for c, value in enumerate(row)) for row in batch]
+
+    def spawn(self) -> 'SQLHandler':
+        """
+        ### spawn
+
+        Version: 1.7
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Creates a new handler for the same database that shares this handler's connection pool, cache, catalog cache, retry policy, metrics, query timeout and spill settings, so that work can run concurrently on separate connections. A handler holds one connection at a time, so each concurrent task should use its own spawned handler.
+
+        #### Returns:
+        - worker (SQLHandler)
+
+        #### Usage:
+        >>> worker = executor.spawn()
+
+        #### History:
+        - 1.7 JRA (2026-10-17): Shares the spill settings.
+        - 1.6 JRA (2026-10-17): Shares the query timeout.
+        - 1.5 JRA (2026-10-17): Shares the metrics.
+        - 1.4 JRA (2026-10-17): Shares the retry policy.
+        - 1.3 JRA (2026-10-17): Shares the catalog cache.
+        - 1.2 JRA (2026-10-17): Shares the cache.
+        - 1.1 JRA (2026-10-17): Made public, renamed from __worker.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        worker = SQLHandler(connection_string = self.__connection_string, retry_wait = self.retry_wait, cache = self.cache, retry_policy = self.retry_policy, metrics = self.metrics, query_timeout = self.query_timeout, spill_bytes = self.spill_bytes, spill_directory = self.spill_directory)
+        worker.pool = self.pool
+        worker.__catalog = self.__catalog
+        return worker
+
+    @staticmethod
+    def __input_sizes(datatypes: list[str], batch: list[tuple]) -> list[tuple]:
+        """
+        ### __input_sizes
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Computes the parameter size hints passed to `cursor.setinputsizes` before a batch is inserted, so that fast_executemany binds every parameter with a known type and a bounded buffer. Sizes come from the datatypes of the target columns. Columns declared as (max) are sized to the widest value in the batch, and only bound as (max) if that exceeds the largest fixed size. Columns without a known datatype are inferred from the values of the batch.
+
+        #### Requirements:
+        - SQLHandler.__column_datatype
+
+        #### Parameters:
+        - datatypes (list[str]): The SQL Server datatypes of the target columns, in the order of the values in each row. Entries may be None.
+        - batch (list[tuple]): The rows to insert.
+
+        #### Returns:
+        - sizes (list[tuple]): A (type, size, digits) tuple for each parameter, or None where no hint applies.
+
+        #### Usage:
+        >>> SQLHandler.__input_sizes(['int', 'nvarchar(max)'], [(1, 'a'), (2, 'bcd')])
+        [(4, 0, 0), (-9, 3, 0)]
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        codes = {
+            'tinyint': pyodbc.SQL_TINYINT,
+            'smallint': pyodbc.SQL_SMALLINT,
+            'int': pyodbc.SQL_INTEGER,
+            'bigint': pyodbc.SQL_BIGINT,
+            'bit': pyodbc.SQL_BIT,
+            'float': pyodbc.SQL_DOUBLE,
+            'real': pyodbc.SQL_REAL,
+            'uniqueidentifier': pyodbc.SQL_GUID
+        }
+        sizes = []
+        for c in range(len(batch[0]) if len(batch) > 0 else 0):
+            datatype = datatypes[c] if c < len(datatypes) else None
+            if datatype is None:
+                datatype = SQLHandler.__column_datatype(row[c] for row in batch)
+            if datatype is None:
+                sizes.append(None)
+                continue
+            name, _, arguments = datatype.lower().partition('(')
+            arguments = [argument.strip() for argument in arguments.rstrip(')').split(',')] if arguments else []
+            if name in codes:
+                sizes.append((codes[name], 0, 0))
+            elif name in ('nvarchar', 'nchar', 'varchar', 'char', 'varbinary', 'binary'):
+                binary = name.endswith('binary')
+                if len(arguments) > 0 and arguments[0] != 'max':
+                    size = int(arguments[0])
+                else:
+                    limit = 8000 if binary or not name.startswith('n') else 4000
+                    size = max((len(value) if isinstance(value, (str, bytes, bytearray)) else len(str(value)) for row in batch if (value := row[c]) is not None), default = 1)
+                    size = max(size, 1) if size <= limit else 0
+                sizes.append((pyodbc.SQL_VARBINARY if binary else pyodbc.SQL_WVARCHAR, size, 0))
+            elif name in ('decimal', 'numeric'):
+                precision, scale = (int(arguments[0]), int(arguments[1]) if len(arguments) > 1 else 0) if len(arguments) > 0 else (18, 0)
+                sizes.append((pyodbc.SQL_DECIMAL, precision, scale))
+            elif name in ('datetime2', 'datetime', 'smalldatetime'):
+                scale = {'datetime': 3, 'smalldatetime': 0}.get(name, int(arguments[0]) if len(arguments) > 0 else 7)
+                sizes.append((pyodbc.SQL_TYPE_TIMESTAMP, 20 + scale if scale > 0 else 19, scale))
+            elif name == 'date':
+                sizes.append((pyodbc.SQL_TYPE_DATE, 10, 0))
+            elif name == 'time':
+                scale = int(arguments[0]) if len(arguments) > 0 else 7
+                sizes.append((pyodbc.SQL_SS_TIME2, 9 + scale if scale > 0 else 8, scale))
+            else:
+                sizes.append(None)
+        return sizes
+
+    def __executemany(self, cursor: pyodbc.Cursor, cmd: str, batch: list[tuple], sized: bool = True, datatypes: list[str] = None):
+        """
+        ### __executemany
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Sends a batch of rows with `executemany`. If sized, the parameter size hints of the batch are set first and cleared afterwards, even if the batch fails. Otherwise, later parameterised queries on the same cursor, such as those in a session, would be bound with stale types and sizes.
+
+        #### Requirements:
+        - SQLHandler.__input_sizes
+
+        #### Parameters:
+        - cursor (pyodbc.Cursor): The cursor to send the batch on.
+        - cmd (str): The parameterised statement.
+        - batch (list[tuple]): The rows to send.
+        - sized (bool): If true, parameter size hints are set for the batch. Defaults to true.
+        - datatypes (list[str]): The datatypes of the target columns, for the parameter size hints. Defaults to None.
+
+        #### Usage:
+        >>> self.__executemany(self.cursor, "INSERT INTO [schema].[table] VALUES (?, ?)", batch, fast_execute, datatypes)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if not sized:
+            cursor.executemany(cmd, batch)
+            return
+        cursor.setinputsizes(self.__input_sizes(datatypes, batch))
+        try:
+            cursor.executemany(cmd, batch)
+        finally:
+            cursor.setinputsizes(None)
+        return
+
+    def __insert_isolating(
+        self,
+        cmd: str,
+        batch: list[tuple],
+        fast_execute: bool = True,
+        datatypes: list[str] = None
+    ) -> tuple[int, list[tuple]]:
+        """
+        ### __insert_isolating
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Inserts a batch behind a savepoint. If the insert fails on the data, such as a constraint violation or a conversion error, the batch is rolled back to the savepoint and split in half, and each half is inserted the same way until the failing rows are isolated. The remaining rows are still inserted with `executemany`, and with fast_executemany if enabled. If the rollback to the savepoint fails, the rows of the failed part may still be in the transaction, so the error is raised and the insert fails rather than rejecting the wrong rows.
+
+        Must be called inside a session.
+
+        #### Requirements:
+        - SQLHandler.session
+        - SQLHandler.__executemany
+
+        #### Parameters:
+        - cmd (str): The parameterised insert statement.
+        - batch (list[tuple]): The rows to insert.
+        - fast_execute (bool): If true, parameter size hints are set before each insert. Defaults to true.
+        - datatypes (list[str]): The datatypes of the target columns, for the parameter size hints. Defaults to None.
+
+        #### Returns:
+        - rows (int): The number of rows inserted.
+        - rejects (list[tuple]): The rows that could not be inserted, each followed by its error message.
+
+        #### Usage:
+        >>> self.__insert_isolating("INSERT INTO [schema].[table] VALUES (?, ?)", batch)
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Fails when a part cannot be rolled back to its savepoint.
+        - 1.1 JRA (2026-10-17): Clears the parameter size hints after each batch.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        rows = 0
+        rejects = []
+        pending = [batch]
+        while len(pending) > 0:
+            part = pending.pop()
+            try:
+                with self.session():
+                    self.__executemany(self.cursor, cmd, part, fast_execute, datatypes)
+            except (pyodbc.IntegrityError, pyodbc.DataError) as e:
+                if len(part) == 1:
+                    LOG.sql(f"Rejected row {part[0]}. {e}")
+                    rejects.append(tuple(part[0]) + (str(e),))
+                else:
+                    middle = len(part)//2
+                    pending.append(part[middle:])
+                    pending.append(part[:middle])
+                continue
+            rows += len(part)
+        return rows, rejects
+
+    def __parallel_insert(
+        self,
+        object_name: str,
+        columns: list[str],
+        batches: Iterator[list[tuple]],
+        parallel: int,
+        atomic: bool = True,
+        fast_execute: bool = True,
+        progress: Callable[[int, int], None] = None,
+        datatypes: list[str] = None
+    ) -> int:
+        """
+        ### __parallel_insert
+
+        Version: 1.3
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Inserts batches concurrently from a pool of threads, each on its own connection. Each batch is a partition that is committed on its own.
+        
+        If atomic, each thread loads into its own staging table and the staging tables are moved into the target in a single transaction with XACT_ABORT on once every partition has succeeded, otherwise the staging tables are dropped. If the move fails, it is rolled back, the staging tables are dropped and the error is raised. If not atomic, partitions are inserted straight into the target and failed partitions are skipped. Either way, a PartitionError is raised once all partitions have finished if any of them failed.
+
+        #### Requirements:
+        - SQLHandler.spawn
+        - SQLHandler.__executemany
+        - SQLHandler.session
+        - SQLHandler.execute_query
+        - concurrent.futures.ThreadPoolExecutor
+
+        #### Parameters:
+        - object_name (str): The bracket wrapped name of the target table.
+        - columns (list[str]): The columns to insert to. May be empty to insert to all columns.
+        - batches (Iterator[list[tuple]]): The partitions to insert.
+        - parallel (int): The number of threads and connections to use.
+        - atomic (bool): If true, either all partitions are inserted or none are. Defaults to true.
+        - fast_execute (bool): If true, fast execute is utilised. Defaults to true.
+        - progress (Callable[[int, int], None]): Called after each partition with the number of partitions and rows inserted so far. Defaults to None.
+        - datatypes (list[str]): The datatypes of the target columns. If given with fast_execute, parameter size hints are set for each partition. Defaults to None.
+
+        #### Returns:
+        - rows (int): The number of rows inserted.
+
+        #### Usage:
+        >>> executor.__parallel_insert('[schema].[table]', ['column'], batches, 4)
+
+        #### History:
+        - 1.3 JRA (2026-10-17): Clears the parameter size hints after each partition.
+        - 1.2 JRA (2026-10-17): Moves the staging tables in one transaction, rather than committing each statement.
+        - 1.1 JRA (2026-10-17): Added datatypes.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        column_list = '([' + '], ['.join(columns) + '])' if len(columns) > 0 else ''
+        select_list = '[' + '], ['.join(columns) + ']' if len(columns) > 0 else '*'
+        stage_prefix = f"{object_name[:-1]}__stage_{uuid4().hex[:8]}"
+        local = thread_local()
+        lock = Lock()
+        workers = []
+        failures = {}
+        totals = {'rows': 0, 'partitions': 0}
+
+        def connection() -> tuple['SQLHandler', str]:
+            if not hasattr(local, 'worker'):
+                worker = self.spawn()
+                worker.connect_to_mssql(auto_commit = False)
+                worker.cursor.fast_executemany = fast_execute
+                with lock:
+                    target = f"{stage_prefix}_{len(workers)}]" if atomic else object_name
+                    workers.append((worker, target))
+                if atomic:
+                    LOG.sql(f"Creating staging table {target}...")
+                    worker.cursor.execute(f"SELECT TOP 0 {select_list} INTO {target} FROM {object_name}")
+                    worker.commit()
+                local.worker, local.target = worker, target
+            return local.worker, local.target
+
+        def partition(number: int, batch: list[tuple]):
+            try:
+                worker, target = connection()
+                self.__executemany(worker.cursor, f"INSERT INTO {target}{column_list} VALUES ({'?' + (len(batch[0]) - 1)*', ?'})", batch, fast_execute and datatypes is not None, datatypes)
+                worker.commit()
+            except Exception as e:
+                LOG.error(f"Partition {number} of insert to {object_name} on {self} failed. {e}")
+                if hasattr(local, 'worker') and local.worker.connected:
+                    local.worker.rollback()
+                with lock:
+                    failures[number] = e
+                return
+            with lock:
+                totals['rows'] += len(batch)
+                totals['partitions'] += 1
+                LOG.sql(f"Inserted partition {number} of {len(batch)} rows into {object_name}, {totals['rows']} rows in total.")
+                if progress is not None:
+                    progress(totals['partitions'], totals['rows'])
+            return
+
+        LOG.sql(f"Inserting into {object_name} on {self} over {parallel} connections...")
+        gate = Semaphore(2*parallel)
+        with ThreadPoolExecutor(max_workers = parallel, thread_name_prefix = 'pyjra-insert') as executor:
+            for number, batch in enumerate(batches):
+                if atomic and len(failures) > 0:
+                    LOG.warning(f"Stopped submitting partitions after a failure in an atomic insert.")
+                    break
+                gate.acquire()
+                executor.submit(partition, number, batch).add_done_callback(lambda _: gate.release())
+        for worker, _ in workers:
+            if worker.connected:
+                worker.close_connection(commit = False)
+
+        if atomic:
+            stages = [target for _, target in workers]
+            drop = ';\n'.join(f"DROP TABLE IF EXISTS {stage}" for stage in stages)
+            if len(failures) > 0:
+                if len(stages) > 0:
+                    LOG.sql(f"Dropping {len(stages)} staging tables for {object_name}...")
+                    self.execute_query(drop, commit = True)
+                totals['rows'] = 0
+            elif len(stages) > 0:
+                LOG.sql(f"Moving {len(stages)} staging tables into {object_name}...")
+                try:
+                    with self.session():
+                        self.execute_query("SET XACT_ABORT ON")
+                        try:
+                            for stage in stages:
+                                self.execute_query(f"INSERT INTO {object_name} WITH (TABLOCK) {column_list} SELECT {select_list} FROM {stage}")
+                                self.execute_query(f"DROP TABLE {stage}")
+                        finally:
+                            try:
+                                self.cursor.execute("SET XACT_ABORT OFF")
+                            except pyodbc.Error as e:
+                                LOG.warning(f"Could not reset XACT_ABORT on {self}. {e}")
+                except Exception as e:
+                    LOG.error(f"Failed to move the staging tables into {object_name} on {self}, the move was rolled back. {e}")
+                    self.execute_query(drop, commit = True)
+                    raise
+
+        if len(failures) > 0:
+            error = f"{len(failures)} partition{'s' if len(failures) > 1 else ''} of the insert to {object_name} failed; {totals['rows']} rows were inserted."
+            LOG.error(error)
+            raise PartitionError(error, failures, totals['rows'])
+        LOG.sql(f"Parallel insert was successful!")
+        return totals['rows']
+
+    def insert(
+        self, 
+        schema: str,  
+        table: str,
+        data: Tabular|pd.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular],
+        columns: list[str] = None, 
+        prescript: str = None,
+        postscript: str = None,
+        fast_execute: bool = True,
+        auto_create_table: bool = True,
+        replace_table: bool = False,
+        commit: bool = True,
+        batch_size: int = None,
+        commit_per_batch: bool = False,
+        progress: Callable[[int, int], None] = None,
+        parallel: int = None,
+        atomic: bool = True,
+        infer_types: bool = True,
+        isolate_errors: bool = False,
+        rejects: str = None
+    ) -> int:
+        """
+        ### insert
+
+        Version: 2.11
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Inserts data into a specified table. Data is inserted in batches of at most `batch_size` rows, so iterables and generators larger than memory can be loaded. With `parallel`, batches are inserted concurrently over several connections and a PartitionError is raised if any partition fails.
+
+        With fast_execute, parameter size hints are computed for each batch from the cached schema of the table and the observed widths of the values, so buffers are bounded and (max) columns are not bound at their maximum size.
+
+        Unless parallel, the table creation, prescript, insert and postscript run in a session on one connection and in one transaction. Parallel inserts run on their own connections, so they cannot join an open session.
+
+        If the handler is instrumented, the connect and execute times, rows and approximate bytes of the insert are recorded under the table name.
+
+        With isolate_errors, each batch is inserted behind a savepoint. A batch that fails on its data, such as a constraint violation or a conversion error, is rolled back and bisected until the failing rows are isolated, and the rest of the batch is inserted at full speed. The rejected rows are kept with their error messages in the `rejected` attribute of the handler and, if given, written to the `rejects` file.
+
+        #### Requirements:
+        - SQLHandler.__insert_batches
+        - SQLHandler.__insert_isolating
+        - SQLHandler.session
+        - SQLHandler.create_table
+        - SQLHandler.get_table_schema
+        - SQLHandler.__executemany
+        - SQLHandler.__parallel_insert
+        - SQLHandler.execute_query
+        - SQLHandler.commit
+        - QueryMetrics.estimate_bytes
+        - QueryMetrics.record
+
+        #### Parameters:
+        - schema (str): The schema of the object to insert to.
+        - table (str): The table to insert to.
+        - data (Tabular|pandas.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular]): The values to be inserted. Iterables of tuples or Tabulars, such as the output of SQLHandler.iter_query, are consumed one batch at a time.
+        - columns (list[str]): The columns to insert to. Defaults to all columns of existing table. Defaults to None.
+        - prescript (str): A script to run prior to the insert. Defaults to None.
+        - postcript (str): A script to run after the insert. Defaults to None.
+        - fast_execute (bool): If true, fast execute is utilised. Failed inserts are retried without fast execute. Defaults to true.
+        - auto_create_table (bool): If true, the table is created if it does not already exist. Defaults to true.
+        - replace_table (bool): If true, the table is replaced if it already exists. Defaults to false.
+        - commit (bool): If true, the insert is committed. Defaults to true.
+        - batch_size (int): The maximum number of rows sent per `executemany`. Defaults to the whole of a Tabular, DataFrame or list, or 10000 rows of an iterable of tuples.
+        - commit_per_batch (bool): If true, each batch is committed as soon as it is inserted, otherwise all batches are committed together at the end. Ignored if commit is false or inside an outer session. Defaults to false.
+        - progress (Callable[[int, int], None]): Called after each batch with the number of batches and rows inserted so far. Defaults to None.
+        - parallel (int): If greater than 1, batches are inserted concurrently from this many threads, each on its own connection. A Tabular, DataFrame or list is split into this many partitions unless batch_size is given. Each partition is committed separately, so commit and commit_per_batch are ignored. Defaults to None.
+        - atomic (bool): Only used with parallel. If true, partitions are loaded into staging tables that are moved into the table only if every partition succeeds. If false, partitions are inserted directly and failed partitions are skipped. Defaults to true.
+        - infer_types (bool): If true and the table is created, its datatypes are inferred from a Tabular, DataFrame or list of data. Defaults to true.
+        - isolate_errors (bool): If true, rows that fail to insert are isolated and rejected rather than failing the insert. Not supported with parallel. Defaults to false.
+        - rejects (str): The path of a tab delimited file to write rejected rows to, with an error column. Only used with isolate_errors. Defaults to None.
+
+        #### Returns:
+        - rows (int): The number of rows inserted.
+
+        #### Usage:
+        >>> executor.insert('schema', 'table', df)
+        >>> executor.insert('schema', 'table', source.iter_query("SELECT * FROM [table]"), batch_size = 50000, commit_per_batch = True)
+        >>> executor.insert('schema', 'table', data, parallel = 8, atomic = False)
+        >>> executor.insert('schema', 'table', data, isolate_errors = True, rejects = 'rejects.tsv')
+
+        #### Tasklist:
+        - Add functionality to retry inserts without fast_executemany - not sure which error warrants the retry.
+
+        #### History:
+        - 2.11 JRA (2026-10-17): Clears the parameter size hints after each batch, so later queries on the cursor are not bound with them.
+        - 2.10 JRA (2026-10-17): Added isolate_errors and rejects.
+        - 2.9 JRA (2026-10-17): Records metrics.
+        - 2.8 JRA (2026-10-17): Runs in a session, so the prescript no longer closes the connection and the connection is opened once.
+        - 2.7 JRA (2026-10-17): Sets parameter size hints before each batch with fast_execute.
+        - 2.6 JRA (2026-10-17): Added infer_types.
+        - 2.5 JRA (2026-10-17): Invalidates cached results of the table.
+        - 2.4 JRA (2026-10-17): Added parallel and atomic.
+        - 2.3 JRA (2026-10-17): Added batch_size, commit_per_batch and progress, and support for iterables of rows or Tabulars.
+        - 2.2 JRA (2024-02-23): Fixed an issue where `len(data.col_count)` was attempted.
+        - 2.1 JRA (2024-02-19): Implemented Tabular.
+        - 2.0 JRA (2024-02-09): Revamped error handling.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        if data is None:
+            LOG.error("No values given to insert.")
+            return 0
+        if batch_size is not None and batch_size < 1:
+            error = "The batch_size must be at least 1."
+            LOG.error(error)
+            raise ValueError(error)
+        parallel = parallel if parallel is not None and parallel > 1 else None
+        if isolate_errors and parallel is not None:
+            error = "The isolate_errors option is not supported with parallel inserts."
+            LOG.error(error)
+            raise ValueError(error)
+        if self.metrics is not None:
+            start = monotonic()
+            connected = self.__connect_seconds
+            size = QueryMetrics.estimate_bytes(data) if parallel is not None and isinstance(data, (Tabular, list)) else 0
+        sample = data if infer_types and isinstance(data, (Tabular, pd.DataFrame)) else None
+        columns, batches = self.__insert_batches(data, columns, batch_size, parallel)
+        if infer_types and isinstance(data, list):
+            sample = Tabular.from_trusted(data, columns, None)
+        
+        if parallel is not None and self.__session_depth > 0:
+            LOG.warning(f"Parallel inserts run on their own connections, outside of the open session on {self}.")
+
+        with self.session(commit = commit) if parallel is None else nullcontext():
+            if auto_create_table:
+                if not self.create_table(table = table, columns = columns, schema = schema, replace = replace_table, commit = commit, data = sample):
+                    LOG.error(f"Could not create table for insert.")
+                    return 0
+            object_name = self.__schema_table_to_object_name(schema, table)
+
+            datatypes = None
+            if fast_execute:
+                entry = self.get_table_schema(schema, table) or {'columns': [], 'datatypes': []}
+                if len(columns) > 0:
+                    targets = {column.lower(): datatype for column, datatype in zip(entry['columns'], entry['datatypes'])}
+                    datatypes = [targets.get(column.lower()) for column in columns]
+                else:
+                    datatypes = entry['datatypes']
+
+            if prescript is not None:
+                LOG.sql(f"Running prescript...")
+                self.execute_query(prescript, commit = commit)
+
+            if parallel is not None:
+                try:
+                    rows = self.__parallel_insert(object_name, columns, batches, parallel, atomic, fast_execute, progress, datatypes)
+                finally:
+                    if self.cache is not None:
+                        self.cache.invalidate(table)
+            else:
+                LOG.sql(f"Inserting into {object_name} on {self}...")
+                self.cursor.fast_executemany = fast_execute
+                rows = 0
+                count = 0
+                rejected = []
+                for batch in batches:
+                    cmd = f"INSERT INTO {object_name}{'([' + '], ['.join(columns) + '])' if len(columns) > 0 else ''} VALUES ({'?' + (len(batch[0]) - 1)*', ?'})"
+                    inserted = len(batch)
+                    try:
+                        if isolate_errors:
+                            inserted, failed = self.__insert_isolating(cmd, batch, fast_execute, datatypes)
+                            rejected.extend(failed)
+                        else:
+                            self.__executemany(self.cursor, cmd, batch, fast_execute, datatypes)
+                    except pyodbc.ProgrammingError as e:
+                        LOG.error(f"Failed to parse script on {self}. {e}")
+                        raise
+                    except Exception as e:
+                        LOG.critical(f"Unexpected {type(e)} error occurred whilst performing insert to {object_name} on {self}. {e}")
+                        raise
+                    rows += inserted
+                    count += 1
+                    if self.metrics is not None:
+                        size += QueryMetrics.estimate_bytes(batch)
+                    if commit and commit_per_batch and self.__session_depth == 1:
+                        self.commit()
+                    LOG.sql(f"Inserted batch {count} of {inserted} rows into {object_name}, {rows} rows in total.")
+                    if progress is not None:
+                        progress(count, rows)
+                LOG.sql(f"Insert was successful!")
+                if isolate_errors:
+                    width = len(rejected[0]) - 1 if len(rejected) > 0 else len(columns)
+                    self.rejected = Tabular.from_trusted(
+                        data = rejected,
+                        columns = (columns or [f"column_{c + 1}" for c in range(width)]) + ['error'],
+                        datatypes = None,
+                        name = f"{table}_rejects"
+                    )
+                    if len(rejected) > 0:
+                        LOG.warning(f"Rejected {len(rejected)} rows of the insert into {object_name} on {self}.")
+                        if rejects is not None:
+                            with open(rejects, 'w', encoding = 'utf-8') as file:
+                                file.write(self.rejected.to_delimited(col_separator = '\t'))
+
+            if postscript is not None:
+                LOG.sql(f"Running postscript...")
+                self.execute_query(postscript, commit = commit)
+        if parallel is None and self.cache is not None:
+            self.cache.invalidate(table)
+        if self.metrics is not None:
+            connect = self.__connect_seconds - connected
+            self.metrics.record('insert', table, connect = connect, execute = max(0.0, monotonic() - start - connect), rows = rows, bytes = size)
+
+        # try:
+        #     LOG.sql(f"Inserting into {object_name} at {str(self)}...")
+        #     self.connect_to_mssql(commit)
+        #     if prescript is not None:
+        #         LOG.sql(f"Running script against {str(self)}:\n{prescript}")
+        #         self.cursor.execute(prescript)
+        #     self.cursor.fast_executemany = fast_execute
+        #     cmd = f"INSERT INTO {object_name}{'([' + '], ['.join(cols) + '])' if len(cols) > 0 else ''} VALUES ({'?' + (len(values[0]) - 1)*', ?'})"
+        #     try:
+        #         self.cursor.executemany(cmd, values)
+        #     except Exception as e:
+        #         if fast_execute:
+        #             LOG.error(f"Insert failed. {error}.\nAttempting insert without fast_executemany...")
+        #             self.cursor.fast_executemany = False
+        #             self.cursor.executemany(cmd, values)
+        #     if postscript is not None:
+        #         LOG.sql(f"Running script against {str(self)}:\n{postscript}")
+        #         self.cursor.execute(postscript)
+        # except Exception as e:
+        #     self.close_connection(commit = False)
+        #     LOG.error(f"Insert failed. Error: {error}.")
+        # else:
+        #     LOG.sql(f"Insert complete!")
+        #     self.close_connection(commit)
+        return rows
+
+    def upsert(
+        self,
+        schema: str,
+        table: str,
+        data: Tabular|pd.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular],
+        keys: list[str],
+        columns: list[str] = None,
+        delete_missing: bool = False,
+        fast_execute: bool = True,
+        batch_size: int = None,
+        auto_create_table: bool = True,
+        commit: bool = True
+    ) -> dict[str, int]:
+        """
+        ### upsert
+
+        Version: 1.3
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Inserts or updates data in a table with a single set-based MERGE. The data is loaded with fast_executemany into a session temporary table with the same column types as the target, indexed on the keys, and merged into the target in one statement. Rows are matched on the keys; matched rows are updated only if a value differs, unmatched rows are inserted and, if delete_missing, rows of the table not in the data are deleted. Everything happens on one connection and in one transaction.
+
+        If the handler is instrumented, the connect and execute times, rows staged and their approximate bytes are recorded under the table name.
+
+        #### Requirements:
+        - SQLHandler.__insert_batches
+        - SQLHandler.create_table
+        - SQLHandler.get_table_schema
+        - SQLHandler.__executemany
+        - SQLHandler.connect_to_mssql
+        - SQLHandler.__reset_option
+        - SQLHandler.close_connection
+        - QueryMetrics.estimate_bytes
+        - QueryMetrics.record
+
+        #### Parameters:
+        - schema (str): The schema of the table.
+        - table (str): The table to upsert to.
+        - data (Tabular|pandas.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular]): The values to be upserted. The keys must be unique within the data.
+        - keys (list[str]): The columns that identify a row.
+        - columns (list[str]): The columns of the data. Defaults to the columns of a Tabular or DataFrame. Defaults to None.
+        - delete_missing (bool): If true, rows of the table whose keys are not in the data are deleted. Defaults to false.
+        - fast_execute (bool): If true, fast execute is utilised to load the staging table. Defaults to true.
+        - batch_size (int): The maximum number of rows sent per `executemany`. Defaults to the whole of a Tabular, DataFrame or list, or 10000 rows of an iterable of tuples.
+        - auto_create_table (bool): If true, the table is created if it does not already exist. Defaults to true.
+        - commit (bool): If true, the upsert is committed. Defaults to true.
+
+        #### Returns:
+        - counts (dict[str, int]): The number of rows inserted, updated and deleted.
+
+        #### Usage:
+        >>> executor.upsert('schema', 'table', df, keys = ['id'])
+        {'inserted': 12, 'updated': 3, 'deleted': 0}
+        >>> executor.upsert('schema', 'table', data, keys = ['region', 'date'], delete_missing = True)
+
+        #### History:
+        - 1.3 JRA (2026-10-17): Turns NOCOUNT back off after the merge, so it does not leak to the pool.
+        - 1.2 JRA (2026-10-17): Clears the parameter size hints after each batch, so later queries on the cursor are not bound with them.
+        - 1.1 JRA (2026-10-17): Records metrics.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        if data is None:
+            error = "No values given to upsert."
+            LOG.error(error)
+            raise ValueError(error)
+        if batch_size is not None and batch_size < 1:
+            error = "The batch_size must be at least 1."
+            LOG.error(error)
+            raise ValueError(error)
+        if self.metrics is not None:
+            start = monotonic()
+            connected = self.__connect_seconds
+            size = 0
+        sample = data if isinstance(data, (Tabular, pd.DataFrame)) else None
+        columns, batches = self.__insert_batches(data, columns, batch_size, None)
+        if isinstance(data, list):
+            sample = Tabular.from_trusted(data, columns, None)
+        lookup = [column.lower() for column in columns]
+        if len(keys) == 0 or any(key.lower() not in lookup for key in keys):
+            error = f"The keys {keys} must be a non-empty subset of the columns {columns}."
+            LOG.error(error)
+            raise ValueError(error)
+        updates = [column for column in columns if column.lower() not in [key.lower() for key in keys]]
+
+        if auto_create_table:
+            if not self.create_table(table = table, columns = columns, schema = schema, commit = commit, data = sample):
+                LOG.error(f"Could not create table for upsert.")
+                return {'inserted': 0, 'updated': 0, 'deleted': 0}
+        object_name = self.__schema_table_to_object_name(schema, table)
+        entry = self.get_table_schema(schema, table) or {'columns': [], 'datatypes': []}
+        targets = {column.lower(): datatype for column, datatype in zip(entry['columns'], entry['datatypes'])}
+        datatypes = [targets.get(column) for column in lookup]
+
+        stage = f"#upsert_{uuid4().hex[:8]}"
+        column_list = '[' + '], ['.join(columns) + ']'
+        script = "SET NOCOUNT ON;\nDECLARE @changes TABLE ([action] nvarchar(10));\n"
+        script += f"MERGE {object_name} WITH (HOLDLOCK) AS [t]\nUSING {stage} AS [s]\n"
+        script += "ON " + ' AND '.join(f"[t].[{key}] = [s].[{key}]" for key in keys) + "\n"
+        if len(updates) > 0:
+            script += f"WHEN MATCHED AND EXISTS (SELECT {', '.join(f'[s].[{column}]' for column in updates)} EXCEPT SELECT {', '.join(f'[t].[{column}]' for column in updates)}) THEN\n"
+            script += f"\tUPDATE SET {', '.join(f'[t].[{column}] = [s].[{column}]' for column in updates)}\n"
+        script += f"WHEN NOT MATCHED BY TARGET THEN\n\tINSERT ({column_list}) VALUES ({', '.join(f'[s].[{column}]' for column in columns)})\n"
+        if delete_missing:
+            script += "WHEN NOT MATCHED BY SOURCE THEN\n\tDELETE\n"
+        script += "OUTPUT $action INTO @changes;\n"
+        script += "SELECT [action], COUNT(*) AS [rows] FROM @changes GROUP BY [action];"
+
+        if not self.connected:
+            self.connect_to_mssql(auto_commit = False)
+        counts = {'inserted': 0, 'updated': 0, 'deleted': 0}
+        rows = 0
+        try:
+            LOG.sql(f"Staging data for upsert to {object_name} in {stage}...")
+            self.cursor.execute(f"SELECT TOP 0 {column_list} INTO {stage} FROM {object_name} UNION ALL SELECT TOP 0 {column_list} FROM {object_name}")
+            self.cursor.fast_executemany = fast_execute
+            for batch in batches:
+                self.__executemany(self.cursor, f"INSERT INTO {stage}({column_list}) VALUES ({'?' + (len(batch[0]) - 1)*', ?'})", batch, fast_execute, datatypes)
+                rows += len(batch)
+                if self.metrics is not None:
+                    size += QueryMetrics.estimate_bytes(batch)
+            self.cursor.execute(f"CREATE CLUSTERED INDEX [ix_keys] ON {stage} ([{'], ['.join(keys)}])")
+            LOG.sql(f"Merging {rows} rows into {object_name} on {self}...")
+            try:
+                self.cursor.execute(script)
+                for action, count in self.cursor.fetchall():
+                    counts[{'INSERT': 'inserted', 'UPDATE': 'updated', 'DELETE': 'deleted'}[action]] = count
+            finally:
+                self.__reset_option('NOCOUNT')
+            self.cursor.execute(f"DROP TABLE {stage}")
+        except Exception as e:
+            LOG.error(f"Upsert to {object_name} on {self} failed. {e}")
+            self.close_connection(commit = False)
+            raise
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(table)
+        self.close_connection(commit = commit)
+        if self.metrics is not None:
+            connect = self.__connect_seconds - connected
+            self.metrics.record('upsert', table, connect = connect, execute = max(0.0, monotonic() - start - connect), rows = rows, bytes = size)
+        LOG.sql(f"Upsert was successful! {counts['inserted']} rows inserted, {counts['updated']} updated and {counts['deleted']} deleted.")
+        return counts
+    
+    def get_table_schema(self, schema: str, table: str, refresh: bool = False) -> dict|None:
+        """
+        ### get_table_schema
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Retrieves the columns and SQL datatypes of a table or view from the handler's catalog cache, querying the database only the first time or when refreshing.
+
+        #### Requirements:
+        - SQLHandler.__schema_table_to_object_name
+        - SQLHandler.execute_query
+
+        #### Parameters:
+        - schema (str): The schema of the object.
+        - table (str): The name of the object.
+        - refresh (bool): If true, the cached entry is reloaded from the database. Defaults to false.
+
+        #### Returns:
+        - (dict|None): The 'columns' and 'datatypes' of the object, or None if it does not exist.
+
+        #### Usage:
+        >>> executor.get_table_schema('dbo', 'table')
+        {'columns': ['column'], 'datatypes': ['varchar(16)']}
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Passes the object name as a one-value tuple.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        object_name = self.__schema_table_to_object_name(schema, table)
+        key = object_name.lower()
+        if not refresh and key in self.__catalog['objects']:
+            return self.__catalog['objects'][key]
+
+        LOG.sql(f"Loading catalog entry for {object_name} from {self}...")
+        result = self.execute_query(
+            query = """SELECT [c].[name], TYPE_NAME([c].[user_type_id]) AS [type], [c].[max_length], [c].[precision], [c].[scale]
+FROM sys.columns AS [c]
+WHERE [c].[object_id] = OBJECT_ID(?)
+ORDER BY [c].[column_id]""",
+            values = (object_name,),
+            commit = False,
+            use_cache = False
+        )
+        entry = None
+        if result is not None and result.row_count > 0:
+            entry = {'columns': [], 'datatypes': []}
+            for name, datatype, max_length, precision, scale in result.data:
+                if datatype in ('varchar', 'char', 'varbinary', 'binary'):
+                    datatype += f"({'max' if max_length == -1 else max_length})"
+                elif datatype in ('nvarchar', 'nchar'):
+                    datatype += f"({'max' if max_length == -1 else max_length//2})"
+                elif datatype in ('decimal', 'numeric'):
+                    datatype += f"({precision}, {scale})"
+                elif datatype in ('datetime2', 'time', 'datetimeoffset'):
+                    datatype += f"({scale})"
+                entry['columns'].append(name)
+                entry['datatypes'].append(datatype)
+        self.__catalog['objects'][key] = entry
+        return entry
+
+    def table_exists(self, schema: str, table: str, refresh: bool = False) -> bool:
+        """
+        ### table_exists
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Checks whether a table or view exists, using the handler's catalog cache.
+
+        #### Requirements:
+        - SQLHandler.get_table_schema
+
+        #### Parameters:
+        - schema (str): The schema of the object.
+        - table (str): The name of the object.
+        - refresh (bool): If true, the cached entry is reloaded from the database. Defaults to false.
+
+        #### Returns:
+        - (bool)
+
+        #### Usage:
+        >>> executor.table_exists('dbo', 'table')
+        True
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return self.get_table_schema(schema, table, refresh) is not None
+
+    def __type_max_length(self, datatype: str = 'nvarchar') -> int:
+        """
+        ### __type_max_length
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Retrieves the maximum declarable length in characters of a string type from the handler's catalog cache, querying `sys.types` only the first time.
+
+        #### Requirements:
+        - SQLHandler.execute_query
+
+        #### Parameters:
+        - datatype (str): The name of the type. Defaults to 'nvarchar'.
+
+        #### Returns:
+        - (int)
+
+        #### Usage:
+        >>> executor.__type_max_length('nvarchar')
+        4000
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Passes the datatype as a one-value tuple.
+        - 1.0 JRA (2026-10-17): Initial version, moved from create_table v2.2.
+        """
+        if datatype not in self.__catalog['types']:
+            self.__catalog['types'][datatype] = self.execute_query(
+                query = "SELECT CONVERT(int, [max_length]/(CASE WHEN [name] LIKE 'n%' THEN 2 ELSE 1 END)) AS [length] FROM sys.types WHERE [name] = ?",
+                values = (datatype,),
+                commit = False,
+                use_cache = False
+            ).to_dict(0)['length']
+        return self.__catalog['types'][datatype]
+
+    def refresh_catalog(self, schema: str = None, table: str = None):
+        """
+        ### refresh_catalog
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Forgets cached catalog entries so that they are reloaded when next needed. Use after objects are changed outside of the handler.
+
+        #### Requirements:
+        - SQLHandler.__schema_table_to_object_name
+
+        #### Parameters:
+        - schema (str): The schema of the object to forget. Defaults to None.
+        - table (str): The name of the object to forget. Defaults to forgetting the whole catalog.
+
+        #### Usage:
+        >>> executor.refresh_catalog('dbo', 'table')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if table is None:
+            LOG.sql(f"Clearing catalog cache of {self}.")
+            self.__catalog['objects'].clear()
+            self.__catalog['types'].clear()
+        else:
+            self.__catalog['objects'].pop(self.__schema_table_to_object_name(schema, table).lower(), None)
+        return
+
+    def __forget_tables(self, query: str):
+        """
+        ### __forget_tables
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Forgets the catalog entries of tables referenced by a DDL query, matching on table name regardless of schema.
+
+        #### Requirements:
+        - QueryCache.tables
+
+        #### Parameters:
+        - query (str): The query being run.
+
+        #### Usage:
+        >>> executor.__forget_tables("DROP TABLE [dbo].[table]")
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if len(self.__catalog['objects']) == 0 or regex.search(r"\b(CREATE|ALTER|DROP|INTO|sp_rename)\b", query, flags = regex.IGNORECASE) is None:
+            return
+        tables = QueryCache.tables(query)
+        for key in [key for key in self.__catalog['objects'] if regex.split(r"\]\s*\.\s*\[", key)[-1].strip('[]') in tables]:
+            del self.__catalog['objects'][key]
+        return
+
+    @staticmethod
+    def infer_datatypes(data: Tabular|pd.DataFrame) -> list[str]:
+        """
+        ### infer_datatypes
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Infers the tightest SQL Server datatype of each column from its values, working a column at a time. Integers are given the smallest integer type that holds their range, decimals a precision and scale that holds every value, and strings varchar or nvarchar of their longest length. Datetimes are inferred as datetimeoffset if any of them is timezone aware, and as datetime2 otherwise. DataFrame columns with numeric or datetime dtypes are summarised with pandas. Columns that are empty, entirely null or of mixed types are inferred as None.
+
+        #### Requirements:
+        - SQLHandler.__column_datatype
+
+        #### Parameters:
+        - data (Tabular|pandas.DataFrame): The data to infer datatypes from.
+
+        #### Returns:
+        - datatypes (list[str]): The inferred datatype of each column, or None where one could not be inferred.
+
+        #### Usage:
+        >>> SQLHandler.infer_datatypes(Tabular([(1, 'a', 2.5), (300, 'bc', None)], ['id', 'code', 'value']))
+        ['smallint', 'varchar(2)', 'float']
+
+        #### History:
+        - 1.2 JRA (2026-10-17): __column_datatype v1.2.
+        - 1.1 JRA (2026-10-17): __column_datatype v1.1.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(data, pd.DataFrame):
+            columns = (data.iloc[:, c] for c in range(data.shape[1]))
+        elif isinstance(data, Tabular):
+            columns = zip(*data.data) if data.row_based else data.data
+        else:
+            error = f"Invalid datatype passed to `data` argument of `SQLHandler.infer_datatypes`."
+            LOG.error(error)
+            raise ValueError(error)
+        datatypes = [SQLHandler.__column_datatype(column) for column in columns]
+        if isinstance(data, Tabular) and data.row_count == 0:
+            datatypes = [None]*data.col_count
+        return datatypes
+
+    @staticmethod
+    def __column_datatype(column: Iterable|pd.Series) -> str:
+        """
+        ### __column_datatype
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Infers the SQL Server datatype of a single column. Nulls are filtered out once, the kinds of value present are read from the set of their types, and the statistics of each kind are taken with builtins over the whole column, such as `min`, `max` and `max(map(len, ...))` for the range of integers and the length of strings and binary. Only decimals are read value by value, for their digits and scale, and datetimes for their timezones.
+
+        #### Parameters:
+        - column (Iterable|pandas.Series): The values of the column.
+
+        #### Returns:
+        - datatype (str): The inferred datatype, or None if one could not be inferred.
+
+        #### Usage:
+        >>> SQLHandler.__column_datatype([1, 2, 70000])
+        'int'
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Infers timezone aware datetimes as datetimeoffset.
+        - 1.1 JRA (2026-10-17): Works column-wise with builtins rather than inspecting every value in a Python loop.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        def integer_type(low, high):
+            for datatype, minimum, maximum in (('tinyint', 0, 255), ('smallint', -2**15, 2**15 - 1), ('int', -2**31, 2**31 - 1), ('bigint', -2**63, 2**63 - 1)):
+                if minimum <= low and high <= maximum:
+                    return datatype
+            return f"decimal({min(max(len(str(abs(low))), len(str(abs(high)))), 38)}, 0)"
+
+        def kind(datatype: type) -> str:
+            for name, parents in (('bit', bool), ('int', Integral), ('float', float), ('decimal', Decimal), ('datetime', datetime), ('date', date), ('time', time), ('str', str), ('bytes', (bytes, bytearray)), ('uuid', UUID)):
+                if issubclass(datatype, parents):
+                    return name
+            return datatype.__name__
+
+        if isinstance(column, pd.Series):
+            kind_code = column.dtype.kind
+            if column.isna().all():
+                return None
+            elif kind_code == 'b':
+                return 'bit'
+            elif kind_code in 'iu':
+                return integer_type(int(column.min()), int(column.max()))
+            elif kind_code == 'f':
+                return 'float'
+            elif kind_code == 'M':
+                return 'datetimeoffset' if getattr(column.dtype, 'tz', None) is not None else 'datetime2'
+            column = column.tolist()
+
+        values = [value for value in column if value is not None and value is not pd.NaT]
+        types = set(map(type, values))
+        groups = {}
+        for datatype in types:
+            groups.setdefault(kind(datatype), set()).add(datatype)
+
+        def of(name: str) -> list:
+            return values if groups[name] == types else [value for value in values if type(value) in groups[name]]
+
+        kinds = set(groups)
+        if 'float' in kinds and all(map(isnan, of('float'))):
+            kinds.discard('float')
+        if 'decimal' in kinds:
+            decimals = of('decimal')
+            finite = [value.as_tuple() for value in decimals if value.is_finite()]
+            if len(finite) < len(decimals):
+                kinds.add('float')
+            if len(finite) == 0:
+                kinds.discard('decimal')
+            digits = max([0] + [len(value.digits) + value.exponent for value in finite])
+            scale = max([0] + [-value.exponent for value in finite])
+
+        if len(kinds) == 0:
+            return None
+        elif kinds == {'bit'}:
+            return 'bit'
+        elif kinds == {'int'}:
+            integers = of('int')
+            return integer_type(int(min(integers)), int(max(integers)))
+        elif 'float' in kinds and kinds <= {'int', 'float', 'decimal'}:
+            return 'float'
+        elif kinds <= {'int', 'decimal'}:
+            if 'int' in kinds:
+                integers = of('int')
+                digits = max(digits, len(str(abs(int(min(integers))))), len(str(abs(int(max(integers))))))
+            precision = min(max(digits, 0) + scale, 38)
+            return f"decimal({max(precision, 1)}, {min(scale, precision)})"
+        elif kinds <= {'datetime', 'date'}:
+            if kinds == {'date'}:
+                return 'date'
+            return 'datetimeoffset' if any(value.tzinfo is not None for value in of('datetime')) else 'datetime2'
+        elif kinds == {'time'}:
+            return 'time'
+        elif kinds == {'str'}:
+            strings = of('str')
+            length = max(map(len, strings))
+            if not all(map(str.isascii, strings)):
+                return f"nvarchar({length or 1})" if length <= 4000 else 'nvarchar(max)'
+            return f"varchar({length or 1})" if length <= 8000 else 'varchar(max)'
+        elif kinds == {'bytes'}:
+            length = max(map(len, of('bytes')))
+            return f"varbinary({length or 1})" if length <= 8000 else 'varbinary(max)'
+        elif kinds == {'uuid'}:
+            return 'uniqueidentifier'
+        return None
+
+    @staticmethod
+    def to_tvp(data: Tabular|pd.DataFrame|list[tuple], type_name: str = None, schema: str = 'dbo') -> list:
+        """
+        ### to_tvp
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Converts data to a table-valued parameter for pyodbc, so a whole set of rows, such as thousands of keys to filter by, is sent in one round trip as a single parameter and the query plan is reused whatever the number of rows. Stored procedures can be passed a TVP without a type name, but ad hoc queries need the name of the table type, which can be created with SQLHandler.create_table_type.
+
+        #### Parameters:
+        - data (Tabular|pandas.DataFrame|list[tuple]): The rows of the parameter, in the column order of the table type.
+        - type_name (str): The name of the table type. Defaults to None.
+        - schema (str): The schema of the table type. Defaults to 'dbo'.
+
+        #### Returns:
+        - (list): The rows, led by the type and schema names if a type name is given.
+
+        #### Usage:
+        >>> executor.execute_query("SELECT * FROM [dbo].[orders] AS [o] WHERE [o].[id] IN (SELECT [id] FROM ?)", (SQLHandler.to_tvp(ids, 'id_list'),))
+        >>> executor.execute_query("EXEC [dbo].[usp_load] @rows = ?", (SQLHandler.to_tvp(data),))
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = Tabular(data)
+        if isinstance(data, Tabular):
+            data.transpose(row_based = True)
+            rows = list(data.data)
+        else:
+            rows = [tuple(row) for row in data]
+        if type_name is None:
+            return rows
+        return [type_name.strip('[]'), schema.strip('[]')] + rows
+
+    @staticmethod
+    def __has_table_values(values) -> bool:
+        """
+        ### __has_table_values
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Checks whether any of the values of a query is a table-valued parameter. Such queries are not cached, since their values cannot be hashed.
+
+        #### Parameters:
+        - values: The values to substitute into a query.
+
+        #### Returns:
+        - (bool)
+
+        #### Usage:
+        >>> SQLHandler.__has_table_values((SQLHandler.to_tvp(ids),))
+        True
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if values is None or isinstance(values, (str, bytes)):
+            return False
+        if isinstance(values, Tabular):
+            return True
+        if not isinstance(values, (tuple, list)):
+            return False
+        return any(isinstance(value, (Tabular, list)) for value in values)
+
+    @staticmethod
+    def __python_datatype(datatype: type) -> str:
+        """
+        ### __python_datatype
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Maps a Python type to the SQL Server datatype that holds any of its values.
+
+        #### Parameters:
+        - datatype (type): The Python type.
+
+        #### Returns:
+        - (str): Defaults to nvarchar(4000) for unknown types.
+
+        #### Usage:
+        >>> SQLHandler.__python_datatype(int)
+        'bigint'
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        for python_type, sql_type in (
+            (bool, 'bit'),
+            (Integral, 'bigint'),
+            (float, 'float'),
+            (Decimal, 'decimal(38, 10)'),
+            (datetime, 'datetime2'),
+            (date, 'date'),
+            (time, 'time'),
+            (UUID, 'uniqueidentifier'),
+            ((bytes, bytearray), 'varbinary(max)')
+        ):
+            if isinstance(datatype, type) and issubclass(datatype, python_type):
+                return sql_type
+        return 'nvarchar(4000)'
+
+    def create_table_type(
+        self,
+        type_name: str,
+        data: Tabular|pd.DataFrame = None,
+        columns: list[str] = [],
+        datatypes: list[str] = [],
+        schema: str = 'dbo',
+        primary_key: list[str] = None,
+        commit: bool = True
+    ) -> bool:
+        """
+        ### create_table_type
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Creates a user-defined table type for table-valued parameters, if it does not already exist. Columns without a given datatype take the SQL Server equivalent of the Python datatype of the column of data, which is broad enough for any later rows of that type rather than fitted to the values at hand.
+
+        #### Requirements:
+        - SQLHandler.__schema_table_to_object_name
+        - SQLHandler.__python_datatype
+        - SQLHandler.execute_query
+
+        #### Parameters:
+        - type_name (str): The name of the table type.
+        - data (Tabular|pandas.DataFrame): The data the type is created for. Used for the columns if none are given and for any datatypes not given. Defaults to None.
+        - columns (list[str]): The columns of the type.
+        - datatypes (list[str]): The datatypes of the columns.
+        - schema (str): The schema of the type. Defaults to 'dbo'.
+        - primary_key (list[str]): The columns of the primary key of the type, which lets joins against it seek. Defaults to None.
+        - commit (bool): If true, the transaction is committed. Defaults to True.
+
+        #### Returns:
+        - (bool): True if the type exists.
+
+        #### Usage:
+        >>> executor.create_table_type('id_list', columns = ['id'], datatypes = ['int'], primary_key = ['id'])
+        >>> executor.create_table_type('order_rows', data = orders)
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Passes the type name as a one-value tuple.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        object_name = self.__schema_table_to_object_name(schema, type_name)
+        if len(columns) == 0 and data is not None:
+            columns = data.columns.tolist() if isinstance(data, pd.DataFrame) else list(data.columns)
+        if len(columns) == 0:
+            error = f"No columns given for the table type {object_name}."
+            LOG.error(error)
+            raise ValueError(error)
+        datatypes = list(datatypes)[:len(columns)]
+        if len(datatypes) < len(columns):
+            if isinstance(data, pd.DataFrame):
+                python_types = [type(value) for value in data.iloc[0]] if len(data) > 0 else []
+            else:
+                python_types = list(data.datatypes) if data is not None else []
+            for c in range(len(datatypes), len(columns)):
+                datatypes.append(self.__python_datatype(python_types[c] if c < len(python_types) else str))
+
+        column_definition = ',\n\t'.join(f"[{col}] {datatype}" for col, datatype in zip(columns, datatypes))
+        if primary_key is not None:
+            column_definition += ",\n\tPRIMARY KEY ([" + '], ['.join(primary_key) + "])"
+        LOG.sql(f"Creating table type {object_name} on {self}...")
+        self.execute_query(
+            f"IF TYPE_ID(?) IS NULL\nCREATE TYPE {object_name} AS TABLE (\n\t{column_definition}\n)",
+            values = (object_name,),
+            commit = commit,
+            use_cache = False
+        )
+        return 1
+
+    def create_table(
+        self,
+        table: str, 
+        columns: list[str] = [], 
+        datatypes: list[str] = [], 
+        schema: str = None, 
+        replace: bool = False,
+        commit: bool = True,
+        data: Tabular|pd.DataFrame = None
+    ) -> bool:
+        """
+        ### create_table
+
+        Version: 2.4
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation: 
+        Creates a table in the database. Existence checks and type limits come from the handler's catalog cache, and the new table is recorded in it. Columns without a given datatype are inferred from data if it is given, otherwise they default to nvarchar.
+
+        #### Requirements:
+        - SQLHandler.__schema_table_to_object_name
+        - SQLHandler.table_exists
+        - SQLHandler.infer_datatypes
+        - SQLHandler.__type_max_length
+        - SQLHandler.execute_query
+        - SQLHandler.close_connection
+
+        #### Parameters:
+        - table (str): The name of the table.
+        - columns (list[str]): The columns of the table.
+        - datatypes (list[str]): The datatypes of the columns.
+        - schema (str): The schema of the table. Defaults to None.
+        - replace (bool): If true, if the table name already exists, then that table is dropped first. Defaults to False.
+        - commit (bool): If true, the transaction is committed. Defaults to True.
+        - data (Tabular|pandas.DataFrame): The data the table is created for. Used for the columns if none are given and to infer any datatypes not given. Defaults to None.
+
+        #### Returns:
+        - (bool): True if the transaction passed without issues.
+
+        #### Usage:
+        >>> executor.create_table('table', ['column'], ['varchar(16)'])
+        >>> executor.create_table('table', data = df)
+
+        #### History:
+        - 2.4 JRA (2026-10-17): Added data for datatype inference.
+        - 2.3 JRA (2026-10-17): Implemented the catalog cache and stopped `datatypes` extending the default list.
+        - 2.2 JRA (2024-02-23): Added column alias to `max_length` query.
+        - 2.1 JRA (2024-02-19): Implemented Tabular.
+        - 2.0 JRA (2024-02-12): Revamped error handling.
+        - 1.0 JRA (2024-02-09): Initial version.
+        """
+        object_name = self.__schema_table_to_object_name(schema, table)
+        LOG.sql(f"Creating {object_name} on {self}...")
+
+        if not replace:
+            if self.table_exists(schema, table):
+                LOG.sql(f"The table {object_name} already exists.")
+                return 1
+            cmd = ""
+        else:
+            cmd = f"DROP TABLE IF EXISTS {object_name};\n"
+
+        if len(columns) == 0 and data is not None:
+            columns = data.columns.tolist() if isinstance(data, pd.DataFrame) else list(data.columns)
+        col_count = len(columns)
+        datatypes = list(datatypes)[:col_count]
+        if len(datatypes) < col_count:
+            inferred = self.infer_datatypes(data) if data is not None else []
+            default = None
+            for c in range(len(datatypes), col_count):
+                datatype = inferred[c] if c < len(inferred) else None
+                if datatype is None:
+                    default = default or f"nvarchar({self.__type_max_length('nvarchar')})"
+                    datatype = default
+                datatypes.append(datatype)
+        
+        column_definition = ',\n\t'.join(f"[{col}] {datatype}" for col, datatype in zip(columns, datatypes))
+
+        cmd += f"CREATE TABLE {object_name} (\n\t{column_definition}\n)"
+        self.execute_query(cmd, commit = commit)
+        self.__catalog['objects'][object_name.lower()] = {'columns': list(columns), 'datatypes': datatypes}
+        LOG.sql(f"Successfully created table {object_name} at {str(self)}.")
+        return 1
+
+    @staticmethod
+    def write_bulk_file(data: Tabular|pd.DataFrame, file: str, encoding: str = 'utf-8') -> int:
+        """
+        ### write_bulk_file
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Serialises data to a headerless CSV file that `BULK INSERT` can read with `FORMAT = 'CSV'`. Nulls, including NaN and NaT, are written as empty fields, bits as 1 or 0 and binary as hexadecimal. Datetimes are written as 'yyyy-mm-dd hh:mm:ss.fff', which datetime, smalldatetime, datetime2 and datetimeoffset columns all accept, with timezone aware values converted to UTC first, as `insert` sends them. Dates and times are written in ISO format. Rows are written one at a time, so no copy of the data is made in memory.
+
+        #### Requirements:
+        - csv.writer
+
+        #### Parameters:
+        - data (Tabular|pandas.DataFrame): The data to serialise.
+        - file (str): The path of the file to write.
+        - encoding (str): The encoding of the file. Defaults to 'utf-8'.
+
+        #### Returns:
+        - rows (int): The number of rows written.
+
+        #### Usage:
+        >>> SQLHandler.write_bulk_file(data, '//fileserver/share/table.csv')
+        3
+
+        #### History:
+        - 1.2 JRA (2026-10-17): Writes NaN and the NaT and datetimes of DataFrames as nulls and datetimes rather than as text.
+        - 1.1 JRA (2026-10-17): Writes datetimes to millisecond precision and converts timezone aware values to UTC, as BULK INSERT rejects microseconds and offsets for datetime columns.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = Tabular(data = data)
+        elif not isinstance(data, Tabular):
+            error = f"Invalid datatype passed to `data` argument of `SQLHandler.write_bulk_file`."
+            LOG.error(error)
+            raise ValueError(error)
+
+        def cell(value):
+            if isinstance(value, np.datetime64):
+                value = pd.Timestamp(value)
+            if isinstance(value, bool):
+                return int(value)
+            elif value is pd.NaT or (isinstance(value, float) and isnan(value)):
+                return None
+            elif isinstance(value, datetime):
+                if value.tzinfo is not None:
+                    value = value.astimezone(timezone.utc).replace(tzinfo = None)
+                return value.strftime('%Y-%m-%d %H:%M:%S.') + f"{value.microsecond//1000:03d}"
+            elif isinstance(value, time):
+                return value.replace(tzinfo = None).isoformat()
+            elif isinstance(value, date):
+                return value.isoformat()
+            elif isinstance(value, (bytes, bytearray)):
+                return value.hex()
+            return value
+
+        data.transpose(row_based = True)
+        LOG.sql(f"Writing {data.row_count} rows to bulk file {file}...")
+        with open(file, 'w', encoding = encoding, newline = '') as f:
+            writer = csv_writer(f, lineterminator = '\n')
+            for row in data.data:
+                writer.writerow([cell(value) for value in row])
+        return data.row_count
+
+    def __bulk_insert_command(
+        self,
+        object_name: str,
+        source: str,
+        data_source: str = None,
+        batch_size: int = None,
+        tablock: bool = True
+    ) -> str:
+        """
+        ### __bulk_insert_command
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Builds the `BULK INSERT` statement for a file written by SQLHandler.write_bulk_file.
+
+        #### Parameters:
+        - object_name (str): The bracket wrapped name of the target table.
+        - source (str): The path of the file as seen by the server, or the blob path relative to the external data source.
+        - data_source (str): The external data source the file is stored in. Defaults to None.
+        - batch_size (int): The number of rows per batch committed by the server. Defaults to the whole file in one batch.
+        - tablock (bool): If true, a table lock is taken, allowing minimal logging. Defaults to true.
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> executor.__bulk_insert_command('[schema].[table]', 'container/table.csv', 'blob_source')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        options = []
+        if data_source is not None:
+            options.append(f"DATA_SOURCE = '{data_source}'")
+        options.extend([
+            "FORMAT = 'CSV'",
+            "FIELDQUOTE = '\"'",
+            "FIELDTERMINATOR = ','",
+            "ROWTERMINATOR = '0x0a'",
+            "CODEPAGE = '65001'",
+            "KEEPNULLS"
+        ])
+        if batch_size is not None:
+            options.append(f"BATCHSIZE = {int(batch_size)}")
+        if tablock:
+            options.append("TABLOCK")
+        source = source.replace("'", "''")
+        return f"BULK INSERT {object_name} FROM '{source}' WITH (\n\t" + ',\n\t'.join(options) + "\n)"
+
+    def bulk_insert(
+        self,
+        schema: str,
+        table: str,
+        data: Tabular|pd.DataFrame,
+        directory: str = None,
+        server_directory: str = None,
+        blob_handler: 'AzureBlobHandler' = None,
+        container: str = None,
+        data_source: str = None,
+        batch_size: int = None,
+        tablock: bool = True,
+        fallback: bool = True,
+        auto_create_table: bool = True,
+        replace_table: bool = False,
+        infer_types: bool = True
+    ) -> int:
+        """
+        ### bulk_insert
+
+        Version: 1.2
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Inserts data into a specified table through SQL Server's bulk load path. The data is serialised to a CSV file, staged either in a directory the server can read or in an Azure blob container behind an external data source, and loaded with `BULK INSERT`. The staged file is removed afterwards. The columns of the data must be in the same order as the columns of the table.
+
+        If the login lacks bulk load permissions and fallback is true, the data is inserted with SQLHandler.insert instead.
+
+        #### Requirements:
+        - SQLHandler.create_table
+        - SQLHandler.write_bulk_file
+        - SQLHandler.__bulk_insert_command
+        - SQLHandler.execute_query
+        - SQLHandler.insert
+        - AzureBlobHandler.write_to_blob
+        - AzureBlobHandler.delete_blob
+
+        #### Parameters:
+        - schema (str): The schema of the object to insert to.
+        - table (str): The table to insert to.
+        - data (Tabular|pandas.DataFrame): The values to be inserted.
+        - directory (str): The local directory to stage the file in. Defaults to the system temporary directory when staging in a blob, otherwise required.
+        - server_directory (str): The same directory as seen by the server, if different. Defaults to directory.
+        - blob_handler (AzureBlobHandler): If populated, the file is staged in Azure blob storage with this handler. Defaults to None.
+        - container (str): The container to stage the blob in. Required with blob_handler.
+        - data_source (str): The external data source on the database that points to the storage account. Required with blob_handler.
+        - batch_size (int): The number of rows per batch committed by the server. Defaults to the whole file in one batch.
+        - tablock (bool): If true, a table lock is taken, allowing minimal logging. Defaults to true.
+        - fallback (bool): If true, the data is inserted with SQLHandler.insert when bulk loading is not permitted. Defaults to true.
+        - auto_create_table (bool): If true, the table is created if it does not already exist. Defaults to true.
+        - replace_table (bool): If true, the table is replaced if it already exists. Defaults to false.
+        - infer_types (bool): If true and the table is created, its datatypes are inferred from the data. Defaults to true.
+
+        #### Returns:
+        - rows (int): The number of rows inserted.
+
+        #### Usage:
+        >>> executor.bulk_insert('schema', 'table', data, directory = '//fileserver/share')
+        >>> executor.bulk_insert('schema', 'table', data, blob_handler = aztore, container = 'staging', data_source = 'blob_staging')
+
+        #### History:
+        - 1.2 JRA (2026-10-17): No longer closes the connection after a failed load, as execute_query releases it.
+        - 1.1 JRA (2026-10-17): Added infer_types.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = Tabular(data = data)
+        elif not isinstance(data, Tabular):
+            error = f"Invalid datatype passed to `data` argument of `SQLHandler.bulk_insert`."
+            LOG.error(error)
+            raise ValueError(error)
+        if blob_handler is not None and (container is None or data_source is None):
+            error = "Both container and data_source are required to stage a bulk insert in a blob."
+            LOG.error(error)
+            raise ValueError(error)
+        if blob_handler is None and directory is None:
+            error = "A directory or blob_handler is required to stage a bulk insert."
+            LOG.error(error)
+            raise ValueError(error)
+
+        if auto_create_table:
+            if not self.create_table(table = table, columns = data.columns, schema = schema, replace = replace_table, data = data if infer_types else None):
+                LOG.error(f"Could not create table for bulk insert.")
+                return 0
+        object_name = self.__schema_table_to_object_name(schema, table)
+
+        filename = f"{table.strip('[]')}_{uuid4().hex}.csv"
+        file = os.path.join(directory or gettempdir(), filename)
+        self.write_bulk_file(data, file)
+        try:
+            if blob_handler is not None:
+                LOG.sql(f"Staging bulk file in {container}...")
+                with open(file, 'rb') as f:
+                    blob_handler.write_to_blob(container = container, blob = filename, data = f, force = True)
+                source = f"{container}/{filename}"
+            elif server_directory is None:
+                source = file
+            else:
+                separator = '\\' if '\\' in server_directory else '/'
+                source = server_directory.rstrip('\\/') + separator + filename
+
+            LOG.sql(f"Bulk inserting {data.row_count} rows into {object_name} on {self}...")
+            try:
+                self.execute_query(self.__bulk_insert_command(object_name, source, data_source, batch_size, tablock), commit = True)
+            except pyodbc.Error as e:
+                if not (fallback and ('4834' in str(e) or 'ADMINISTER BULK OPERATIONS' in str(e).upper())):
+                    raise
+                LOG.warning(f"Bulk load is not permitted on {self}, falling back to insert. {e}")
+                return self.insert(schema, table, data, auto_create_table = False, batch_size = batch_size)
+            finally:
+                if blob_handler is not None:
+                    blob_handler.delete_blob(container = container, blob = filename)
+        finally:
+            os.remove(file)
+        LOG.sql(f"Bulk insert was successful!")
+        return data.row_count
+
+class AsyncSQLHandler:
+    """
+    ## AsyncSQLHandler
+
+    Version: 1.3
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Asyncio front-end for SQLHandler. Blocking pyodbc work runs on a bounded thread pool, each call on its own spawned handler with connections borrowed from a shared connection pool, so that many independent queries can be awaited concurrently without blocking the event loop.
+
+    #### Artefacts:
+    - handler (SQLHandler): The pooled handler that work is spawned from.
+    - max_concurrency (int): The maximum number of calls and open iterators in flight at once, at most the size of the connection pool.
+    - __executor (concurrent.futures.ThreadPoolExecutor): Runs the blocking work.
+    - __semaphore (asyncio.Semaphore): Limits the number of calls in flight.
+    - __init__ (func): Initialises the handler.
+    - __str__ (func): Returns the server and database of the handler.
+    - __aenter__ (func): Returns the handler for use in an `async with` block.
+    - __aexit__ (func): Closes the handler at the end of an `async with` block.
+    - __slots (func): Returns the semaphore limiting the number of calls in flight.
+    - __run (func): Runs a blocking function in the thread pool.
+    - __call (func): Runs a SQLHandler method on a spawned handler in the thread pool.
+    - __spawned (func): Runs a SQLHandler method on a spawned handler, releasing its connection afterwards.
+    - execute_query (func): Executes a SQL query and returns output - if any - as a pyjra.utilities.Tabular.
+    - iter_query (func): Executes a SQL query and asynchronously yields the output in pyjra.utilities.Tabular batches.
+    - insert (func): Inserts data into a specified table.
+    - create_table (func): Creates a table in the database.
+    - close (func): Shuts down the thread pool and closes pooled connections.
+
+    #### Usage:
+    >>> async with AsyncSQLHandler(environment = 'dev', max_workers = 16) as executor:
+            results = await asyncio.gather(*(executor.execute_query(query) for query in queries))
+            async for batch in executor.iter_query("SELECT * FROM [table]"):
+                ...
+
+    #### History:
+    - 1.3 JRA (2026-10-17): Spawned handlers release their connections when a call fails; execute_query v1.2, insert v1.1 and create_table v1.1.
+    - 1.2 JRA (2026-10-17): iter_query holds a concurrency slot for its lifetime and concurrency is capped at the pool size.
+    - 1.1 JRA (2026-10-17): execute_query v1.1.
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(
+        self,
+        handler: SQLHandler = None,
+        max_workers: int = 8,
+        max_concurrency: int = None,
+        **kwargs
+    ):
+        """
+        ### __init__
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the handler.
+
+        #### Parameters:
+        - handler (SQLHandler): The handler to spawn work from. Defaults to a new SQLHandler built from kwargs with a pool of max_workers connections.
+        - max_workers (int): The number of threads running blocking work. Defaults to 8.
+        - max_concurrency (int): The maximum number of calls and open iterators in flight at once; calls beyond this wait without occupying a thread. Capped at the size of the connection pool, so that no thread blocks waiting for a connection. Defaults to max_workers.
+        - kwargs: Passed to SQLHandler when handler is not supplied.
+
+        #### Usage:
+        >>> executor = AsyncSQLHandler(environment = 'dev', max_workers = 16)
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Caps max_concurrency at the size of the connection pool.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if handler is None:
+            kwargs.setdefault('pool_size', max_workers)
+            handler = SQLHandler(**kwargs)
+        elif handler.pool is None:
+            LOG.warning(f"Handler for {handler} is not pooled, so every asynchronous call will open a new connection.")
+        self.handler = handler
+        self.max_concurrency = max_concurrency or max_workers
+        if handler.pool is not None and self.max_concurrency > handler.pool.size:
+            LOG.warning(f"Limiting concurrency of {handler} to the {handler.pool.size} pooled connections.")
+            self.max_concurrency = handler.pool.size
+        self.__executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = 'pyjra-async')
+        self.__semaphore = None
+        return
+
+    def __str__(self) -> str:
+        """
+        ### __str__
 
-    #     #### Explanation:
-    #     Executes a DQL script and returns the result as a DataFrame.
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
 
-    #     #### Requirements:
-    #     - SQLHandler.connect_to_mssql
+        #### Explanation:
+        Returns the server and database of the handler.
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> print(executor)
+        "[server].[database]"
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return str(self.handler)
+
+    async def __aenter__(self) -> 'AsyncSQLHandler':
+        """
+        ### __aenter__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the handler for use in an `async with` block.
+
+        #### Returns:
+        - self (AsyncSQLHandler)
+
+        #### Usage:
+        >>> async with AsyncSQLHandler(environment = 'dev') as executor:
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return self
+
+    async def __aexit__(self, *exc):
+        """
+        ### __aexit__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes the handler at the end of an `async with` block.
+
+        #### Requirements:
+        - AsyncSQLHandler.close
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        await self.close()
+        return
+
+    def __slots(self) -> asyncio.Semaphore:
+        """
+        ### __slots
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the semaphore limiting the number of calls in flight, creating it on first use so that it belongs to the running event loop.
+
+        #### Returns:
+        - (asyncio.Semaphore)
+
+        #### Usage:
+        >>> async with self.__slots():
+                ...
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.__semaphore
+
+    async def __run(self, function: Callable, *args, **kwargs):
+        """
+        ### __run
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Runs a blocking function in the thread pool without taking a concurrency slot. The caller must already hold one.
+
+        #### Parameters:
+        - function (Callable): The blocking function to run.
+        - args, kwargs: Passed to the function.
+
+        #### Returns:
+        - The output of the function.
+
+        #### Usage:
+        >>> await self.__run(next, batches, None)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, partial(function, *args, **kwargs))
+
+    async def __call(self, function: Callable, *args, **kwargs):
+        """
+        ### __call
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Runs a blocking function in the thread pool once a concurrency slot is free.
+
+        #### Parameters:
+        - function (Callable): The blocking function to run.
+        - args, kwargs: Passed to the function.
+
+        #### Returns:
+        - The output of the function.
+
+        #### Usage:
+        >>> await executor.__call(worker.execute_query, "SELECT 1")
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Uses __slots and __run.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        async with self.__slots():
+            return await self.__run(function, *args, **kwargs)
+
+    def __spawned(self, method: str, *args, **kwargs):
+        """
+        ### __spawned
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Runs a SQLHandler method on a newly spawned handler. The spawned handler is not used again, so its connection is rolled back and released even when the method fails, rather than being kept out of the pool.
+
+        #### Requirements:
+        - SQLHandler.spawn
+        - SQLHandler.release_connection
 
-    #     #### Parameters:
-    #     - query (str): The query to run.
-    #     - values (tuple): The values to substitute into the query. Defaults to None.
+        #### Parameters:
+        - method (str): The name of the SQLHandler method to run.
+        - args, kwargs: Passed to the method.
 
-    #     #### Returns:
-    #     - (pandas.DataFrame): Output of query.
+        #### Returns:
+        - The output of the method.
 
-    #     #### Usage:
-    #     >>> executor.select_to_dataframe("SELECT 'value' AS [column]")
-    #     <pandas.DataFrame>
+        #### Usage:
+        >>> await self.__call(self.__spawned, 'insert', schema, table, data)
 
-    #     #### History:
-    #     - 1.2 JRA (2024-02-19): Implemented Tabular.
-    #     - 1.1 JRA (2024-02-12): Error handling moved to connect_to_mssql.
-    #     - 1.0 JRA (2024-02-09): Initial version.
-    #     """
-    #     if not self.connected:
-    #         self.connect_to_mssql(auto_commit = False)
-    #     LOG.sql(f"Generating dataframe against {str(self)}.")
-    #     results = self.execute_query(query, values, commit = False)
-    #     return results.to_dataframe()
-    
-    def execute_query(self, query: str, values: tuple = None, commit: bool = True, name: str = None) -> None|Tabular:
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        worker = self.handler.spawn()
+        try:
+            return getattr(worker, method)(*args, **kwargs)
+        finally:
+            worker.release_connection()
+
+    async def execute_query(self, query: str, values: tuple = None, commit: bool = True, name: str = None, timeout: int = None) -> None|Tabular:
         """
         ### execute_query
 
-        Version: 3.1
+        Version: 1.2
         Authors: JRA
-        Date: 2024-02-23
+        Date: 2026-10-17
 
         #### Explanation:
-        Executes a SQL query.
+        Executes a SQL query on a spawned handler without blocking the event loop. If the awaiting task is cancelled, the query is cancelled on the server too, so it does not keep holding a worker thread and connection.
 
         #### Requirements:
-        - SQLHandler.connect_to_mssql
-        - SQLHandler.close_connection
+        - AsyncSQLHandler.__call
+        - AsyncSQLHandler.__spawned
+        - SQLHandler.execute_query
+        - CancelHandle.cancel
 
         #### Parameters:
         - query (str): The query to run.
         - values (tuple): The values to substitute into the query. Defaults to None.
         - commit (bool): If true, the query is committed.
         - name (str): The name to assign to the results.
+        - timeout (int): The number of seconds the query may run for, or 0 for no limit. Defaults to the handler's query_timeout.
 
         #### Returns:
         - selection (None|Tabular): The output selection of the query.
 
         #### Usage:
-        >>> executor.execute_query("SELECT 'value' AS [column]")
+        >>> await executor.execute_query("SELECT 'value' AS [column]")
+        >>> await asyncio.wait_for(executor.execute_query("EXEC [dbo].[usp_slow]"), 30)
 
         #### History:
-        - 3.1 JRA (2024-02-23): Added support for queries with no returns.
-        - 3.0 JRA (2024-02-19): Refactored to use Tabular.
-        - 2.0 JRA (2024-02-12): Revamped error handling.
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.2 JRA (2026-10-17): Runs on a spawned handler whose connection is released even when the query fails.
+        - 1.1 JRA (2026-10-17): Added timeout and cancels the query when the task is cancelled.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if not self.connected:
-            self.connect_to_mssql(auto_commit = commit)
-        LOG.sql(f"Running script against {str(self)}:\n{query}\nValues: {values}.")
-
-        try:
-            if values is None:
-                self.cursor.execute(query)
-            else:
-                self.cursor.execute(query, (values))
-        except pyodbc.ProgrammingError as e:
-            LOG.error(f"Failed to parse script on {self}. {e}")
-            raise
-        except Exception as e:
-            LOG.critical(f"Unexpected {type(e)} error occurred whilst executing query on {self}. {e}")
-            raise
-
-        try:
-            selection = self.cursor.fetchall()
-        except pyodbc.ProgrammingError as e:
-            LOG.warning(f"Could not retrieve query results. {e}")
-            selection = None
-        except Exception as e:
-            LOG.critical(f"Unexpected {type(e)} error occurred whilst retrieving query results on {self}. {e}")
-            raise
-
+        handle = CancelHandle()
         try:
-            columns = [col[0] for col in self.cursor.description]
-            datatypes = [col[1] for col in self.cursor.description]
-        except TypeError as e:
-            LOG.warning(f"No query results to read metadata of.")
-            columns = None
-            datatypes = None
-        except Exception as e:
-            LOG.critical(f"Unexpected {type(e)} error occurred whilst retrieving query results on {self}. {e}")
+            return await self.__call(self.__spawned, 'execute_query', query, values, commit = commit, name = name, timeout = timeout, cancel = handle)
+        except asyncio.CancelledError:
+            handle.cancel()
             raise
 
-        if selection is not None:
-            selection = Tabular(
-                data = [tuple(row) for row in selection], 
-                columns = columns,
-                datatypes = datatypes,
-                name = name
-            )
-
-        self.close_connection(commit)
-        return selection
-    
-    # def query_columns(self, query: str = None, values: tuple = None):
-    #     """
-    #     ### query_columns
+    async def iter_query(
+        self, 
+        query: str, 
+        values: tuple = None, 
+        commit: bool = True, 
+        name: str = None,
+        batch_size: int = 10000
+    ) -> AsyncIterator[Tabular]:
+        """
+        ### iter_query
 
-    #     Version: 2.0
-    #     Authors: JRA
-    #     Date: 2024-02-12
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
 
-    #     #### Explanation:
-    #     Retrieves the columns of a query or the most recently executed query.
+        #### Explanation:
+        Executes a SQL query and asynchronously yields the results as Tabular batches. The spawned handler keeps its connection until the iteration finishes, and each batch is fetched in the thread pool.
 
-    #     #### Requirements:
-    #     - SQLHandler.execute_query
+        The iterator holds a concurrency slot for its whole lifetime, as it holds a pooled connection for as long, so iterators beyond max_concurrency wait on the event loop rather than blocking threads on the pool. Iterators should be read to the end or closed to release their slot.
 
-    #     #### Parameters:
-    #     - query (str): The query to execute if needed. Defaults to the previous query.
-    #     - values (tuple): The values to substitute into the query. Defaults to previous query.
+        #### Requirements:
+        - AsyncSQLHandler.__slots
+        - AsyncSQLHandler.__run
+        - SQLHandler.spawn
+        - SQLHandler.iter_query
 
-    #     #### Returns:
-    #     - cols (list[str]): A list of columns of the output of the select query.
+        #### Parameters:
+        - query (str): The query to run.
+        - values (tuple): The values to substitute into the query. Defaults to None.
+        - commit (bool): If true, the query is committed once the results have been read. Defaults to true.
+        - name (str): The name to assign to each batch.
+        - batch_size (int): The maximum number of rows per batch. Defaults to 10000.
 
-    #     #### Usage:
-    #     >>> executor.query_columns()
-    #     ['column']
+        #### Returns:
+        - (AsyncIterator[Tabular])
 
-    #     #### History:
-    #     - 2.0 JRA (2024-02-09): Revamped error handling.
-    #     - 1.0 JRA (2024-02-09): Initial version.
-    #     """
-    #     if query is not None:
-    #         self.execute_query(query, values, commit = False)
+        #### Usage:
+        >>> async for batch in executor.iter_query("SELECT * FROM [table]"):
+                ...
 
-    #     try:
-    #         cols = [col[0] for col in self.description]
-    #     except TypeError as e:
-    #         LOG.warning(f"No query description available from {self}. {e}")
-    #         raise
-    #     except Exception as e:
-    #         LOG.critical(f"Unexpected {type(e)} error occurred when reading cursor description from {self}. {e}")
-    #         raise
-    #     else:
-    #         return cols
+        #### History:
+        - 1.1 JRA (2026-10-17): Holds a concurrency slot for the lifetime of the iterator, as an iterator holds a pooled connection between batches.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        async with self.__slots():
+            batches = self.handler.spawn().iter_query(query, values, commit = commit, name = name, batch_size = batch_size)
+            try:
+                while True:
+                    batch = await self.__run(next, batches, None)
+                    if batch is None:
+                        break
+                    yield batch
+            finally:
+                await self.__run(batches.close)
+        return
 
-    def insert(
-        self, 
-        schema: str,  
-        table: str,
-        data: Tabular|pd.DataFrame|list[tuple],
-        columns: list[str] = None, 
-        prescript: str = None,
-        postscript: str = None,
-        fast_execute: bool = True,
-        auto_create_table: bool = True,
-        replace_table: bool = False,
-        commit: bool = True
-    ):
+    async def insert(self, schema: str, table: str, data: Tabular|pd.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular], **kwargs) -> int:
         """
         ### insert
 
-        Version: 2.2
+        Version: 1.1
         Authors: JRA
-        Date: 2024-02-23
+        Date: 2026-10-17
 
         #### Explanation:
-        Inserts data into a specified table.
+        Inserts data into a specified table on a spawned handler without blocking the event loop.
 
         #### Requirements:
-        - SQLHandler.connect_to_mssql
-        - SQLHandler.create_table
-        - SQLHandler.close_connection
+        - AsyncSQLHandler.__call
+        - AsyncSQLHandler.__spawned
+        - SQLHandler.insert
 
         #### Parameters:
         - schema (str): The schema of the object to insert to.
         - table (str): The table to insert to.
-        - data (Tabular|pandas.DataFrame|list[tuple]): The values to be inserted.
-        - columns (list[str]): The columns to insert to. Defaults to all columns of existing table. Defaults to None.
-        - prescript (str): A script to run prior to the insert. Defaults to None.
-        - postcript (str): A script to run after the insert. Defaults to None.
-        - fast_execute (bool): If true, fast execute is utilised. Failed inserts are retried without fast execute. Defaults to true.
-        - auto_create_table (bool): If true, the table is created if it does not already exist. Defaults to true.
-        - replace_table (bool): If true, the table is replaced if it already exists. Defaults to false.
-        - commit (bool): If true, the insert is committed. Defaults to true.
+        - data (Tabular|pandas.DataFrame|list[tuple]|Iterable[tuple]|Iterable[Tabular]): The values to be inserted.
+        - kwargs: Passed to SQLHandler.insert.
 
-        #### Usage:
-        >>> executor.insert('schema', 'table', df)
+        #### Returns:
+        - rows (int): The number of rows inserted.
 
-        #### Tasklist:
-        - Add functionality to retry inserts without fast_executemany - not sure which error warrants the retry.
+        #### Usage:
+        >>> await executor.insert('schema', 'table', data)
 
         #### History:
-        - 2.2 JRA (2024-02-23): Fixed an issue where `len(data.col_count)` was attempted.
-        - 2.1 JRA (2024-02-19): Implemented Tabular.
-        - 2.0 JRA (2024-02-09): Revamped error handling.
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.1 JRA (2026-10-17): Runs on a spawned handler whose connection is released even when the insert fails.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        if data is None:
-            LOG.error("No values given to insert.")
-            return
-        elif isinstance(data, pd.DataFrame):
-            data = Tabular(data = data)
-        elif isinstance(data, list):
-            data = Tabular(data = data, columns = columns)
-        elif not isinstance(data, Tabular):
-            error = f"Invalid datatype passed to `data` argument of `SQLHandler.insert`."
-            LOG.error(error)
-            raise ValueError(error)
-        
-        if not self.connected:
-            self.connect_to_mssql(auto_commit = commit)
-        
-        if auto_create_table:
-            if not self.create_table(table = table, columns = data.columns, schema = schema, replace = replace_table, commit = commit):
-                LOG.error(f"Could not create table for insert.")
-                return
-        object_name = self.__schema_table_to_object_name(schema, table)
-
-        self.connect_to_mssql(commit)
-
-        if prescript is not None:
-            LOG.sql(f"Running prescript...")
-            self.execute_query(prescript)
-
-        LOG.sql(f"Inserting into {object_name} on {self}...")
-        self.cursor.fast_executemany = fast_execute
-        cmd = f"INSERT INTO {object_name}{'([' + '], ['.join(data.columns) + '])' if len(data.columns) > 0 else ''} VALUES ({'?' + (data.col_count - 1)*', ?'})"
-        try:
-            self.cursor.executemany(cmd, data.data)
-        except pyodbc.ProgrammingError as e:
-            LOG.error(f"Failed to parse script on {self}. {e}")
-            raise
-        except Exception as e:
-            LOG.critical(f"Unexpected {type(e)} error occurred whilst performing insert to {object_name} on {self}. {e}")
-            raise
-        LOG.sql(f"Insert was successful!")
-        
-        if postscript is not None:
-            LOG.sql(f"Running postscript...")
-            self.execute_query(postscript)
-        self.close_connection(commit = commit)
+        return await self.__call(self.__spawned, 'insert', schema, table, data, **kwargs)
 
-        # try:
-        #     LOG.sql(f"Inserting into {object_name} at {str(self)}...")
-        #     self.connect_to_mssql(commit)
-        #     if prescript is not None:
-        #         LOG.sql(f"Running script against {str(self)}:\n{prescript}")
-        #         self.cursor.execute(prescript)
-        #     self.cursor.fast_executemany = fast_execute
-        #     cmd = f"INSERT INTO {object_name}{'([' + '], ['.join(cols) + '])' if len(cols) > 0 else ''} VALUES ({'?' + (len(values[0]) - 1)*', ?'})"
-        #     try:
-        #         self.cursor.executemany(cmd, values)
-        #     except Exception as e:
-        #         if fast_execute:
-        #             LOG.error(f"Insert failed. {error}.\nAttempting insert without fast_executemany...")
-        #             self.cursor.fast_executemany = False
-        #             self.cursor.executemany(cmd, values)
-        #     if postscript is not None:
-        #         LOG.sql(f"Running script against {str(self)}:\n{postscript}")
-        #         self.cursor.execute(postscript)
-        # except Exception as e:
-        #     self.close_connection(commit = False)
-        #     LOG.error(f"Insert failed. Error: {error}.")
-        # else:
-        #     LOG.sql(f"Insert complete!")
-        #     self.close_connection(commit)
-        return
-    
-    def create_table(
-        self,
-        table: str, 
-        columns: list[str] = [], 
-        datatypes: list[str] = [], 
-        schema: str = None, 
-        replace: bool = False,
-        commit: bool = True
-    ) -> bool:
+    async def create_table(self, table: str, columns: list[str] = [], datatypes: list[str] = [], schema: str = None, **kwargs) -> bool:
         """
         ### create_table
 
-        Version: 2.2
+        Version: 1.1
         Authors: JRA
-        Date: 2024-02-23
+        Date: 2026-10-17
 
-        #### Explanation: 
-        Creates a table in the database.
+        #### Explanation:
+        Creates a table in the database on a spawned handler without blocking the event loop.
 
         #### Requirements:
-        - SQLHandler.__schema_table_to_object_name
-        - SQLHandler.execute_query
-        - SQLHandler.close_connection
+        - AsyncSQLHandler.__call
+        - AsyncSQLHandler.__spawned
+        - SQLHandler.create_table
 
         #### Parameters:
         - table (str): The name of the table.
         - columns (list[str]): The columns of the table.
         - datatypes (list[str]): The datatypes of the columns.
         - schema (str): The schema of the table. Defaults to None.
-        - replace (bool): If true, if the table name already exists, then that table is dropped first. Defaults to False.
-        - commit (bool): If true, the transaction is committed. Defaults to True.
+        - kwargs: Passed to SQLHandler.create_table.
 
         #### Returns:
         - (bool): True if the transaction passed without issues.
 
         #### Usage:
-        >>> executor.create_table('table', ['column'], ['varchar(16)'])
+        >>> await executor.create_table('table', ['column'], ['varchar(16)'])
 
         #### History:
-        - 2.2 JRA (2024-02-23): Added column alias to `max_length` query.
-        - 2.1 JRA (2024-02-19): Implemented Tabular.
-        - 2.0 JRA (2024-02-12): Revamped error handling.
-        - 1.0 JRA (2024-02-09): Initial version.
+        - 1.1 JRA (2026-10-17): Runs on a spawned handler whose connection is released even when the statement fails.
+        - 1.0 JRA (2026-10-17): Initial version.
         """
-        object_name = self.__schema_table_to_object_name(schema, table)
-        LOG.sql(f"Creating {object_name} on {self}...")
+        return await self.__call(self.__spawned, 'create_table', table, list(columns), list(datatypes), schema, **kwargs)
 
-        if not replace:
-            result = self.execute_query(
-                query = "SELECT OBJECT_ID(?) AS [result]",
-                values = (object_name),
-                commit = False
-            ).to_dict(0)['result']
-            if result is not None:
-                LOG.sql(f"The table {object_name} already exists.")
-                return 1
-            cmd = ""
-        else:
-            cmd = f"DROP TABLE IF EXISTS {object_name};\n"
+    async def close(self):
+        """
+        ### close
 
-        col_count = len(columns)
-        datatype_count = len(datatypes)
-        if datatype_count >= col_count:
-            datatypes = datatypes[:col_count]
-        else:
-            max_length = self.execute_query("SELECT CONVERT(int, [max_length]/2) AS [length] FROM sys.types WHERE [system_type_id] = 231", commit = False).to_dict(0)['length']
-            datatypes.extend([f'nvarchar({max_length})']*(col_count - datatype_count))
-        
-        column_definition = ',\n\t'.join(f"[{col}] {datatype}" for col, datatype in zip(columns, datatypes))
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
 
-        cmd += f"CREATE TABLE {object_name} (\n\t{column_definition}\n)"
-        self.execute_query(cmd, commit = commit)
-        LOG.sql(f"Successfully created table {object_name} at {str(self)}.")
-        return 1
+        #### Explanation:
+        Waits for running work to finish, then shuts down the thread pool and closes pooled connections.
+
+        #### Requirements:
+        - SQLHandler.close_pool
+
+        #### Usage:
+        >>> await executor.close()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self.__executor.shutdown, wait = True))
+        if self.handler.pool is not None:
+            self.handler.close_pool()
+        return
@@ -1,9 +1,9 @@
 """
 # pyjra.utilities
 
-Version: 1.2
+Version: 1.8
 Authors: JRA
-Date: 2024-03-22
+Date: 2026-10-17
 
 #### Explanation:
 Useful Python utility items.
@@ -12,6 +12,14 @@ Useful Python utility items.
 - pyjra.logger.LOG (const)
 - pandas.DataFrame (class)
 - io.StringIO (class)
+- mmap (class): Memory-maps spilled column files.
+- array.array (class): Binary storage of spilled numeric columns.
+- struct (func): Reads spilled values and offsets.
+- pickle (func): Serialises spilled values.
+- tempfile.mkdtemp (func): Creates directories for spilled column files.
+- shutil.rmtree (func): Deletes spilled column files.
+- weakref.finalize (class): Deletes spilled column files when they are no longer referenced.
+- os (module): Paths of spilled column files.
 
 #### Artefacts:
 - justify_text (func): Fits text into a column of a given width.
@@ -30,12 +38,20 @@ Useful Python utility items.
 - gradient_rgb (func): Finds colour on a linear gradient as an RGB value.
 - gradient_hex (func): Finds colour on a linear gradient as a hexcode.
 - Tabular (class): Class for handling tabulated data.
+- SpilledRows (class): Read-only sequence of the rows of a SpilledTabular.
+- SpilledTabular (class): Disk-backed, memory-mapped Tabular for data too large to hold in memory.
 
 #### Usage:
 >>> import pyjra.utilities
 >>> from pyjra.utilities import Tabular
 
 #### History:
+- 1.8 JRA (2026-10-17): SpilledTabular v1.1.
+- 1.7 JRA (2026-10-17): Tabular v1.5.
+- 1.6 JRA (2026-10-17): Tabular v1.4.
+- 1.5 JRA (2026-10-17): Added SpilledRows and SpilledTabular.
+- 1.4 JRA (2026-10-17): Tabular v1.3.
+- 1.3 JRA (2026-10-17): Tabular v1.2.
 - 1.2 JRA (2024-03-22): Tabular v1.1.
 - 1.1 JRA (2024-03-19): Implemented LOG v2.0.
 - 1.0 JRA (2024-03-05): Initial version.
@@ -46,6 +62,19 @@ LOG.set_level(min(LOG.level, 16))
 
 from pandas import DataFrame
 from io import StringIO
+from mmap import mmap
+from mmap import ACCESS_READ
+from array import array
+from struct import pack
+from struct import unpack_from
+from pickle import dumps
+from pickle import loads
+from tempfile import mkdtemp
+from shutil import rmtree
+from weakref import finalize
+from typing import Iterable
+from typing import Iterator
+import os
 
 def justify_text(text: str, width: int = 64, tab_length: int = 4) -> str:
     """
@@ -806,9 +835,9 @@ class Tabular():
     """
     ## Tabular
 
-    Version: 1.1
+    Version: 1.5
     Authors: JRA
-    Date: 2024-03-21
+    Date: 2026-10-17
 
     #### Explanation:
     Class for handling tabulated data.
@@ -834,6 +863,8 @@ class Tabular():
         - Check number datatypes or build datatypes list.
     - __init_no_check (func): Initialises a Tabular instance without performing validation checks.
     - tabular_from_tabular (func): Creates a new Tabular object from the existing instance without performing validation checks.
+    - from_trusted (func): Fast constructor for data from trusted sources that already guarantee its shape and types.
+    - blanks_to_none (func): Reads empty strings in the text columns of data as None.
     - transpose (func): Tranposes the storage of the data between a list of rows and a list of columns.
     - col_pos (func): Returns the column number of a given column name.
     - delete_columns (func): Delete columns from the current Tabular.
@@ -871,6 +902,10 @@ class Tabular():
     [<class 'int'>, <class 'int'>, <class 'int'>]
 
     #### History:
+    - 1.5 JRA (2026-10-17): from_trusted v1.1 and added blanks_to_none.
+    - 1.4 JRA (2026-10-17): get_column always returns a tuple.
+    - 1.3 JRA (2026-10-17): Added from_trusted.
+    - 1.2 JRA (2026-10-17): get_column v1.1.
     - 1.1 JRA (2024-03-22): __init__ v1.1, __validata v1.1 and insert v1.0.
     - 1.0 JRA (2024-03-05): Initial version.
     """
@@ -1344,6 +1379,108 @@ class Tabular():
         )
         return output
 
+    @staticmethod
+    def blanks_to_none(data: list, datatypes: list[type], row_based: bool = True) -> list:
+        """
+        ### blanks_to_none
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads empty strings in the text columns of data as None, as `__init__` does. Only columns with a datatype of str are scanned, and rows without an empty string are kept as they are.
+
+        #### Parameters:
+        - data (list): A list of rows, or of columns if not row_based.
+        - datatypes (list[type]): The datatypes of the columns.
+        - row_based (bool): If true, the data is a list of rows. If false, the data is a list of columns. Defaults to true.
+
+        #### Returns:
+        - data (list)
+
+        #### Usage:
+        >>> Tabular.blanks_to_none([(1, ''), (2, 'b')], [int, str])
+        [(1, None), (2, 'b')]
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        text = [c for c, datatype in enumerate(datatypes or []) if datatype is str]
+        if len(text) == 0:
+            return data
+        if not row_based:
+            for c in text:
+                if '' in data[c]:
+                    data[c] = [None if value == '' else value for value in data[c]]
+            return data
+        return [tuple(None if value == '' else value for value in row) if any(row[c] == '' for c in text) else row for row in data]
+
+    @staticmethod
+    def from_trusted(
+        data: list[tuple],
+        columns: list[str],
+        datatypes: list[type],
+        row_based: bool = True,
+        name: str = None,
+        blanks_as_none: bool = False
+    ):
+        """
+        ### from_trusted
+
+        Version: 1.1
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Fast constructor for data from trusted sources, such as database drivers, that already guarantee its shape and types. None of the checks, conversions or transpositions of `__init__` are performed, so the cost is independent of the size of the data.
+        
+        The caller must guarantee that the data is a list of tuples (or of columns if not row_based) all of the same length as columns, and that every value is None or of the datatype of its column. Empty strings are kept as they are rather than being read as None, unless blanks_as_none.
+
+        #### Requirements:
+        - Tabular.blanks_to_none (func)
+        - Tabular.tabular_from_tabular (func)
+
+        #### Parameters:
+        - data (list[tuple]): The data stored in the Tabular.
+        - columns (list[str]): The columns of the Tabular.
+        - datatypes (list[type]): The datatypes of the Tabular.
+        - row_based (bool): If true, the data is a list of rows. If false, the data is a list of columns. Defaults to true.
+        - name (str): The name to associate with the Tabular (optional). Defaults to None.
+        - blanks_as_none (bool): If true, empty strings in text columns are read as None, as `__init__` does. Defaults to false.
+
+        #### Returns:
+        - (Tabular)
+
+        #### Usage:
+        >>> matrix = Tabular.from_trusted(
+                data = [(1, 2, 3), (4, 5, 6), (7, 8, 9)],
+                columns = ['v1', 'v2', 'v3'],
+                datatypes = [int, int, int],
+                name = 'Matrix'
+            )
+
+        #### History:
+        - 1.1 JRA (2026-10-17): Added blanks_as_none.
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if blanks_as_none:
+            data = Tabular.blanks_to_none(data, datatypes, row_based)
+        col_count = len(columns)
+        if row_based:
+            row_count = len(data)
+        else:
+            row_count = len(data[0]) if col_count > 0 else 0
+        return Tabular.tabular_from_tabular(
+            data = data,
+            columns = columns,
+            datatypes = datatypes,
+            row_count = row_count,
+            col_count = col_count,
+            row_based = row_based,
+            name = name
+        )
+
     def transpose(self, row_based: bool = None):
         """
         ### transpose
@@ -1476,12 +1613,12 @@ class Tabular():
         """
         ### get_column
 
-        Version: 1.0
+        Version: 1.2
         Authors: JRA
-        Date: 2024-03-05
+        Date: 2026-10-17
 
         #### Explanation:
-        Retrieves a column from the data.
+        Retrieves a column from the data as a tuple, however the data is stored. The storage of the data is left as it was found.
 
         #### Requirements:
         - Tabular.col_pos (func)
@@ -1498,6 +1635,8 @@ class Tabular():
         (3, 6, 9)
 
         #### History:
+        - 1.2 JRA (2026-10-17): Always returns a tuple, including for columns stored as lists or arrays.
+        - 1.1 JRA (2026-10-17): Column-based storage is no longer transposed back to rows.
         - 1.0 JRA (2024-03-05): Initial version.
         """
         if isinstance(column, str):
@@ -1507,9 +1646,11 @@ class Tabular():
                 error = f'There are only {self.col_count} columns - there is no column at index {column}.'
                 LOG.error(error)
                 raise AttributeError(error)
-        output = self.transpose(row_based = False).data[column]
-        self.transpose(row_based = True)
-        return output
+        row_based = self.row_based
+        self.transpose(row_based = False)
+        output = self.data[column]
+        self.transpose(row_based = row_based)
+        return output if isinstance(output, tuple) else tuple(output)
     
     def insert(self, row: tuple):
         """
@@ -1796,3 +1937,703 @@ class Tabular():
         html += '</table>'
         LOG.utilities(f'Successfully wrote {self.name or "Tabular"} to HTML.')
         return html
+
+class SpilledRows():
+    """
+    ## SpilledRows
+
+    Version: 1.0
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Read-only sequence of the rows of a SpilledTabular. Rows are decoded from the memory-mapped column files as they are accessed, so iterating over them holds only one row in memory at a time.
+
+    #### Artefacts:
+    - __table (SpilledTabular): The table the rows belong to.
+    - __init__ (func): Initialises the sequence.
+    - __len__ (func): Returns the number of rows.
+    - __getitem__ (func): Returns a row, or a list of rows for a slice.
+    - __iter__ (func): Yields the rows in order.
+
+    #### Usage:
+    >>> for row in spilled.data:
+            ...
+
+    #### History:
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    def __init__(self, table: 'SpilledTabular'):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Initialises the sequence.
+
+        #### Parameters:
+        - table (SpilledTabular): The table the rows belong to.
+
+        #### Usage:
+        >>> rows = SpilledRows(spilled)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.__table = table
+        return
+
+    def __len__(self) -> int:
+        """
+        ### __len__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the number of rows.
+
+        #### Returns:
+        - (int)
+
+        #### Usage:
+        >>> len(spilled.data)
+        1000000
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return self.__table.row_count
+
+    def __getitem__(self, key: int|slice) -> tuple|list[tuple]:
+        """
+        ### __getitem__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns a row, or a list of rows for a slice.
+
+        #### Requirements:
+        - SpilledTabular.row
+
+        #### Parameters:
+        - key (int|slice)
+
+        #### Returns:
+        - (tuple|list[tuple])
+
+        #### Usage:
+        >>> spilled.data[-1]
+        (1000000, 'last')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(key, slice):
+            return [self.__table.row(r) for r in range(*key.indices(self.__table.row_count))]
+        if key < 0:
+            key += self.__table.row_count
+        if not 0 <= key < self.__table.row_count:
+            raise IndexError(f"Row {key} is out of range.")
+        return self.__table.row(key)
+
+    def __iter__(self) -> Iterator[tuple]:
+        """
+        ### __iter__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Yields the rows in order.
+
+        #### Requirements:
+        - SpilledTabular.row
+
+        #### Returns:
+        - (Iterator[tuple])
+
+        #### Usage:
+        >>> for row in spilled.data:
+                ...
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        for r in range(self.__table.row_count):
+            yield self.__table.row(r)
+
+class SpilledTabular(Tabular):
+    """
+    ## SpilledTabular
+
+    Version: 1.1
+    Authors: JRA
+    Date: 2026-10-17
+
+    #### Explanation:
+    Disk-backed, read-only Tabular for data too large to hold in memory. Each column is written to its own file in a temporary directory. Integer and float columns are stored as fixed width binary with a null mask, and other columns as pickled values with an offset index. The files are memory-mapped, so the operating system pages data in as it is read and out under memory pressure. The data attribute is a sequence of rows decoded on access, so iteration, get_column, to_delimited and to_dataframe work as for a Tabular without loading everything at once. The files are deleted when the table is closed or garbage collected.
+
+    #### Artefacts:
+    - directory (str): The directory of the column files.
+    - PREVIEW_ROWS (int): The number of rows shown when the table is printed.
+    - kinds (list[str]): The storage of each column: 'q' for integers, 'd' for floats and 'o' for pickled values.
+    - data (SpilledRows): The rows of the table, decoded on access.
+    - __maps (list[dict]): The memory maps of the values, nulls and offsets of each column.
+    - __finalizer (weakref.finalize): Closes the maps and deletes the directory.
+    - __init__ (func): Opens spilled column files.
+    - __str__ (func): Writes the first rows to a pretty text table.
+    - __repr__ (func): Displays an input that would yield the instance.
+    - spill (func): Writes batches of rows to column files and opens them as a SpilledTabular.
+    - __cleanup (func): Closes memory maps and deletes the directory of column files.
+    - __enter__ (func): Returns the table for use in a `with` block.
+    - __exit__ (func): Closes the table at the end of a `with` block.
+    - close (func): Closes the memory maps and deletes the column files.
+    - value (func): Reads a single value.
+    - row (func): Reads a single row.
+    - transpose (func): Does nothing, as the storage is fixed on disk.
+    - get_column (func): Reads a whole column.
+    - to_dataframe (func): Converts the table to a pandas DataFrame one column at a time.
+    - to_tabular (func): Loads the table into an in-memory Tabular.
+    - insert (func): Not supported.
+    - delete_columns (func): Not supported.
+
+    #### Usage:
+    >>> with SpilledTabular.spill(batches, columns = ['id', 'name'], datatypes = [int, str]) as spilled:
+            for row in spilled.data:
+                ...
+            spilled.to_delimited()
+
+    #### History:
+    - 1.1 JRA (2026-10-17): Added __str__ and __repr__, which show only the first rows.
+    - 1.0 JRA (2026-10-17): Initial version.
+    """
+    KINDS = {int: 'q', float: 'd'}
+    PREVIEW_ROWS = 10
+
+    def __init__(
+        self,
+        directory: str,
+        columns: list[str],
+        datatypes: list[type],
+        kinds: list[str],
+        row_count: int,
+        name: str = None
+    ):
+        """
+        ### __init__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Opens column files written by SpilledTabular.spill and memory-maps them. Use SpilledTabular.spill to create a table.
+
+        #### Parameters:
+        - directory (str): The directory of the column files, which is deleted when the table is closed.
+        - columns (list[str]): The columns of the table.
+        - datatypes (list[type]): The datatypes of the columns.
+        - kinds (list[str]): The storage of each column.
+        - row_count (int): The number of rows.
+        - name (str): The name to associate with the table. Defaults to None.
+
+        #### Usage:
+        >>> SpilledTabular(directory, ['id'], [int], ['q'], 1000000)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.directory = directory
+        self.columns = list(columns)
+        self.datatypes = list(datatypes)
+        self.kinds = list(kinds)
+        self.row_count = row_count
+        self.col_count = len(self.columns)
+        self.row_based = True
+        self.name = name
+        self.__maps = []
+        self.__finalizer = finalize(self, SpilledTabular.__cleanup, self.__maps, directory)
+        for c in range(self.col_count):
+            maps = {}
+            for part in ('values', 'nulls', 'offsets'):
+                path = os.path.join(directory, f"{c}.{part}")
+                if os.path.exists(path) and os.path.getsize(path) > 0:
+                    with open(path, 'rb') as file:
+                        maps[part] = mmap(file.fileno(), 0, access = ACCESS_READ)
+            self.__maps.append(maps)
+        self.data = SpilledRows(self)
+        LOG.utilities(f'Opened {self.name or "SpilledTabular"} of {self.row_count} rows from {directory}.')
+        return
+
+    def __str__(self) -> str:
+        """
+        ### __str__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Writes the first PREVIEW_ROWS rows to a pretty text table followed by the row count, so that printing a large table does not decode all of it.
+
+        #### Requirements:
+        - tabulate (func)
+        - SpilledRows.__getitem__
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> print(spilled)
+        ╒════╤══════╕
+        │ id │ code │
+        ╞════╪══════╡
+        │  1 │    a │
+        ├────┼──────┤
+        │  2 │    b │
+        ╘════╧══════╛
+        1000000 rows, showing the first 10.
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        rows = self.data[:self.PREVIEW_ROWS]
+        shown = '.' if len(rows) == self.row_count else f', showing the first {len(rows)}.'
+        return tabulate(table = [tuple(self.columns)] + rows, header = 1, name = self.name) + f"\n{self.row_count} row{'' if self.row_count == 1 else 's'}{shown}"
+
+    def __repr__(self) -> str:
+        """
+        ### __repr__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Displays an input that would yield the instance, with the first PREVIEW_ROWS rows for reference.
+
+        #### Requirements:
+        - SpilledRows.__getitem__
+
+        #### Returns:
+        - (str)
+
+        #### Usage:
+        >>> spilled.__repr__()
+        SpilledTabular(
+            directory = '/tmp/pyjra_spill_x1y2z3',
+            columns = ['id', 'code'],
+            datatypes = ["<class 'int'>", "<class 'str'>"],
+            kinds = ['q', 'o'],
+            row_count = 1000000,
+            name = None)
+        # First 10 rows: [(1, 'a'), (2, 'b'), ...]
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        rows = self.data[:self.PREVIEW_ROWS]
+        preview = repr(rows) if len(rows) == self.row_count else repr(rows)[:-1] + ', ...]'
+        return f"SpilledTabular(\n\tdirectory = {self.directory!r},\n\tcolumns = {self.columns},\n\tdatatypes = {[str(datatype) for datatype in self.datatypes]},\n\tkinds = {self.kinds},\n\trow_count = {self.row_count},\n\tname = {self.name!r})\n# First {len(rows)} rows: {preview}"
+
+    @classmethod
+    def spill(
+        cls,
+        batches: Iterable[list[tuple]],
+        columns: list[str],
+        datatypes: list[type],
+        name: str = None,
+        directory: str = None
+    ) -> 'SpilledTabular':
+        """
+        ### spill
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Writes batches of rows to column files in a new temporary directory and opens them as a SpilledTabular. Only one batch is held in memory at a time. Columns typed int or float are stored as 64-bit binary, and all others as pickled values.
+
+        #### Parameters:
+        - batches (Iterable[list[tuple]]): The rows to write, in batches.
+        - columns (list[str]): The columns of the rows.
+        - datatypes (list[type]): The datatypes of the columns.
+        - name (str): The name to associate with the table. Defaults to None.
+        - directory (str): The directory to create the temporary directory in. Defaults to the system temporary directory.
+
+        #### Returns:
+        - (SpilledTabular)
+
+        #### Usage:
+        >>> spilled = SpilledTabular.spill(iter([[(1, 'a'), (2, 'b')]]), ['id', 'code'], [int, str])
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        path = mkdtemp(prefix = 'pyjra_spill_', dir = directory)
+        kinds = [cls.KINDS.get(datatype, 'o') for datatype in datatypes]
+        files = []
+        offsets = [0]*len(columns)
+        row_count = 0
+        try:
+            for c in range(len(columns)):
+                files.append({part: open(os.path.join(path, f"{c}.{part}"), 'wb') for part in ('values', 'nulls', 'offsets')})
+                files[c]['offsets'].write(pack('q', 0))
+            for batch in batches:
+                if len(batch) == 0:
+                    continue
+                for c, column in enumerate(zip(*batch)):
+                    if kinds[c] != 'o':
+                        try:
+                            array(kinds[c], [0 if value is None else value for value in column]).tofile(files[c]['values'])
+                        except (OverflowError, TypeError) as e:
+                            error = f"Column {columns[c]} has a value that does not fit {datatypes[c]} storage. {e}"
+                            LOG.error(error)
+                            raise ValueError(error)
+                        files[c]['nulls'].write(bytes(value is None for value in column))
+                        continue
+                    for value in column:
+                        encoded = dumps(value)
+                        files[c]['values'].write(encoded)
+                        offsets[c] += len(encoded)
+                        files[c]['offsets'].write(pack('q', offsets[c]))
+                row_count += len(batch)
+        except BaseException:
+            rmtree(path, ignore_errors = True)
+            raise
+        finally:
+            for handles in files:
+                for file in handles.values():
+                    file.close()
+        LOG.utilities(f'Spilled {row_count} rows of {name or "Tabular"} to {path}.')
+        return cls(path, columns, datatypes, kinds, row_count, name)
+
+    @staticmethod
+    def __cleanup(maps: list[dict], directory: str):
+        """
+        ### __cleanup
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes memory maps and deletes the directory of column files. Called once, by close or when the table is garbage collected.
+
+        #### Parameters:
+        - maps (list[dict]): The memory maps of each column.
+        - directory (str): The directory of the column files.
+
+        #### Usage:
+        >>> SpilledTabular.__cleanup(maps, directory)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        for column in maps:
+            for mapped in column.values():
+                mapped.close()
+        maps.clear()
+        rmtree(directory, ignore_errors = True)
+        return
+
+    def __enter__(self) -> 'SpilledTabular':
+        """
+        ### __enter__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Returns the table for use in a `with` block.
+
+        #### Returns:
+        - self (SpilledTabular)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        ### __exit__
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes the table at the end of a `with` block.
+
+        #### Requirements:
+        - SpilledTabular.close
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.close()
+        return
+
+    def close(self):
+        """
+        ### close
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Closes the memory maps and deletes the column files. The table cannot be read afterwards.
+
+        #### Requirements:
+        - SpilledTabular.__cleanup
+
+        #### Usage:
+        >>> spilled.close()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        self.__finalizer()
+        self.row_count = 0
+        LOG.utilities(f'Closed {self.name or "SpilledTabular"} and deleted {self.directory}.')
+        return
+
+    def value(self, r: int, c: int):
+        """
+        ### value
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads a single value from the memory-mapped column files.
+
+        #### Parameters:
+        - r (int): The index of the row.
+        - c (int): The index of the column.
+
+        #### Returns:
+        - The value, or None if it is null.
+
+        #### Usage:
+        >>> spilled.value(0, 1)
+        'a'
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        maps = self.__maps[c]
+        if self.kinds[c] == 'o':
+            start, end = unpack_from('2q', maps['offsets'], 8*r)
+            return loads(maps['values'][start:end])
+        if maps['nulls'][r]:
+            return None
+        return unpack_from(self.kinds[c], maps['values'], 8*r)[0]
+
+    def row(self, r: int) -> tuple:
+        """
+        ### row
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads a single row from the memory-mapped column files.
+
+        #### Requirements:
+        - SpilledTabular.value
+
+        #### Parameters:
+        - r (int): The index of the row.
+
+        #### Returns:
+        - (tuple)
+
+        #### Usage:
+        >>> spilled.row(0)
+        (1, 'a')
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return tuple(self.value(r, c) for c in range(self.col_count))
+
+    def transpose(self, row_based: bool = None):
+        """
+        ### transpose
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Does nothing, as the storage is fixed on disk. The data is always presented as rows, and columns are read with get_column.
+
+        #### Parameters:
+        - row_based (bool): Ignored.
+
+        #### Returns:
+        - self (SpilledTabular)
+
+        #### Usage:
+        >>> spilled.transpose()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return self
+
+    def get_column(self, column: int|str) -> tuple:
+        """
+        ### get_column
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Reads a whole column from its file, leaving the other columns on disk. Integer and float columns are read in one pass over their binary values.
+
+        #### Requirements:
+        - Tabular.col_pos (func)
+        - SpilledTabular.value
+
+        #### Parameters:
+        - column (int|str): The column name or index to retrieve.
+
+        #### Returns:
+        - (tuple)
+
+        #### Usage:
+        >>> spilled.get_column('id')
+        (1, 2, 3)
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        if isinstance(column, str):
+            column = self.col_pos(column)
+        elif column >= self.col_count:
+            error = f'There are only {self.col_count} columns - there is no column at index {column}.'
+            LOG.error(error)
+            raise AttributeError(error)
+        if self.row_count == 0:
+            return ()
+        if self.kinds[column] == 'o':
+            return tuple(self.value(r, column) for r in range(self.row_count))
+        values = array(self.kinds[column])
+        values.frombytes(self.__maps[column]['values'][:8*self.row_count])
+        nulls = self.__maps[column]['nulls']
+        return tuple(None if null else value for value, null in zip(values, nulls[:self.row_count]))
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        ### to_dataframe
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Converts the table to a pandas DataFrame, reading one column at a time so that rows are never all decoded at once.
+
+        #### Requirements:
+        - SpilledTabular.get_column
+
+        #### Returns:
+        - pandas.DataFrame
+
+        #### Usage:
+        >>> spilled.to_dataframe()
+        <pandas.DataFrame>
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        LOG.utilities(f'Writing {self.name or "SpilledTabular"} to a DataFrame.')
+        frame = DataFrame(index = range(self.row_count))
+        for c, column in enumerate(self.columns):
+            frame[column] = self.get_column(c)
+        return frame
+
+    def to_tabular(self) -> Tabular:
+        """
+        ### to_tabular
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Loads the table into an in-memory Tabular.
+
+        #### Requirements:
+        - Tabular.from_trusted
+
+        #### Returns:
+        - (Tabular)
+
+        #### Usage:
+        >>> spilled.to_tabular()
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        return Tabular.from_trusted(list(self.data), list(self.columns), list(self.datatypes), name = self.name)
+
+    def insert(self, row: tuple):
+        """
+        ### insert
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Not supported, as a SpilledTabular is read-only. Load it with to_tabular first.
+
+        #### Parameters:
+        - row (tuple): The row to be added.
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        error = f"{self.name or 'SpilledTabular'} is read-only."
+        LOG.error(error)
+        raise ValueError(error)
+
+    def delete_columns(self, columns: int|str|list[int]|list[str]):
+        """
+        ### delete_columns
+
+        Version: 1.0
+        Authors: JRA
+        Date: 2026-10-17
+
+        #### Explanation:
+        Not supported, as a SpilledTabular is read-only. Load it with to_tabular first.
+
+        #### Parameters:
+        - columns (int|str|list[int]|list[str]): The columns to be deleted.
+
+        #### History:
+        - 1.0 JRA (2026-10-17): Initial version.
+        """
+        error = f"{self.name or 'SpilledTabular'} is read-only."
+        LOG.error(error)
+        raise ValueError(error)
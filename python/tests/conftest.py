@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_pyodbc
+sys.modules['pyodbc'] = fake_pyodbc
+
+from pyjra.sql import SQLHandler
+
+@pytest.fixture(autouse = True)
+def odbc():
+    fake_pyodbc.reset()
+    yield fake_pyodbc
+    fake_pyodbc.reset()
+
+@pytest.fixture
+def handler() -> SQLHandler:
+    return SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password')
+
+@pytest.fixture
+def pooled() -> SQLHandler:
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', pool_size = 2)
+    yield executor
+    if executor.pool is not None:
+        executor.close_pool()
@@ -0,0 +1,181 @@
+"""
+# fake_pyodbc
+
+A stand in for pyodbc so that the behaviour of pyjra.sql can be tested without an ODBC driver or a database.
+
+Queries are answered from `RESULTS`, which maps a substring of a query to one of:
+- (description, rows): A result set, where description is a list of (column, type) pairs.
+- list[(description, rows)]: Several result sets, read with `nextset`.
+- Exception: Raised by the call.
+- Callable[[str, tuple|list], ...]: Called with the query and its parameters (or rows for `executemany`) and returns one of the above or None.
+
+Every call is appended to `LOG` so tests can assert on what was sent.
+"""
+import threading
+
+class Error(Exception): pass
+class DatabaseError(Error): pass
+class OperationalError(DatabaseError): pass
+class InterfaceError(Error): pass
+class ProgrammingError(DatabaseError): pass
+class IntegrityError(DatabaseError): pass
+class DataError(DatabaseError): pass
+
+SQL_WVARCHAR = -9
+SQL_VARCHAR = 12
+SQL_LONGVARCHAR = -1
+SQL_WLONGVARCHAR = -10
+SQL_BIT = -7
+SQL_TINYINT = -6
+SQL_SMALLINT = 5
+SQL_INTEGER = 4
+SQL_BIGINT = -5
+SQL_REAL = 7
+SQL_FLOAT = 6
+SQL_DOUBLE = 8
+SQL_DECIMAL = 3
+SQL_NUMERIC = 2
+SQL_TYPE_DATE = 91
+SQL_TYPE_TIME = 92
+SQL_SS_TIME2 = -154
+SQL_TYPE_TIMESTAMP = 93
+SQL_VARBINARY = -3
+SQL_GUID = -11
+
+LOG = []
+RESULTS = {}
+CONNECTIONS = []
+FAIL_CONNECT = []
+LOCK = threading.Lock()
+
+def reset():
+    """Clears all recorded calls, canned results and connections."""
+    LOG.clear()
+    RESULTS.clear()
+    CONNECTIONS.clear()
+    FAIL_CONNECT.clear()
+
+def queries() -> list[str]:
+    """Returns the text of every query executed, in order."""
+    return [entry[1] for entry in LOG if entry[0] in ('execute', 'executemany')]
+
+def lookup(query: str, params):
+    """Returns the canned result for a query."""
+    for key, result in list(RESULTS.items()):
+        if key in query:
+            return result(query, params) if callable(result) else result
+    return None
+
+def connect(connection_string: str, autocommit: bool = False, **kwargs) -> 'Connection':
+    if len(FAIL_CONNECT) > 0:
+        raise FAIL_CONNECT.pop(0)
+    conn = Connection(autocommit)
+    with LOCK:
+        CONNECTIONS.append(conn)
+    return conn
+
+class Connection:
+    def __init__(self, autocommit: bool):
+        self.autocommit = autocommit
+        self.closed = False
+        self.timeout = 0
+        self.nocount = False
+
+    def cursor(self) -> 'Cursor':
+        if self.closed:
+            raise ProgrammingError('Attempt to use a closed connection.')
+        return Cursor(self)
+
+    def commit(self):
+        LOG.append(('commit', self))
+
+    def rollback(self):
+        LOG.append(('rollback', self))
+
+    def close(self):
+        self.closed = True
+
+class Cursor:
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.fast_executemany = False
+        self.input_sizes = None
+        self.__sets = []
+        self.__rows = []
+
+    def __track_nocount(self, query: str):
+        upper = query.upper()
+        on, off = upper.rfind('SET NOCOUNT ON'), upper.rfind('SET NOCOUNT OFF')
+        if on > off:
+            self.connection.nocount = True
+        elif off > on:
+            self.connection.nocount = False
+
+    def __load(self, result):
+        if isinstance(result, Exception):
+            raise result
+        self.__sets = [] if result is None else list(result) if isinstance(result, list) else [result]
+        self.description, self.__rows = None, []
+        if len(self.__sets) > 0:
+            self.__next()
+
+    def __next(self):
+        description, rows = self.__sets.pop(0)
+        self.description = description
+        self.__rows = [tuple(row) for row in rows]
+        self.rowcount = len(self.__rows)
+
+    def execute(self, query: str, *params) -> 'Cursor':
+        if self.connection.closed:
+            raise ProgrammingError('Attempt to use a closed connection.')
+        params = params[0] if len(params) == 1 and isinstance(params[0], (tuple, list)) else params
+        LOG.append(('execute', query, tuple(params), self.input_sizes, self.connection))
+        self.__track_nocount(query)
+        self.__load(lookup(query, params))
+        return self
+
+    def executemany(self, query: str, rows):
+        rows = [tuple(row) for row in rows]
+        LOG.append(('executemany', query, rows, self.input_sizes, self.connection))
+        result = lookup(query, rows)
+        if isinstance(result, Exception):
+            raise result
+        self.rowcount = len(rows)
+
+    def setinputsizes(self, sizes):
+        self.input_sizes = sizes
+
+    def nextset(self) -> bool:
+        if len(self.__sets) > 0:
+            self.__next()
+            return True
+        self.description = None
+        return False
+
+    def fetchall(self) -> list[tuple]:
+        if self.description is None:
+            raise ProgrammingError('No results.  Previous SQL was not a query.')
+        rows, self.__rows = self.__rows, []
+        return rows
+
+    def fetchmany(self, size: int = 1) -> list[tuple]:
+        if self.description is None:
+            raise ProgrammingError('No results.  Previous SQL was not a query.')
+        rows, self.__rows = self.__rows[:size], self.__rows[size:]
+        return rows
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if len(rows) > 0 else None
+
+    def cancel(self):
+        LOG.append(('cancel', self))
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        while len(self.__rows) > 0:
+            yield self.__rows.pop(0)
@@ -0,0 +1,57 @@
+import asyncio
+
+from pyjra.sql import AsyncSQLHandler
+
+ROWS = [(i,) for i in range(10)]
+
+def test_iterators_beyond_the_pool_wait_instead_of_deadlocking(odbc):
+    odbc.RESULTS['SELECT'] = ([('x', int)], ROWS)
+
+    async def consume(executor: AsyncSQLHandler) -> list[tuple]:
+        rows = []
+        async for batch in executor.iter_query("SELECT x FROM [t]", batch_size = 2):
+            rows.extend(batch.data)
+            await asyncio.sleep(0.01)
+        return rows
+
+    async def main():
+        async with AsyncSQLHandler(server = 'server', database = 'database', max_workers = 2) as executor:
+            results = await asyncio.wait_for(asyncio.gather(*(consume(executor) for _ in range(5))), timeout = 10)
+            assert len(executor.handler.pool) <= 2
+        return results
+
+    assert asyncio.run(main()) == [ROWS]*5
+    assert len(odbc.CONNECTIONS) <= 2
+
+def test_concurrency_is_capped_at_the_pool_size(odbc):
+    executor = AsyncSQLHandler(server = 'server', database = 'database', max_workers = 2, max_concurrency = 10)
+    assert executor.max_concurrency == 2
+    asyncio.run(executor.close())
+
+def test_execute_queries_run_concurrently(odbc):
+    odbc.RESULTS['SELECT'] = ([('x', int)], [(1,)])
+
+    async def main():
+        async with AsyncSQLHandler(server = 'server', database = 'database', max_workers = 4) as executor:
+            return await asyncio.gather(*(executor.execute_query("SELECT 1") for _ in range(8)))
+
+    assert [result.data for result in asyncio.run(main())] == [[(1,)]]*8
+    assert len(odbc.CONNECTIONS) <= 4
+
+def test_failed_calls_release_their_connections(odbc):
+    odbc.RESULTS['CREATE TABLE'] = odbc.ProgrammingError('42S01', "There is already an object named 't' in the database.")
+    odbc.RESULTS['bad'] = odbc.ProgrammingError('42000', "Incorrect syntax near 'bad'.")
+    odbc.RESULTS['SELECT 1'] = ([('x', int)], [(1,)])
+
+    async def main():
+        async with AsyncSQLHandler(server = 'server', database = 'database', max_workers = 2) as executor:
+            executor.handler.pool.checkout_timeout = 1
+            for call in (executor.execute_query("SELECT bad"), executor.create_table('t', ['x'], ['int'], 'dbo'), executor.execute_query("SELECT bad")):
+                try:
+                    await call
+                except odbc.Error:
+                    pass
+            return await asyncio.wait_for(executor.execute_query("SELECT 1"), timeout = 5)
+
+    assert asyncio.run(main()).data == [(1,)]
+    assert len(odbc.CONNECTIONS) <= 2
@@ -0,0 +1,72 @@
+import csv
+import os
+from datetime import datetime, date, time, timezone, timedelta
+
+import numpy as np
+import pandas as pd
+
+from pyjra.sql import SQLHandler
+from pyjra.utilities import Tabular
+
+def test_write_bulk_file_quotes_nulls_and_dates(tmp_path):
+    data = Tabular.from_trusted(
+        data = [
+            (1, 'plain', True, datetime(2026, 10, 17, 9, 30, 15, 123456), date(2026, 10, 17), b'\x01\xff'),
+            (2, 'comma, "quote"\nnewline', False, datetime(2026, 10, 17, 9, 30, tzinfo = timezone(timedelta(hours = 2))), None, None),
+            (None, None, None, None, None, None)
+        ],
+        columns = ['id', 'text', 'flag', 'stamp', 'day', 'blob'],
+        datatypes = [int, str, bool, datetime, date, bytes]
+    )
+    file = tmp_path/'bulk.csv'
+    assert SQLHandler.write_bulk_file(data, str(file)) == 3
+    with open(file, encoding = 'utf-8', newline = '') as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ['1', 'plain', '1', '2026-10-17 09:30:15.123', '2026-10-17', '01ff'],
+        ['2', 'comma, "quote"\nnewline', '0', '2026-10-17 07:30:00.000', '', ''],
+        ['', '', '', '', '', '']
+    ]
+    assert '"comma, ""quote""\nnewline"' in file.read_text(encoding = 'utf-8')
+
+def test_write_bulk_file_strips_timezone_of_times(tmp_path):
+    data = Tabular.from_trusted(data = [(time(9, 30, 0, 500000, tzinfo = timezone.utc),)], columns = ['t'], datatypes = [time])
+    file = tmp_path/'bulk.csv'
+    SQLHandler.write_bulk_file(data, str(file))
+    assert file.read_text(encoding = 'utf-8') == '09:30:00.500000\n'
+
+def test_write_bulk_file_writes_dataframe_nulls_as_empty_fields(tmp_path):
+    data = pd.DataFrame({'a': [1.5, np.nan], 'b': ['x', None], 'c': pd.to_datetime(['2026-10-17', None])})
+    file = tmp_path/'bulk.csv'
+    SQLHandler.write_bulk_file(data, str(file))
+    assert file.read_text(encoding = 'utf-8') == '1.5,x,2026-10-17 00:00:00.000\n,,\n'
+
+def test_insert_sends_timezone_aware_datetimes_in_utc_like_bulk_files(odbc, handler, tmp_path):
+    stamp = datetime(2026, 10, 17, 9, 30, tzinfo = timezone(timedelta(hours = 2)))
+    data = Tabular.from_trusted(data = [(1, None), (2, stamp)], columns = ['id', 'stamp'], datatypes = [int, datetime])
+    handler.insert('dbo', 't', data, fast_execute = False, auto_create_table = False)
+    rows = [entry[2] for entry in odbc.LOG if entry[0] == 'executemany'][0]
+    assert rows == [(1, None), (2, datetime(2026, 10, 17, 7, 30))]
+    file = tmp_path/'bulk.csv'
+    SQLHandler.write_bulk_file(data, str(file))
+    assert file.read_text(encoding = 'utf-8').splitlines()[1] == '2,2026-10-17 07:30:00.000'
+
+def test_bulk_insert_stages_loads_and_removes_the_file(odbc, handler, tmp_path):
+    data = Tabular.from_trusted(data = [(1, 'a'), (2, 'b')], columns = ['id', 'text'], datatypes = [int, str])
+    seen = []
+    def bulk(query, params):
+        path = query.split("FROM '")[1].split("'")[0]
+        seen.append(open(path, encoding = 'utf-8').read())
+    odbc.RESULTS['BULK INSERT'] = bulk
+    assert handler.bulk_insert('dbo', 't', data, directory = str(tmp_path), auto_create_table = False) == 2
+    assert seen == ['1,a\n2,b\n']
+    assert "FORMAT = 'CSV'" in [query for query in odbc.queries() if 'BULK INSERT' in query][0]
+    assert os.listdir(tmp_path) == []
+
+def test_bulk_insert_falls_back_to_insert_without_permission(odbc, handler, tmp_path):
+    data = Tabular.from_trusted(data = [(1, 'a'), (2, 'b')], columns = ['id', 'text'], datatypes = [int, str])
+    odbc.RESULTS['BULK INSERT'] = odbc.ProgrammingError('42000', 'You do not have permission to use the bulk load statement. (4834)')
+    assert handler.bulk_insert('dbo', 't', data, directory = str(tmp_path), auto_create_table = False) == 2
+    inserts = [entry for entry in odbc.LOG if entry[0] == 'executemany']
+    assert inserts[0][2] == [(1, 'a'), (2, 'b')]
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,80 @@
+import pyjra.sql
+from pyjra.sql import SQLHandler
+from pyjra.sql import QueryCache
+from pyjra.utilities import Tabular
+
+ROWS = ([('id', int)], [(1,), (2,)])
+
+def result(rows: int = 2) -> Tabular:
+    return Tabular(data = [(n,) for n in range(rows)], columns = ['id'])
+
+def test_normalise_collapses_whitespace_outside_literals():
+    assert QueryCache.normalise("SELECT  *\n FROM [t] WHERE [c] = 'a  b';") == "SELECT * FROM [t] WHERE [c] = 'a  b'"
+
+def test_is_read_and_tables():
+    assert QueryCache.is_read("WITH [x] AS (SELECT 1 AS [n]) SELECT * FROM [x]")
+    assert not QueryCache.is_read("SELECT * INTO [copy] FROM [t]")
+    assert not QueryCache.is_read("SELECT GETDATE()")
+    assert QueryCache.is_read("SELECT 'DELETE' AS [word]")
+    assert QueryCache.tables("SELECT * FROM [dbo].[Orders] AS [o] JOIN lines ON 1 = 1") == {'orders', 'lines'}
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(pyjra.sql, 'monotonic', lambda: now[0])
+    cache = QueryCache(ttl = 10)
+    cache.put("SELECT [id] FROM [t]", None, result())
+    cache.put("SELECT [id] FROM [t] WHERE [id] = ?", (1,), result(1), ttl = 30)
+    now[0] = 105.0
+    assert cache.get("SELECT  [id] FROM [t]", None, name = 'hit').data == [(0,), (1,)]
+    now[0] = 111.0
+    assert cache.get("SELECT [id] FROM [t]") is None
+    assert cache.get("SELECT [id] FROM [t] WHERE [id] = ?", 1).row_count == 1
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+
+def test_least_recently_used_entries_are_evicted_first():
+    probe = QueryCache()
+    probe.put("SELECT 1", None, result(10))
+    cache = QueryCache(max_bytes = 2*probe.bytes + 1)
+    cache.put("SELECT [id] FROM [a]", None, result(10))
+    cache.put("SELECT [id] FROM [b]", None, result(10))
+    cache.get("SELECT [id] FROM [a]")
+    cache.put("SELECT [id] FROM [c]", None, result(10))
+    assert cache.get("SELECT [id] FROM [b]") is None
+    assert cache.get("SELECT [id] FROM [a]") is not None
+    assert cache.get("SELECT [id] FROM [c]") is not None
+    assert cache.stats()['evictions'] == 1
+    assert len(cache) == 2
+
+def test_results_larger_than_the_cache_are_not_stored():
+    cache = QueryCache(max_bytes = 10)
+    cache.put("SELECT [id] FROM [t]", None, result())
+    assert len(cache) == 0
+
+def test_invalidate_by_table_or_all():
+    cache = QueryCache()
+    cache.put("SELECT [id] FROM [dbo].[a]", None, result())
+    cache.put("SELECT [id] FROM [a] JOIN [b] ON 1 = 1", None, result())
+    cache.put("SELECT [id] FROM [c]", None, result())
+    assert cache.invalidate('[dbo].[A]') == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert cache.stats()['bytes'] == 0
+
+def test_handler_serves_reads_from_the_cache_until_a_write(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', cache = QueryCache())
+    odbc.RESULTS['SELECT'] = ROWS
+    first = executor.execute_query("SELECT [id] FROM [dbo].[t]")
+    second = executor.execute_query("SELECT [id] FROM [dbo].[t]")
+    assert first.data == second.data == [(1,), (2,)]
+    assert odbc.queries().count("SELECT [id] FROM [dbo].[t]") == 1
+    executor.execute_query("DELETE FROM [dbo].[t] WHERE [id] = 2")
+    executor.execute_query("SELECT [id] FROM [dbo].[t]")
+    executor.execute_query("SELECT [id] FROM [dbo].[t]", use_cache = False)
+    assert odbc.queries().count("SELECT [id] FROM [dbo].[t]") == 3
+
+def test_handler_does_not_cache_inside_a_session(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', cache = QueryCache())
+    odbc.RESULTS['SELECT'] = ROWS
+    with executor.session():
+        executor.execute_query("SELECT [id] FROM [dbo].[t]")
+    assert len(executor.cache) == 0
@@ -0,0 +1,69 @@
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import RetryPolicy
+from pyjra.sql import CancelHandle
+from pyjra.sql import QueryCancelled
+
+ROWS = ([('id', int)], [(n,) for n in range(10)])
+
+def test_query_timeout_is_set_on_the_connection_and_overridable(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', query_timeout = 30)
+    odbc.RESULTS['SELECT'] = ROWS
+    executor.connect_to_mssql()
+    assert odbc.CONNECTIONS[0].timeout == 30
+    executor.execute_query("SELECT [id] FROM [dbo].[t]", timeout = 5, commit = False)
+    assert odbc.CONNECTIONS[0].timeout == 5
+
+def test_a_timed_out_query_raises_and_releases_its_connection(odbc, pooled):
+    pooled.query_timeout = 1
+    odbc.RESULTS['usp_slow'] = odbc.OperationalError('HYT00', 'Query timeout expired')
+    with pytest.raises(QueryCancelled) as caught:
+        pooled.execute_query("EXEC [dbo].[usp_slow]")
+    assert caught.value.timed_out
+    assert not pooled.connected
+    assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG
+    odbc.RESULTS['SELECT'] = ROWS
+    pooled.execute_query("SELECT [id] FROM [dbo].[t]")
+    assert len(odbc.CONNECTIONS) == 1
+
+def test_timeouts_without_a_limit_are_ordinary_errors(odbc, handler):
+    odbc.RESULTS['usp_slow'] = odbc.OperationalError('HYT00', 'Query timeout expired')
+    with pytest.raises(odbc.OperationalError):
+        handler.execute_query("EXEC [dbo].[usp_slow]")
+
+def test_cancelling_a_running_query(odbc, handler):
+    handle = CancelHandle()
+    def slow(query, params):
+        assert handle.cancel()
+        return odbc.OperationalError('HY008', 'Operation canceled')
+    odbc.RESULTS['usp_slow'] = slow
+    with pytest.raises(QueryCancelled) as caught:
+        handler.execute_query("EXEC [dbo].[usp_slow]", cancel = handle)
+    assert not caught.value.timed_out
+    assert any(entry[0] == 'cancel' for entry in odbc.LOG)
+    assert not handler.connected
+
+def test_a_handle_cancelled_before_the_query_stops_it_running(odbc, handler):
+    handle = CancelHandle()
+    assert not handle.cancel()
+    with pytest.raises(QueryCancelled):
+        handler.execute_query("EXEC [dbo].[usp_slow]", cancel = handle)
+    assert not any(entry[0] == 'execute' and 'usp_slow' in entry[1] for entry in odbc.LOG)
+
+def test_cancelled_queries_are_not_retried(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', query_timeout = 1, retry_policy = RetryPolicy(base_delay = 0, jitter = 0))
+    odbc.RESULTS['SELECT'] = odbc.OperationalError('HYT00', 'Query timeout expired')
+    with pytest.raises(QueryCancelled):
+        executor.execute_query("SELECT [id] FROM [dbo].[t]", retry = True)
+    assert odbc.queries().count("SELECT [id] FROM [dbo].[t]") == 1
+
+def test_cancelling_a_stream_between_batches(odbc, handler):
+    odbc.RESULTS['SELECT'] = ROWS
+    handle = CancelHandle()
+    stream = handler.iter_query("SELECT [id] FROM [dbo].[t]", batch_size = 3, cancel = handle)
+    assert next(stream).row_count == 3
+    handle.cancel()
+    with pytest.raises(QueryCancelled):
+        next(stream)
+    assert not handler.connected
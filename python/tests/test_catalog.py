@@ -0,0 +1,61 @@
+COLUMNS = ([('name', str), ('type', str), ('max_length', int), ('precision', int), ('scale', int)], [
+    ('id', 'int', 4, 10, 0),
+    ('code', 'nvarchar', 32, 0, 0),
+    ('notes', 'varchar', -1, 0, 0),
+    ('amount', 'decimal', 9, 18, 2),
+    ('stamp', 'datetime2', 8, 27, 3)
+])
+
+def catalog_queries(odbc) -> int:
+    return sum('FROM sys.columns' in query for query in odbc.queries())
+
+def test_table_schema_is_loaded_once(odbc, handler):
+    odbc.RESULTS['FROM sys.columns'] = COLUMNS
+    entry = handler.get_table_schema('dbo', 't')
+    assert entry == {
+        'columns': ['id', 'code', 'notes', 'amount', 'stamp'],
+        'datatypes': ['int', 'nvarchar(16)', 'varchar(max)', 'decimal(18, 2)', 'datetime2(3)']
+    }
+    assert handler.get_table_schema('dbo', 'T') is entry
+    assert [entry[2] for entry in odbc.LOG if entry[0] == 'execute' and 'FROM sys.columns' in entry[1]] == [('[dbo].[t]',)]
+    assert handler.table_exists('dbo', 't')
+    assert catalog_queries(odbc) == 1
+    handler.get_table_schema('dbo', 't', refresh = True)
+    assert catalog_queries(odbc) == 2
+
+def test_missing_tables_are_cached_as_missing(odbc, handler):
+    assert handler.get_table_schema('dbo', 'missing') is None
+    assert not handler.table_exists('dbo', 'missing')
+    assert catalog_queries(odbc) == 1
+
+def test_ddl_forgets_the_tables_it_changes(odbc, handler):
+    odbc.RESULTS['FROM sys.columns'] = COLUMNS
+    handler.get_table_schema('dbo', 't')
+    handler.get_table_schema('dbo', 'other')
+    handler.execute_query("ALTER TABLE [dbo].[t] ADD [extra] int NULL")
+    handler.get_table_schema('dbo', 't')
+    handler.get_table_schema('dbo', 'other')
+    assert catalog_queries(odbc) == 3
+
+def test_refresh_catalog_clears_one_or_all_entries(odbc, handler):
+    odbc.RESULTS['FROM sys.columns'] = COLUMNS
+    handler.get_table_schema('dbo', 't')
+    handler.get_table_schema('dbo', 'other')
+    handler.refresh_catalog('dbo', 't')
+    handler.get_table_schema('dbo', 'other')
+    assert catalog_queries(odbc) == 2
+    handler.refresh_catalog()
+    handler.get_table_schema('dbo', 'other')
+    assert catalog_queries(odbc) == 3
+
+def test_spawned_handlers_share_the_catalog(odbc, handler):
+    odbc.RESULTS['FROM sys.columns'] = COLUMNS
+    handler.get_table_schema('dbo', 't')
+    assert handler.spawn().get_table_schema('dbo', 't')['columns'][0] == 'id'
+    assert catalog_queries(odbc) == 1
+
+def test_repeated_inserts_read_the_catalog_once(odbc, handler):
+    odbc.RESULTS['FROM sys.columns'] = COLUMNS
+    for _ in range(3):
+        handler.insert('dbo', 't', [(1, 'a', 'b', 1.5, None)], auto_create_table = False)
+    assert catalog_queries(odbc) == 1
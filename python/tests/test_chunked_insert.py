@@ -0,0 +1,54 @@
+import pytest
+
+from pyjra.utilities import Tabular
+
+def insert(handler, data, **kwargs):
+    return handler.insert('dbo', 't', data, fast_execute = False, auto_create_table = False, **kwargs)
+
+def test_iterables_are_inserted_one_batch_at_a_time(odbc, handler):
+    produced = []
+    seen = []
+    def rows():
+        for n in range(7):
+            produced.append(n)
+            yield (n, f"c{n}")
+    odbc.RESULTS['INSERT INTO'] = lambda query, batch: seen.append(len(produced))
+    assert insert(handler, rows(), columns = ['id', 'code'], batch_size = 3) == 7
+    batches = [entry[2] for entry in odbc.LOG if entry[0] == 'executemany']
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert seen == [3, 6, 7]
+    assert batches[0][0] == (0, 'c0')
+    assert odbc.queries()[0] == "INSERT INTO [dbo].[t]([id], [code]) VALUES (?, ?)"
+
+def test_commit_per_batch_commits_after_each_batch_and_reports_progress(odbc, handler):
+    progress = []
+    insert(handler, [(n,) for n in range(5)], columns = ['id'], batch_size = 2, commit_per_batch = True, progress = lambda batches, rows: progress.append((batches, rows)))
+    calls = [entry[0] for entry in odbc.LOG if entry[0] in ('executemany', 'commit')]
+    assert calls == ['executemany', 'commit', 'executemany', 'commit', 'executemany', 'commit', 'commit']
+    assert progress == [(1, 2), (2, 4), (3, 5)]
+
+def test_without_commit_per_batch_the_insert_commits_once(odbc, handler):
+    insert(handler, [(n,) for n in range(5)], columns = ['id'], batch_size = 2)
+    assert [entry[0] for entry in odbc.LOG if entry[0] in ('executemany', 'commit')] == ['executemany']*3 + ['commit']
+
+def test_iterables_of_tabulars_are_split_by_batch_size(odbc, handler):
+    chunks = (Tabular(data = [(n, m) for m in range(3)], columns = ['a', 'b']) for n in range(2))
+    assert insert(handler, chunks, batch_size = 2) == 6
+    batches = [entry[2] for entry in odbc.LOG if entry[0] == 'executemany']
+    assert [len(batch) for batch in batches] == [2, 1, 2, 1]
+    assert odbc.queries()[0] == "INSERT INTO [dbo].[t]([a], [b]) VALUES (?, ?)"
+
+def test_failed_batch_rolls_back_the_insert(odbc, handler):
+    odbc.RESULTS['INSERT INTO'] = lambda query, batch: odbc.IntegrityError('23000', 'Duplicate key.') if batch[0][0] >= 2 else None
+    with pytest.raises(odbc.IntegrityError):
+        insert(handler, [(n,) for n in range(4)], columns = ['id'], batch_size = 2)
+    assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG
+    assert ('commit', odbc.CONNECTIONS[0]) not in odbc.LOG
+
+def test_empty_iterables_insert_nothing(odbc, handler):
+    assert insert(handler, iter(()), columns = ['id']) == 0
+    assert [entry for entry in odbc.LOG if entry[0] == 'executemany'] == []
+
+def test_invalid_batch_size_is_rejected(handler):
+    with pytest.raises(ValueError):
+        insert(handler, [(1,)], batch_size = 0)
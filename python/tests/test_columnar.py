@@ -0,0 +1,43 @@
+from array import array
+
+import pandas as pd
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import QueryCache
+
+DESCRIPTION = [('id', int), ('score', float), ('name', str), ('maybe', int)]
+ROWS = [(i, i/4, f"name{i}", None if i % 3 == 0 else i) for i in range(25)]
+
+def fetch(odbc, handler, columnar: bool):
+    odbc.RESULTS['SELECT'] = (DESCRIPTION, ROWS)
+    return handler.execute_query("SELECT * FROM [t]", columnar = columnar, batch_size = 7)
+
+def test_columnar_and_row_results_read_the_same(odbc, handler):
+    rows = fetch(odbc, handler, columnar = False)
+    columns = fetch(odbc, handler, columnar = True)
+    assert not columns.row_based
+    assert isinstance(columns.data[0], array)
+    for column in ['id', 'score', 'name', 'maybe']:
+        assert type(columns.get_column(column)) is tuple
+        assert columns.get_column(column) == rows.get_column(column)
+    assert not columns.row_based
+    pd.testing.assert_frame_equal(columns.to_dataframe(), rows.to_dataframe())
+    columns.transpose(row_based = True)
+    assert columns.data == rows.data
+    assert columns.columns == rows.columns
+
+def test_columnar_keeps_nullable_numbers_as_lists(odbc, handler):
+    columns = fetch(odbc, handler, columnar = True)
+    assert isinstance(columns.data[3], list)
+    assert columns.get_column('maybe')[:4] == (None, 1, 2, None)
+
+def test_cached_results_are_returned_column_based_when_columnar(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', cache = QueryCache())
+    rows = fetch(odbc, executor, columnar = False)
+    columns = fetch(odbc, executor, columnar = True)
+    assert odbc.queries().count("SELECT * FROM [t]") == 1
+    assert not columns.row_based
+    assert isinstance(columns.data[0], array) and isinstance(columns.data[3], list)
+    columns.transpose(row_based = True)
+    assert columns.data == rows.data
+    assert fetch(odbc, executor, columnar = False).row_based
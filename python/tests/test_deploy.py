@@ -0,0 +1,70 @@
+import time
+
+from pyjra.deploy import SQLDeployer
+
+def script(code: str) -> dict:
+    return {'code': code.lower()}
+
+def test_split_batches_on_go_lines():
+    batches = SQLDeployer.split_batches("CREATE TABLE [t] ([c] int)\nGO\nINSERT INTO [t] VALUES (1)\ngo\n")
+    assert batches == ['CREATE TABLE [t] ([c] int)', 'INSERT INTO [t] VALUES (1)']
+
+def test_split_batches_repeats_go_n():
+    batches = SQLDeployer.split_batches("INSERT INTO [t] VALUES (1)\nGO 3\nSELECT 1")
+    assert batches == ['INSERT INTO [t] VALUES (1)']*3 + ['SELECT 1']
+
+def test_split_batches_allows_a_comment_after_go():
+    batches = SQLDeployer.split_batches("SELECT 1\n  GO -- end of the first batch\nSELECT 2\nGO 2 -- twice")
+    assert batches == ['SELECT 1', 'SELECT 2', 'SELECT 2']
+
+def test_split_batches_ignores_go_inside_lines_and_empty_batches():
+    batches = SQLDeployer.split_batches("GO\nSELECT 'GO' AS [GOAL]\nGO\n\nGO\n")
+    assert batches == ["SELECT 'GO' AS [GOAL]"]
+
+def test_dependencies_match_whole_object_names():
+    scripts = {
+        '[jra].[ufn_age]': script("CREATE FUNCTION [jra].[ufn_age] () RETURNS int AS BEGIN RETURN 1 END"),
+        '[jra].[ufn_age_band]': script("CREATE FUNCTION [jra].[ufn_age_band] () RETURNS int AS BEGIN RETURN [jra].[ufn_age]() END"),
+        '[jra].[usp_report]': script("CREATE PROCEDURE [jra].[usp_report] AS SELECT [jra].[ufn_age_band]()")
+    }
+    assert SQLDeployer.dependencies(scripts) == {
+        '[jra].[ufn_age]': set(),
+        '[jra].[ufn_age_band]': {'[jra].[ufn_age]'},
+        '[jra].[usp_report]': {'[jra].[ufn_age_band]'}
+    }
+
+def test_dependencies_include_every_schema_with_the_name():
+    scripts = {
+        '[jra].[vw_sales]': script("CREATE VIEW [jra].[vw_sales] AS SELECT 1 AS [x]"),
+        '[client].[vw_sales]': script("CREATE VIEW [client].[vw_sales] AS SELECT 2 AS [x]"),
+        '[client].[usp_sales]': script("CREATE PROCEDURE [client].[usp_sales] AS SELECT * FROM [client].[vw_sales]")
+    }
+    assert SQLDeployer.dependencies(scripts)['[client].[usp_sales]'] == {'[jra].[vw_sales]', '[client].[vw_sales]'}
+
+def test_read_scripts_and_deploy_in_dependency_order(odbc, pooled, tmp_path):
+    (tmp_path/'ufn_age.sql').write_text("-- uses nothing\nCREATE OR ALTER FUNCTION [jra].[ufn_age] () RETURNS int AS BEGIN RETURN 1 END\nGO\n")
+    (tmp_path/'usp_report.sql').write_text("CREATE OR ALTER PROCEDURE jra.usp_report AS SELECT [jra].[ufn_age]()\nGO\n")
+    (tmp_path/'readme.txt').write_text("GO")
+    deployer = SQLDeployer(pooled, parallel = 2)
+    scripts = deployer.read_scripts(str(tmp_path))
+    assert sorted(scripts) == ['[jra].[ufn_age]', '[jra].[usp_report]']
+    results = deployer.deploy(scripts)
+    assert results == {'deployed': ['[jra].[ufn_age]', '[jra].[usp_report]'], 'skipped': [], 'failed': {}}
+    created = [entry for entry in odbc.LOG if entry[0] == 'execute' and 'CREATE TABLE [dbo].[pyjra_deployments]' in entry[1]]
+    assert created[0][2] == ('[dbo].[pyjra_deployments]',)
+
+def test_deploy_skips_unchanged_scripts_and_blocks_dependents_of_failures(odbc, pooled, tmp_path):
+    (tmp_path/'ufn_age.sql').write_text("CREATE FUNCTION [jra].[ufn_age] () RETURNS int AS BEGIN RETURN 1 END")
+    (tmp_path/'usp_report.sql').write_text("CREATE PROCEDURE [jra].[usp_report] AS SELECT [jra].[ufn_age]()")
+    (tmp_path/'vw_broken.sql').write_text("CREATE VIEW [jra].[vw_broken] AS SELECT 1/0")
+    (tmp_path/'usp_broken.sql').write_text("CREATE PROCEDURE [jra].[usp_broken] AS SELECT * FROM [jra].[vw_broken]")
+    deployer = SQLDeployer(pooled, parallel = 2)
+    scripts = deployer.read_scripts(str(tmp_path))
+    odbc.RESULTS['SELECT [object_name], [hash]'] = ([('object_name', str), ('hash', str)], [('[jra].[ufn_age]', scripts['[jra].[ufn_age]']['hash'])])
+    odbc.RESULTS['CREATE VIEW [jra].[vw_broken]'] = odbc.ProgrammingError('42000', 'Divide by zero error encountered.')
+    odbc.RESULTS['[jra].[usp_report] AS'] = lambda query, params: time.sleep(0.1)
+    results = deployer.deploy(scripts)
+    assert results['skipped'] == ['[jra].[ufn_age]']
+    assert results['deployed'] == ['[jra].[usp_report]']
+    assert sorted(results['failed']) == ['[jra].[usp_broken]', '[jra].[vw_broken]']
+    assert not any('CREATE PROCEDURE [jra].[usp_broken]' in query for query in odbc.queries())
@@ -0,0 +1,34 @@
+import pytest
+
+SCHEMAS = ([('name', str)], [('dbo',), ('jra',)])
+TABLES = ([('name', str), ('note', str)], [('orders', ''), ('lines', 'detail')])
+
+def test_batch_reads_every_result_set_in_one_execute(odbc, handler):
+    odbc.RESULTS['sys.schemas'] = [SCHEMAS, TABLES]
+    schemas, tables = handler.execute_batch([
+        "SELECT [name] FROM sys.schemas;",
+        ("SELECT [name], [note] FROM sys.tables WHERE [schema_id] = ?", 1)
+    ], names = ['schemas', 'tables'])
+    executed = [entry for entry in odbc.LOG if entry[0] == 'execute']
+    assert executed[0][1] == "SET NOCOUNT ON;\nSELECT [name] FROM sys.schemas;\nSELECT [name], [note] FROM sys.tables WHERE [schema_id] = ?;"
+    assert executed[0][2] == (1,)
+    assert schemas.name == 'schemas' and schemas.data == [('dbo',), ('jra',)]
+    assert tables.name == 'tables' and tables.data == [('orders', None), ('lines', 'detail')]
+
+def test_batch_does_not_leak_nocount_to_the_pool(odbc, pooled):
+    odbc.RESULTS['sys.schemas'] = SCHEMAS
+    pooled.execute_batch(["SELECT [name] FROM sys.schemas", "UPDATE [dbo].[t] SET [n] = 1"])
+    assert len(odbc.CONNECTIONS) == 1
+    assert not odbc.CONNECTIONS[0].nocount
+    assert odbc.queries()[-1] == "SET NOCOUNT OFF"
+
+def test_failed_batch_does_not_leak_nocount_to_the_pool(odbc, pooled):
+    odbc.RESULTS['sys.schemas'] = odbc.ProgrammingError('42S02', "Invalid object name 'sys.schemas'.")
+    with pytest.raises(odbc.ProgrammingError):
+        pooled.execute_batch(["SELECT [name] FROM sys.schemas"])
+    assert not odbc.CONNECTIONS[0].nocount
+    assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG
+
+def test_empty_batch_does_not_connect(odbc, handler):
+    assert handler.execute_batch([]) == []
+    assert odbc.CONNECTIONS == []
@@ -0,0 +1,74 @@
+from datetime import date
+from datetime import datetime
+from datetime import time
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from pyjra.sql import WatermarkStore
+
+ROWS = ([('id', int), ('modified', datetime)], [(1, datetime(2026, 10, 16)), (2, datetime(2026, 10, 17, 9, 30))])
+
+@pytest.mark.parametrize('value', [
+    7, 1.5, 'text', True, b'\x00\x01', Decimal('1.10'), date(2026, 10, 17), datetime(2026, 10, 17, 9, 30, 0, 123000),
+    time(9, 30), UUID('12345678-1234-5678-1234-567812345678')
+])
+def test_watermarks_round_trip_with_their_type(value, tmp_path):
+    store = WatermarkStore(file = str(tmp_path/'watermarks.json'))
+    store.set('key', value)
+    restored = WatermarkStore(file = str(tmp_path/'watermarks.json')).get('key')
+    assert restored == value and type(restored) is type(value)
+
+def test_unsupported_watermarks_and_stores_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        WatermarkStore.encode(object())
+    with pytest.raises(ValueError):
+        WatermarkStore()
+    assert WatermarkStore(file = str(tmp_path/'missing.json')).get('key') is None
+
+def test_extract_reads_up_to_the_maximum_and_advances_the_watermark(odbc, handler, tmp_path):
+    path = str(tmp_path/'watermarks.json')
+    odbc.RESULTS['SELECT MAX'] = ([('', datetime)], [(datetime(2026, 10, 17, 9, 30),)])
+    odbc.RESULTS['SELECT [id]'] = ROWS
+    batches = list(handler.extract_incremental('dbo', 'orders', 'modified', store = path, columns = ['id', 'modified'], where = "[id] > 0"))
+    assert sum(batch.row_count for batch in batches) == 2
+    extract = [entry for entry in odbc.LOG if entry[0] == 'execute' and entry[1].startswith('SELECT [id]')][0]
+    assert extract[1] == "SELECT [id], [modified] FROM [dbo].[orders] WHERE [modified] <= ? AND ([id] > 0)"
+    assert extract[2] == (datetime(2026, 10, 17, 9, 30),)
+    assert WatermarkStore(file = path).get('[dbo].[orders].[modified]') == datetime(2026, 10, 17, 9, 30)
+
+    odbc.RESULTS['SELECT MAX'] = ([('', datetime)], [(datetime(2026, 10, 18),)])
+    list(handler.extract_incremental('dbo', 'orders', 'modified', store = path, columns = ['id', 'modified']))
+    extract = [entry for entry in odbc.LOG if entry[0] == 'execute' and entry[1].startswith('SELECT [id]')][-1]
+    assert extract[1] == "SELECT [id], [modified] FROM [dbo].[orders] WHERE [modified] > ? AND [modified] <= ?"
+    assert extract[2] == (datetime(2026, 10, 17, 9, 30), datetime(2026, 10, 18))
+
+def test_nothing_new_reads_nothing(odbc, handler, tmp_path):
+    path = str(tmp_path/'watermarks.json')
+    WatermarkStore(file = path).set('[dbo].[orders].[modified]', datetime(2026, 10, 17))
+    odbc.RESULTS['SELECT MAX'] = ([('', datetime)], [(datetime(2026, 10, 17),)])
+    assert list(handler.extract_incremental('dbo', 'orders', 'modified', store = path)) == []
+    assert not any(query.startswith('SELECT *') for query in odbc.queries())
+
+def test_watermark_is_not_advanced_if_the_extract_is_abandoned(odbc, handler, tmp_path):
+    path = str(tmp_path/'watermarks.json')
+    odbc.RESULTS['SELECT MAX'] = ([('', datetime)], [(datetime(2026, 10, 17),)])
+    odbc.RESULTS['SELECT *'] = ROWS
+    extract = handler.extract_incremental('dbo', 'orders', 'modified', store = path, batch_size = 1)
+    next(extract)
+    extract.close()
+    assert WatermarkStore(file = path).get('[dbo].[orders].[modified]') is None
+
+def test_table_store_passes_its_values_as_tuples(odbc, handler):
+    stored = {}
+    def upsert(query, params):
+        stored[params[0]] = params[1]
+    odbc.RESULTS['MERGE'] = upsert
+    odbc.RESULTS['SELECT [watermark]'] = lambda query, params: ([('watermark', str)], [(stored[params[0]],)] if params[0] in stored else [])
+    store = WatermarkStore(handler = handler)
+    assert store.get('orders') is None
+    store.set('orders', 42)
+    assert store.get('orders') == 42
+    created = [entry for entry in odbc.LOG if entry[0] == 'execute' and 'CREATE TABLE' in entry[1]]
+    assert len(created) == 1 and created[0][2] == ('[dbo].[pyjra_watermarks]',)
@@ -0,0 +1,55 @@
+from datetime import datetime, date, time, timezone, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.utilities import Tabular
+
+@pytest.mark.parametrize('column, expected', [
+    ([1, 2, 300], 'smallint'),
+    ([0, 255, None], 'tinyint'),
+    ([-1, 2**40], 'bigint'),
+    ([2**70, -1], 'decimal(22, 0)'),
+    ([True, False, None], 'bit'),
+    ([1.5, None, 2], 'float'),
+    ([float('nan'), None], None),
+    ([Decimal('1.25'), 3], 'decimal(3, 2)'),
+    ([Decimal('-12.345'), 7, Decimal('1E+3')], 'decimal(7, 3)'),
+    ([Decimal('NaN'), Decimal('1.5')], 'float'),
+    (['a', 'bcd', None], 'varchar(3)'),
+    (['a', 'héllo'], 'nvarchar(5)'),
+    (['', ''], 'varchar(1)'),
+    (['x'*9000], 'varchar(max)'),
+    ([b'ab', bytearray(b'c')], 'varbinary(2)'),
+    ([uuid4()], 'uniqueidentifier'),
+    ([datetime(2026, 10, 17), date(2026, 10, 17)], 'datetime2'),
+    ([date(2026, 10, 17)], 'date'),
+    ([time(9, 30)], 'time'),
+    ([pd.NaT, datetime(2026, 10, 17)], 'datetime2'),
+    ([datetime(2026, 10, 17), datetime(2026, 10, 17, tzinfo = timezone(timedelta(hours = 2)))], 'datetimeoffset'),
+    ([1, 'a'], None),
+    ([None], None),
+])
+def test_column_datatypes(column, expected):
+    data = Tabular.from_trusted([(value,) for value in column], ['c'], None)
+    assert SQLHandler.infer_datatypes(data) == [expected]
+
+def test_row_and_column_storage_infer_the_same():
+    rows = [(i, f"name{i}", i/2) for i in range(100)]
+    row_based = Tabular.from_trusted(rows, ['a', 'b', 'c'], [int, str, float])
+    column_based = Tabular.from_trusted([list(column) for column in zip(*rows)], ['a', 'b', 'c'], [int, str, float], row_based = False)
+    assert SQLHandler.infer_datatypes(row_based) == SQLHandler.infer_datatypes(column_based) == ['tinyint', 'varchar(6)', 'float']
+
+def test_dataframe_datatypes():
+    df = pd.DataFrame({'a': [1, 70000], 'b': ['x', None], 'c': [1.5, 2.0], 'd': pd.to_datetime(['2026-01-01', None]), 'e': [True, False]})
+    assert SQLHandler.infer_datatypes(df) == ['int', 'varchar(1)', 'float', 'datetime2', 'bit']
+
+def test_timezone_aware_dataframe_columns_are_datetimeoffset():
+    df = pd.DataFrame({'d': pd.to_datetime(['2026-01-01 09:30', None]).tz_localize('Europe/London')})
+    assert SQLHandler.infer_datatypes(df) == ['datetimeoffset']
+
+def test_empty_tabular_infers_nothing():
+    assert SQLHandler.infer_datatypes(Tabular.from_trusted([], ['a', 'b'], [int, str])) == [None, None]
@@ -0,0 +1,28 @@
+import pytest
+
+def executes(odbc, text: str) -> list[tuple]:
+    return [entry for entry in odbc.LOG if entry[0] == 'execute' and text in entry[1]]
+
+def test_size_hints_are_set_for_the_batch_only(odbc, handler):
+    odbc.RESULTS['INFORMATION_SCHEMA'] = ([('COLUMN_NAME', str), ('DATA_TYPE', str), ('CHARACTER_MAXIMUM_LENGTH', int), ('NUMERIC_PRECISION', int), ('NUMERIC_SCALE', int)], [('a', 'int', None, 10, 0), ('b', 'nvarchar', 20, None, None)])
+    with handler.session():
+        handler.insert('dbo', 't', [(1, 'x'), (2, 'y')], columns = ['a', 'b'], auto_create_table = False)
+        handler.execute_query("SELECT * FROM [dbo].[t] WHERE [b] = ?", ('a much longer value than the batch held',))
+    batch = [entry for entry in odbc.LOG if entry[0] == 'executemany'][0]
+    assert batch[3] is not None
+    assert executes(odbc, 'WHERE [b] = ?')[0][3] is None
+
+def test_size_hints_are_cleared_after_a_failed_batch(odbc, handler):
+    odbc.RESULTS['INSERT INTO [dbo].[t]'] = odbc.DataError('22001', 'String or binary data would be truncated.')
+    cursors = []
+    with pytest.raises(odbc.DataError):
+        with handler.session():
+            cursors.append(handler.cursor)
+            handler.insert('dbo', 't', [(1, 'x')], columns = ['a', 'b'], auto_create_table = False)
+    assert cursors[0].input_sizes is None
+
+def test_upsert_clears_size_hints(odbc, handler):
+    odbc.RESULTS['MERGE'] = ([('action', str), ('count', int)], [('INSERT', 2)])
+    with handler.session():
+        handler.upsert('dbo', 't', [(1, 'x'), (2, 'y')], keys = ['a'], columns = ['a', 'b'])
+        assert handler.cursor.input_sizes is None
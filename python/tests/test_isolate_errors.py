@@ -0,0 +1,61 @@
+import re
+
+import pytest
+
+class Table:
+    """A table that rejects negative ids and honours savepoints, as SQL Server would behind isolate_errors."""
+    def __init__(self, odbc, doomed: bool = False):
+        self.odbc = odbc
+        self.doomed = doomed
+        self.rows = []
+        self.savepoints = {}
+        odbc.RESULTS['SAVE TRANSACTION'] = self.save
+        odbc.RESULTS['ROLLBACK TRANSACTION'] = self.rollback
+        odbc.RESULTS['INSERT INTO'] = self.insert
+
+    def save(self, query, params):
+        self.savepoints[re.search(r"SAVE TRANSACTION \[(\w+)\]", query).group(1)] = len(self.rows)
+
+    def rollback(self, query, params):
+        if self.doomed:
+            return self.odbc.ProgrammingError('25000', 'The current transaction cannot be committed and cannot be rolled back to a savepoint. (3931)')
+        del self.rows[self.savepoints[re.search(r"ROLLBACK TRANSACTION \[(\w+)\]", query).group(1)]:]
+
+    def insert(self, query, rows):
+        for row in rows:
+            if row[0] < 0:
+                return self.odbc.IntegrityError('23000', f'The INSERT statement conflicted with the CHECK constraint "ck_id". Row {row[0]}. (547)')
+            self.rows.append(row)
+
+DATA = [(1, 'a'), (2, 'b'), (-3, 'c'), (4, 'd'), (5, 'e'), (6, 'f'), (-7, 'g'), (8, 'h'), (9, 'i')]
+
+def test_exactly_the_bad_rows_are_rejected(odbc, handler):
+    table = Table(odbc)
+    rows = handler.insert('dbo', 't', DATA, columns = ['id', 'code'], fast_execute = False, auto_create_table = False, batch_size = 4, isolate_errors = True)
+    assert rows == 7
+    assert table.rows == [row for row in DATA if row[0] > 0]
+    assert [row[:2] for row in handler.rejected.data] == [(-3, 'c'), (-7, 'g')]
+    assert handler.rejected.columns == ['id', 'code', 'error']
+    assert 'ck_id' in handler.rejected.data[0][2]
+    assert ('commit', odbc.CONNECTIONS[0]) in odbc.LOG
+
+def test_rejects_are_written_to_a_file(odbc, handler, tmp_path):
+    Table(odbc)
+    path = tmp_path/'rejects.tsv'
+    handler.insert('dbo', 't', DATA, columns = ['id', 'code'], fast_execute = False, auto_create_table = False, isolate_errors = True, rejects = str(path))
+    lines = path.read_text(encoding = 'utf-8').split('\n')
+    assert lines[0] == 'id\tcode\terror'
+    assert [line.split('\t')[:2] for line in lines[1:]] == [['-3', 'c'], ['-7', 'g']]
+
+def test_failed_savepoint_rollback_fails_the_insert(odbc, handler):
+    table = Table(odbc, doomed = True)
+    with pytest.raises(odbc.ProgrammingError):
+        handler.insert('dbo', 't', DATA, columns = ['id', 'code'], fast_execute = False, auto_create_table = False, isolate_errors = True)
+    assert handler.rejected is None
+    assert len([query for query in odbc.queries() if query.startswith('INSERT INTO')]) == 1
+    assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG
+    assert ('commit', odbc.CONNECTIONS[0]) not in odbc.LOG
+
+def test_isolate_errors_is_not_supported_with_parallel(handler):
+    with pytest.raises(ValueError):
+        handler.insert('dbo', 't', DATA, parallel = 2, isolate_errors = True)
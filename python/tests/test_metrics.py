@@ -0,0 +1,73 @@
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import QueryMetrics
+from pyjra.sql import QueryCache
+from pyjra.utilities import Tabular
+
+ROWS = ([('id', int), ('code', str)], [(n, f"c{n}") for n in range(10)])
+
+@pytest.fixture
+def instrumented() -> SQLHandler:
+    return SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', metrics = QueryMetrics(), cache = QueryCache())
+
+def test_record_aggregates_counts_and_percentiles():
+    metrics = QueryMetrics(max_samples = 100)
+    for n in range(1, 101):
+        metrics.record('execute_query', 'orders', execute = n/100, rows = n, bytes = 2*n)
+    stats = metrics.stats()['execute_query:orders']
+    assert stats['count'] == 100
+    assert stats['rows'] == 5050 and stats['bytes'] == 10100
+    assert stats['execute'] == {'p50': 0.5, 'p95': 0.95, 'p99': 0.99}
+    assert stats['total']['p50'] == 0.5
+    metrics.reset()
+    assert metrics.stats() == {}
+
+def test_samples_are_bounded():
+    metrics = QueryMetrics(max_samples = 2)
+    for n in range(5):
+        metrics.record('insert', execute = n)
+    stats = metrics.stats()['insert']
+    assert stats['count'] == 5
+    assert stats['execute']['p50'] == 3
+
+def test_hook_failures_are_swallowed():
+    seen = []
+    def hook(record):
+        seen.append(record['operation'])
+        raise RuntimeError('broken hook')
+    record = QueryMetrics(hook = hook).record('execute_query')
+    assert seen == ['execute_query']
+    assert record['total'] == 0
+
+def test_estimate_bytes_scales_a_sample():
+    rows = [(n, 'x'*10) for n in range(1000)]
+    small = QueryMetrics.estimate_bytes(rows[:10])
+    assert QueryMetrics.estimate_bytes(rows) == pytest.approx(100*small, rel = 0.05)
+    assert QueryMetrics.estimate_bytes(Tabular(data = rows, columns = ['id', 'code'])) == QueryMetrics.estimate_bytes(rows)
+    assert QueryMetrics.estimate_bytes([]) == 0
+    assert QueryMetrics.estimate_bytes(None) == 0
+
+def test_handler_records_queries_including_cache_hits(odbc, instrumented):
+    odbc.RESULTS['SELECT'] = ROWS
+    records = []
+    instrumented.metrics.hook = records.append
+    instrumented.execute_query("SELECT [id], [code] FROM [dbo].[t]", name = 'orders')
+    instrumented.execute_query("SELECT [id], [code] FROM [dbo].[t]", name = 'orders')
+    assert [record['cached'] for record in records] == [False, True]
+    assert all(record['rows'] == 10 and record['bytes'] > 0 for record in records)
+    assert records[0]['total'] == pytest.approx(records[0]['connect'] + records[0]['execute'] + records[0]['fetch'])
+    stats = instrumented.metrics.stats()['execute_query:orders']
+    assert stats['count'] == 2 and stats['cached'] == 1 and stats['rows'] == 20
+
+def test_handler_records_streams_and_inserts(odbc, instrumented):
+    odbc.RESULTS['SELECT'] = ROWS
+    for _ in instrumented.iter_query("SELECT [id], [code] FROM [dbo].[t]", batch_size = 4, name = 'orders'):
+        pass
+    instrumented.insert('dbo', 't', [(1, 'a'), (2, 'b')], columns = ['id', 'code'], fast_execute = False, auto_create_table = False)
+    stats = instrumented.metrics.stats()
+    assert stats['iter_query:orders']['rows'] == 10
+    assert stats['insert:t']['rows'] == 2
+
+def test_spawned_handlers_share_the_metrics(instrumented):
+    assert instrumented.spawn().metrics is instrumented.metrics
@@ -0,0 +1,75 @@
+import re
+
+import pytest
+
+DESCRIPTION = [('region', int), ('id', int), ('code', str)]
+TABLE = [(region, n, f"{region}-{n}") for region in (1, 2, 3) for n in range(1, 5)]
+
+def source(odbc, descending = (False, False), extra = 0):
+    def order(row):
+        return tuple(-row[k] if descending[k] else row[k] for k in range(2))
+    def answer(query, params):
+        size = int(re.search(r"TOP \((\d+)\)", query).group(1))
+        rows = sorted(TABLE, key = order)
+        if 'WHERE' in query.split(') AS [page]')[-1]:
+            last = params[extra:][-2:]
+            rows = [row for row in rows if order(row) > order(last)]
+        return (DESCRIPTION, rows[:size])
+    odbc.RESULTS['AS [page]'] = answer
+
+def executed(odbc) -> list:
+    return [entry for entry in odbc.LOG if entry[0] == 'execute']
+
+def test_pages_seek_past_the_last_composite_key(odbc, handler):
+    source(odbc)
+    pages = list(handler.paginate("SELECT [region], [id], [code] FROM [dbo].[t]", ['region', 'id'], page_size = 5, name = 'page'))
+    assert [page.row_count for page in pages] == [5, 5, 2]
+    assert [row for page in pages for row in page.data] == TABLE
+    queries = odbc.queries()
+    assert queries[0].endswith("AS [page] ORDER BY [region] ASC, [id] ASC")
+    assert queries[1].endswith("AS [page] WHERE ([region] > ?) OR ([region] = ? AND [id] > ?) ORDER BY [region] ASC, [id] ASC")
+    assert executed(odbc)[1][2] == (2, 2, 1)
+
+def test_pages_in_descending_order_with_query_values(odbc, handler):
+    source(odbc, descending = (True, False), extra = 1)
+    pages = list(handler.paginate("SELECT [region], [id], [code] FROM [dbo].[t] WHERE [id] > ?", ['region', 'id'], page_size = 4, values = 0, descending = [True, False]))
+    assert [row[:2] for row in pages[0].data] == [(3, 1), (3, 2), (3, 3), (3, 4)]
+    assert "WHERE ([region] < ?) OR ([region] = ? AND [id] > ?)" in odbc.queries()[1]
+    assert executed(odbc)[1][2] == (0, 3, 3, 4)
+    assert sum(page.row_count for page in pages) == len(TABLE)
+
+def test_an_exact_last_page_reads_one_empty_page(odbc, handler):
+    source(odbc)
+    pages = list(handler.paginate("SELECT [region], [id], [code] FROM [dbo].[t]", ['region', 'id'], page_size = 6))
+    assert [page.row_count for page in pages] == [6, 6]
+    assert len(odbc.queries()) == 3
+
+def test_pages_are_read_lazily(odbc, handler):
+    source(odbc)
+    pages = handler.paginate("SELECT [region], [id], [code] FROM [dbo].[t]", ['region', 'id'], page_size = 5)
+    next(pages)
+    assert len(odbc.queries()) == 1
+
+def test_key_columns_must_be_returned(odbc, handler):
+    source(odbc)
+    with pytest.raises(ValueError):
+        list(handler.paginate("SELECT [region], [id], [code] FROM [dbo].[t]", ['missing']))
+
+def test_invalid_arguments_are_rejected(handler):
+    with pytest.raises(ValueError):
+        list(handler.paginate("SELECT 1", []))
+    with pytest.raises(ValueError):
+        list(handler.paginate("SELECT 1", ['id'], descending = [True, False]))
+    with pytest.raises(ValueError):
+        list(handler.paginate("SELECT 1", ['id'], page_size = 0))
+
+def test_an_empty_string_key_at_a_page_boundary_is_sought_as_itself(odbc, handler):
+    rows = [('',), ('a',), ('b',), ('c',)]
+    def answer(query, params):
+        if 'WHERE' in query.split(') AS [page]')[-1]:
+            return ([('code', str)], [row for row in rows if row[0] > params[-1]][:1])
+        return ([('code', str)], rows[:1])
+    odbc.RESULTS['AS [page]'] = answer
+    pages = list(handler.paginate("SELECT [code] FROM [dbo].[t]", ['code'], page_size = 1))
+    assert executed(odbc)[1][2] == ('',)
+    assert [page.data for page in pages] == [[(None,)], [('a',)], [('b',)], [('c',)]]
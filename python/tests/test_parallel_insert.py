@@ -0,0 +1,50 @@
+from time import sleep
+
+import pytest
+
+from pyjra.sql import PartitionError
+
+def move_statements(odbc) -> list[tuple]:
+    return [entry for entry in odbc.LOG if entry[0] == 'execute' and ('FROM [dbo].[t__stage_' in entry[1] or entry[1].startswith('DROP TABLE [dbo].[t__stage_') or 'XACT_ABORT' in entry[1])]
+
+def test_atomic_insert_moves_staging_tables_in_one_transaction(odbc, handler):
+    rows = handler.insert('dbo', 't', [(i, str(i)) for i in range(9)], columns = ['a', 'b'], batch_size = 3, parallel = 3, auto_create_table = False, fast_execute = False)
+    assert rows == 9
+    moves = move_statements(odbc)
+    assert moves[0][1] == "SET XACT_ABORT ON"
+    assert moves[-1][1] == "SET XACT_ABORT OFF"
+    connection = moves[0][4]
+    assert all(entry[4] is connection for entry in moves)
+    assert not connection.autocommit
+    commits = [index for index, entry in enumerate(odbc.LOG) if entry == ('commit', connection)]
+    assert len(commits) == 1
+    assert commits[0] > odbc.LOG.index(moves[-1])
+
+def slow_partition(query, rows):
+    sleep(0.05)
+
+def test_failed_move_is_rolled_back_and_stages_dropped(odbc, handler):
+    odbc.RESULTS['INSERT INTO [dbo].[t__stage_'] = slow_partition
+    moved = []
+    def insert_from_stage(query, params):
+        moved.append(query)
+        if len(moved) == 2:
+            return odbc.OperationalError('40197', 'The service has encountered an error processing your request. (40197)')
+    odbc.RESULTS['WITH (TABLOCK)'] = insert_from_stage
+    with pytest.raises(odbc.OperationalError):
+        handler.insert('dbo', 't', [(i, str(i)) for i in range(9)], columns = ['a', 'b'], batch_size = 3, parallel = 3, auto_create_table = False, fast_execute = False)
+    connection = [entry for entry in move_statements(odbc) if entry[1] == "SET XACT_ABORT ON"][0][4]
+    assert ('rollback', connection) in odbc.LOG
+    assert ('commit', connection) not in odbc.LOG
+    assert any(entry[1].count('DROP TABLE IF EXISTS') == 3 for entry in odbc.LOG if entry[0] == 'execute')
+
+def test_failed_partition_drops_stages(odbc, handler):
+    def fail_second(query, rows):
+        if rows[0][0] == 3:
+            return odbc.IntegrityError('23000', 'Violation of PRIMARY KEY constraint.')
+    odbc.RESULTS['INSERT INTO [dbo].[t__stage_'] = fail_second
+    with pytest.raises(PartitionError) as raised:
+        handler.insert('dbo', 't', [(i, str(i)) for i in range(9)], columns = ['a', 'b'], batch_size = 3, parallel = 3, auto_create_table = False, fast_execute = False)
+    assert raised.value.rows == 0
+    assert not any('WITH (TABLOCK)' in query for query in odbc.queries())
+    assert any('DROP TABLE IF EXISTS' in query for query in odbc.queries())
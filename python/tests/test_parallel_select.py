@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import PartitionError
+
+TABLE = [(n, f"c{n}") for n in range(1, 101)] + [(None, 'null')]
+DESCRIPTION = [('id', int), ('code', str)]
+
+def source(odbc, fail: int = None, error: Exception = None):
+    def answer(query, params):
+        if 'MIN(' in query:
+            return ([('', int), ('', int)], [(1, 100)])
+        if 'NTILE' in query:
+            return ([('', int)], [(30,), (60,), (90,), (100,)])
+        condition = query.split('WHERE ')[-1]
+        lower = params[0] if '> ?' in condition else None
+        upper = params[-1] if '<= ?' in condition else None
+        if fail is not None and lower == fail:
+            return error or odbc.OperationalError('HY000', 'Connection reset.')
+        rows = [row for row in TABLE if (row[0] is None and 'IS NULL' in condition) or (row[0] is not None and (lower is None or row[0] > lower) and (upper is None or row[0] <= upper))]
+        return (DESCRIPTION, rows)
+    odbc.RESULTS['AS [source]'] = answer
+
+def partitions(odbc) -> list:
+    return [entry[2] for entry in odbc.LOG if entry[0] == 'execute' and entry[1].startswith('SELECT * FROM')]
+
+def test_range_partitions_cover_every_row_once(odbc, pooled):
+    source(odbc)
+    result = pooled.parallel_select("SELECT [id], [code] FROM [dbo].[t]", 'id', partitions = 4, name = 't')
+    assert sorted(partitions(odbc), key = str) == sorted([(25,), (25, 50), (50, 75), (75,)], key = str)
+    assert result.name == 't' and result.columns == ['id', 'code']
+    assert sorted(result.data, key = lambda row: (row[0] is None, row[0] or 0)) == TABLE
+
+def test_ntile_boundaries(odbc, pooled):
+    source(odbc)
+    result = pooled.parallel_select("SELECT [id], [code] FROM [dbo].[t]", 'id', partitions = 4, boundaries = 'ntile')
+    assert sorted(partitions(odbc), key = str) == sorted([(30,), (30, 60), (60, 90), (90,)], key = str)
+    assert result.row_count == len(TABLE)
+
+def test_streamed_partitions_are_yielded_in_order(odbc, pooled):
+    source(odbc)
+    batches = list(pooled.parallel_select("SELECT [id], [code] FROM [dbo].[t]", 'id', partitions = 2, stream = True))
+    assert [batch.data[0] for batch in batches] == [(1, 'c1'), (51, 'c51')]
+    assert sum(batch.row_count for batch in batches) == len(TABLE)
+
+def test_failed_partitions_raise_after_the_rest_finish(odbc, pooled):
+    source(odbc, fail = 50)
+    with pytest.raises(PartitionError) as caught:
+        pooled.parallel_select("SELECT [id], [code] FROM [dbo].[t]", 'id', partitions = 4)
+    assert list(caught.value.failures) == [2]
+    assert isinstance(caught.value.failures[2], odbc.OperationalError)
+    assert len(partitions(odbc)) == 4
+
+def test_failed_partitions_release_their_connections(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', pool_size = 1)
+    executor.pool.checkout_timeout = 0.5
+    try:
+        source(odbc, fail = 50, error = odbc.IntegrityError('23000', 'Arithmetic overflow error.'))
+        with pytest.raises(PartitionError):
+            executor.parallel_select("SELECT [id], [code] FROM [dbo].[t]", 'id', partitions = 2)
+        source(odbc)
+        assert executor.parallel_select("SELECT [id], [code] FROM [dbo].[t]", 'id', partitions = 2).row_count == len(TABLE)
+        assert len(odbc.CONNECTIONS) == 1
+    finally:
+        executor.close_pool()
+
+def test_range_boundaries_split_numbers_and_dates_evenly():
+    boundaries = SQLHandler._SQLHandler__range_boundaries
+    assert boundaries(0, 100, 4) == [25, 50, 75]
+    assert boundaries(1, 2, 4) == [1]
+    assert boundaries(date(2026, 1, 1), date(2026, 1, 5), 2) == [date(2026, 1, 3)]
+    assert boundaries('a', 'z', 4) is None
+    assert boundaries(True, False, 2) is None
@@ -0,0 +1,77 @@
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import ConnectionPool
+
+def test_pooled_handler_reuses_one_connection(odbc, pooled):
+    odbc.RESULTS['SELECT'] = ([('x', int)], [(1,)])
+    for _ in range(3):
+        assert pooled.execute_query("SELECT 1").data == [(1,)]
+    assert len(odbc.CONNECTIONS) == 1
+    assert not odbc.CONNECTIONS[0].closed
+    assert len(pooled.pool) == 1
+
+def test_unpooled_handler_connects_per_call(odbc, handler):
+    odbc.RESULTS['SELECT'] = ([('x', int)], [(1,)])
+    handler.execute_query("SELECT 1")
+    handler.execute_query("SELECT 1")
+    assert len(odbc.CONNECTIONS) == 2
+    assert all(conn.closed for conn in odbc.CONNECTIONS)
+
+def test_pool_blocks_at_capacity_until_timeout(odbc):
+    pool = ConnectionPool(lambda: odbc.connect(''), size = 1, checkout_timeout = 0.05)
+    conn = pool.get()
+    with pytest.raises(TimeoutError):
+        pool.get()
+    pool.put(conn)
+    assert pool.get() is conn
+
+def test_pool_discards_unhealthy_idle_connections(odbc):
+    pool = ConnectionPool(lambda: odbc.connect(''), size = 1, ping_after = 0)
+    conn = pool.get()
+    pool.put(conn)
+    odbc.RESULTS['SELECT 1'] = odbc.OperationalError('08S01', 'Communication link failure')
+    replacement = pool.get()
+    assert replacement is not conn
+    assert conn.closed
+    assert len(pool) == 1
+
+def test_closed_pool_refuses_connections(odbc):
+    pool = ConnectionPool(lambda: odbc.connect(''), size = 2)
+    conn = pool.get()
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.get()
+    pool.put(conn)
+    assert conn.closed
+    assert len(pool) == 0
+
+def test_failed_connect_releases_its_slot(odbc):
+    pool = ConnectionPool(lambda: odbc.connect(''), size = 1, checkout_timeout = 0.05)
+    odbc.FAIL_CONNECT.append(odbc.OperationalError('08001', 'Login timeout expired'))
+    with pytest.raises(odbc.OperationalError):
+        pool.get()
+    assert len(pool) == 0
+    pool.put(pool.get())
+
+@pytest.mark.parametrize('failure', ['execute', 'fetch'])
+def test_failed_query_returns_its_connection_to_the_pool(odbc, monkeypatch, failure):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', pool_size = 1)
+    executor.pool.checkout_timeout = 0.05
+    if failure == 'execute':
+        odbc.RESULTS['bad'] = odbc.IntegrityError('23000', 'Cannot insert duplicate key row.')
+    else:
+        odbc.RESULTS['bad'] = ([('x', int)], [(1,)])
+        def fetchall(cursor):
+            raise odbc.OperationalError('08S01', 'Communication link failure')
+        monkeypatch.setattr(odbc.Cursor, 'fetchall', fetchall)
+    try:
+        with pytest.raises(odbc.Error):
+            executor.spawn().execute_query("SELECT bad")
+        assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG
+        monkeypatch.undo()
+        odbc.RESULTS['SELECT 1'] = ([('x', int)], [(1,)])
+        assert executor.spawn().execute_query("SELECT 1").data == [(1,)]
+        assert len(odbc.CONNECTIONS) == 1
+    finally:
+        executor.close_pool()
@@ -0,0 +1,63 @@
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import RetryPolicy
+
+DEADLOCK = ('40001', 'Transaction (Process ID 52) was deadlocked on lock resources with another process and has been chosen as the deadlock victim. (1205)')
+ROWS = ([('id', int)], [(1,), (2,)])
+
+@pytest.fixture
+def retrying() -> SQLHandler:
+    return SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', retry_policy = RetryPolicy(attempts = 3, base_delay = 0, jitter = 0))
+
+def failing_once(odbc, error: Exception):
+    calls = []
+    def answer(query, params):
+        calls.append(query)
+        if len(calls) == 1:
+            return error
+        return ROWS
+    return calls, answer
+
+def test_is_transient_classifies_by_state_and_code(odbc):
+    policy = RetryPolicy()
+    assert policy.is_transient(odbc.OperationalError('HYT00', 'Login timeout expired'))
+    assert policy.is_transient(odbc.ProgrammingError('42000', "Database 'db' on server 'server' is not currently available. (40613)"))
+    assert not policy.is_transient(odbc.IntegrityError('23000', 'Violation of PRIMARY KEY constraint. (2627)'))
+
+def test_connect_is_retried_under_the_policy(odbc, retrying):
+    odbc.FAIL_CONNECT.append(odbc.OperationalError('08001', 'TCP Provider: The wait operation timed out.'))
+    odbc.RESULTS['SELECT'] = ROWS
+    result = retrying.execute_query("SELECT [id] FROM [dbo].[t]")
+    assert result.data == [(1,), (2,)]
+    assert len(odbc.CONNECTIONS) == 1
+
+def test_query_is_not_retried_by_default(odbc, retrying):
+    calls, answer = failing_once(odbc, odbc.DatabaseError(*DEADLOCK))
+    odbc.RESULTS['UPDATE'] = answer
+    with pytest.raises(odbc.DatabaseError):
+        retrying.execute_query("UPDATE [dbo].[t] SET [n] = [n] + 1")
+    assert len(calls) == 1
+
+def test_query_is_retried_on_a_fresh_connection_when_opted_in(odbc, retrying):
+    calls, answer = failing_once(odbc, odbc.DatabaseError(*DEADLOCK))
+    odbc.RESULTS['SELECT'] = answer
+    result = retrying.execute_query("SELECT [id] FROM [dbo].[t]", retry = True)
+    assert result.data == [(1,), (2,)]
+    assert len(calls) == 2
+    assert len(odbc.CONNECTIONS) == 2
+    assert odbc.CONNECTIONS[0].closed
+
+def test_permanent_errors_are_not_retried_when_opted_in(odbc, retrying):
+    calls, answer = failing_once(odbc, odbc.ProgrammingError('42S02', "Invalid object name 'dbo.t'. (208)"))
+    odbc.RESULTS['SELECT'] = answer
+    with pytest.raises(odbc.ProgrammingError):
+        retrying.execute_query("SELECT [id] FROM [dbo].[t]", retry = True)
+    assert len(calls) == 1
+
+def test_retry_wait_retries_connections_once(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', retry_wait = 0)
+    odbc.FAIL_CONNECT.extend([odbc.OperationalError('08001', 'Timed out.')]*2)
+    with pytest.raises(odbc.OperationalError):
+        executor.connect_to_mssql()
+    assert len(odbc.CONNECTIONS) == 0
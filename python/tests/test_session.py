@@ -0,0 +1,62 @@
+import pytest
+
+def transactions(odbc) -> list:
+    return [entry[0] if entry[0] in ('commit', 'rollback') else entry[1] for entry in odbc.LOG if entry[0] in ('commit', 'rollback') or 'TRANSACTION' in entry[1]]
+
+def test_calls_share_one_connection_and_commit_on_exit(odbc, handler):
+    with handler.session() as s:
+        assert s is handler
+        s.execute_query("DELETE FROM [dbo].[t] WHERE [date] = ?", ('2026-10-17',))
+        s.execute_query("EXECUTE [dbo].[usp_refresh]")
+        s.insert('dbo', 't', [(1,)], columns = ['id'], fast_execute = False, auto_create_table = False)
+        assert handler.connected
+        assert not odbc.CONNECTIONS[0].autocommit
+        assert not any(entry[0] == 'commit' for entry in odbc.LOG)
+    assert len(odbc.CONNECTIONS) == 1
+    assert [entry[0] for entry in odbc.LOG if entry[0] in ('commit', 'rollback')] == ['commit']
+    assert not handler.connected
+
+def test_an_error_rolls_the_session_back(odbc, handler):
+    with pytest.raises(RuntimeError):
+        with handler.session():
+            handler.execute_query("DELETE FROM [dbo].[t]")
+            raise RuntimeError('stop')
+    assert [entry[0] for entry in odbc.LOG if entry[0] in ('commit', 'rollback')] == ['rollback']
+    assert not handler.connected
+
+def test_commit_false_rolls_back_on_exit(odbc, handler):
+    with handler.session(commit = False):
+        handler.execute_query("DELETE FROM [dbo].[t]", commit = True)
+    assert [entry[0] for entry in odbc.LOG if entry[0] in ('commit', 'rollback')] == ['rollback']
+
+def test_nested_sessions_roll_back_to_their_savepoint_only(odbc, handler):
+    with handler.session():
+        with pytest.raises(RuntimeError):
+            with handler.session():
+                handler.execute_query("DELETE FROM [dbo].[t]")
+                raise RuntimeError('stop')
+        with handler.session(commit = False):
+            handler.execute_query("DELETE FROM [dbo].[u]")
+        with handler.session():
+            handler.execute_query("DELETE FROM [dbo].[v]")
+    steps = transactions(odbc)
+    assert [step.split('\n')[-1] if 'SAVE' in step else step for step in steps] == [
+        'SAVE TRANSACTION [pyjra_session_1];', 'ROLLBACK TRANSACTION [pyjra_session_1]',
+        'SAVE TRANSACTION [pyjra_session_1];', 'ROLLBACK TRANSACTION [pyjra_session_1]',
+        'SAVE TRANSACTION [pyjra_session_1];',
+        'commit'
+    ]
+
+def test_a_failed_savepoint_rollback_is_raised(odbc, handler):
+    odbc.RESULTS['ROLLBACK TRANSACTION'] = odbc.ProgrammingError('25000', 'The current transaction cannot be committed. (3931)')
+    with pytest.raises(odbc.ProgrammingError):
+        with handler.session():
+            with handler.session():
+                raise odbc.IntegrityError('23000', 'Duplicate key.')
+    assert [entry[0] for entry in odbc.LOG if entry[0] in ('commit', 'rollback')] == ['rollback']
+
+def test_session_on_an_open_autocommit_connection_turns_autocommit_off(odbc, handler):
+    handler.connect_to_mssql(auto_commit = True)
+    with handler.session():
+        assert not odbc.CONNECTIONS[0].autocommit
+    assert ('commit', odbc.CONNECTIONS[0]) in odbc.LOG
@@ -0,0 +1,82 @@
+import gc
+import os
+
+import pytest
+
+from pyjra.utilities import SpilledTabular
+
+ROWS = [(1, 1.5, 'a'), (2, None, None), (None, -2.25, 'c')]
+
+@pytest.fixture
+def spilled(tmp_path) -> SpilledTabular:
+    table = SpilledTabular.spill(iter([ROWS[:2], [], ROWS[2:]]), ['id', 'amount', 'code'], [int, float, str], name = 'spilled', directory = str(tmp_path))
+    yield table
+    table.close()
+
+def test_rows_and_columns_round_trip(spilled):
+    assert spilled.kinds == ['q', 'd', 'o']
+    assert spilled.row_count == 3
+    assert list(spilled.data) == ROWS
+    assert spilled.data[-1] == ROWS[-1]
+    assert spilled.data[1:] == ROWS[1:]
+    assert spilled.get_column('id') == (1, 2, None)
+    assert spilled.get_column(1) == (1.5, None, -2.25)
+    assert spilled.get_column('code') == ('a', None, 'c')
+    with pytest.raises(IndexError):
+        spilled.data[3]
+
+def test_str_shows_the_first_rows_and_the_row_count(spilled):
+    spilled.PREVIEW_ROWS = 2
+    text = str(spilled)
+    assert '│ id │' in text and 'code' in text
+    assert '1.5' in text and '-2.25' not in text
+    assert text.endswith('3 rows, showing the first 2.')
+    text = repr(spilled)
+    assert text.startswith('SpilledTabular(')
+    assert "row_count = 3" in text
+    assert text.endswith("# First 2 rows: [(1, 1.5, 'a'), (2, None, None), ...]")
+
+def test_to_delimited_and_to_dataframe(spilled):
+    assert spilled.to_delimited() == "id,amount,code\n1,1.5,a\n2,,\n,-2.25,c"
+    frame = spilled.to_dataframe()
+    assert list(frame.columns) == ['id', 'amount', 'code']
+    assert frame['code'].isna().tolist() == [False, True, False]
+    assert frame['amount'].isna().tolist() == [False, True, False]
+    assert frame['id'].iloc[0] == 1 and frame['code'].iloc[2] == 'c'
+    assert spilled.to_tabular().data == ROWS
+
+def test_is_read_only(spilled):
+    with pytest.raises(ValueError):
+        spilled.insert((4, 4.0, 'd'))
+    with pytest.raises(ValueError):
+        spilled.delete_columns('id')
+
+def test_close_deletes_the_files(tmp_path):
+    with SpilledTabular.spill(iter([ROWS]), ['id', 'amount', 'code'], [int, float, str], directory = str(tmp_path)) as table:
+        directory = table.directory
+        assert len(os.listdir(directory)) == 9
+    assert not os.path.exists(directory)
+    assert table.row_count == 0
+    assert str(table).endswith('0 rows.')
+
+def test_garbage_collection_deletes_the_files(tmp_path):
+    table = SpilledTabular.spill(iter([ROWS]), ['id', 'amount', 'code'], [int, float, str], directory = str(tmp_path))
+    directory = table.directory
+    del table
+    gc.collect()
+    assert not os.path.exists(directory)
+
+def test_failed_spill_deletes_the_files(tmp_path):
+    with pytest.raises(ValueError):
+        SpilledTabular.spill(iter([[(2**70,)]]), ['id'], [int], directory = str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+def test_execute_query_spills_large_results(odbc, handler, tmp_path):
+    odbc.RESULTS['SELECT'] = ([('id', int), ('code', str)], [(n, '' if n % 2 else str(n)) for n in range(50)])
+    result = handler.execute_query("SELECT [id], [code] FROM [dbo].[t]", spill_bytes = 100, batch_size = 10)
+    try:
+        assert isinstance(result, SpilledTabular)
+        assert result.row_count == 50
+        assert result.get_column('code')[:3] == ('0', None, '2')
+    finally:
+        result.close()
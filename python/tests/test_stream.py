@@ -0,0 +1,42 @@
+import pytest
+
+ROWS = ([('id', int), ('code', str)], [(n, '' if n == 3 else f"c{n}") for n in range(1, 8)])
+
+def test_iter_query_yields_batches_of_batch_size(odbc, handler):
+    odbc.RESULTS['SELECT'] = ROWS
+    batches = list(handler.iter_query("SELECT [id], [code] FROM [dbo].[t]", batch_size = 3, name = 't'))
+    assert [batch.row_count for batch in batches] == [3, 3, 1]
+    assert all(batch.name == 't' and batch.columns == ['id', 'code'] for batch in batches)
+    assert batches[0].data[2] == (3, None)
+    assert [row for batch in batches for row in batch.data][-1] == (7, 'c7')
+    assert not handler.connected
+    assert odbc.CONNECTIONS[0].closed
+
+def test_execute_query_streams_lazily(odbc, handler):
+    odbc.RESULTS['SELECT'] = ROWS
+    stream = handler.execute_query("SELECT [id], [code] FROM [dbo].[t]", stream = True, batch_size = 5)
+    assert odbc.CONNECTIONS == []
+    assert next(stream).row_count == 5
+    assert handler.connected
+    assert next(stream).row_count == 2
+    with pytest.raises(StopIteration):
+        next(stream)
+    assert not handler.connected
+
+def test_closing_the_iterator_early_releases_the_connection(odbc, pooled):
+    odbc.RESULTS['SELECT'] = ROWS
+    stream = pooled.iter_query("SELECT [id], [code] FROM [dbo].[t]", batch_size = 2)
+    next(stream)
+    stream.close()
+    assert not pooled.connected
+    assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG
+    pooled.execute_query("SELECT [id], [code] FROM [dbo].[t]")
+    assert len(odbc.CONNECTIONS) == 1
+
+def test_iter_query_without_results_yields_nothing(odbc, handler):
+    assert list(handler.iter_query("UPDATE [dbo].[t] SET [code] = NULL")) == []
+    assert ('commit', odbc.CONNECTIONS[0]) in odbc.LOG
+
+def test_iter_query_rejects_an_empty_batch_size(handler):
+    with pytest.raises(ValueError):
+        list(handler.iter_query("SELECT 1", batch_size = 0))
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pyjra.utilities import Tabular
+
+DESCRIPTION = [('id', int), ('name', str), ('when', datetime)]
+ROWS = [(1, '', datetime(2026, 10, 17)), (2, 'b', None), (3, None, datetime(2026, 10, 18))]
+
+def test_fetched_blanks_are_read_as_none_like_the_constructor(odbc, handler):
+    odbc.RESULTS['SELECT'] = (DESCRIPTION, ROWS)
+    fetched = handler.execute_query("SELECT * FROM [t]")
+    constructed = Tabular(data = list(ROWS), columns = ['id', 'name', 'when'], datatypes = [int, str, datetime])
+    assert fetched.data == constructed.data == [(1, None, datetime(2026, 10, 17)), (2, 'b', None), (3, None, datetime(2026, 10, 18))]
+    assert fetched.datatypes == [int, str, datetime]
+
+def test_every_fetch_path_reads_blanks_as_none(odbc, handler):
+    odbc.RESULTS['SELECT'] = (DESCRIPTION, ROWS)
+    expected = [None, 'b', None]
+    assert handler.execute_query("SELECT * FROM [t]", columnar = True).get_column('name') == tuple(expected)
+    assert [row[1] for batch in handler.iter_query("SELECT * FROM [t]", batch_size = 2) for row in batch.data] == expected
+    assert [row[1] for row in handler.execute_batch(["SELECT * FROM [t]"])[0].data] == expected
+    spilled = handler.execute_query("SELECT * FROM [t]", spill_bytes = 1, batch_size = 1)
+    assert spilled.get_column('name') == tuple(expected)
+    spilled.close()
+
+def test_from_trusted_keeps_blanks_unless_asked():
+    assert Tabular.from_trusted([(1, '')], ['a', 'b'], [int, str]).data == [(1, '')]
+    assert Tabular.from_trusted([(1, '')], ['a', 'b'], [int, str], blanks_as_none = True).data == [(1, None)]
+    assert Tabular.from_trusted([(1, 2), ('', '')], ['a', 'b'], [int, str], row_based = False, blanks_as_none = True).data == [(1, 2), [None, None]]
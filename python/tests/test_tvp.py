@@ -0,0 +1,47 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from pyjra.sql import SQLHandler
+from pyjra.sql import QueryCache
+from pyjra.utilities import Tabular
+
+def test_to_tvp_builds_rows_with_an_optional_type_name():
+    ids = Tabular(data = [(1,), (2,)], columns = ['id'])
+    assert SQLHandler.to_tvp(ids) == [(1,), (2,)]
+    assert SQLHandler.to_tvp([[1], [2]], '[id_list]', '[jra]') == ['id_list', 'jra', (1,), (2,)]
+    assert SQLHandler.to_tvp(pd.DataFrame({'id': [1, 2]}), 'id_list') == ['id_list', 'dbo', (1,), (2,)]
+
+def test_tabular_values_are_sent_as_table_valued_parameters(odbc, handler):
+    odbc.RESULTS['FROM ?'] = ([('id', int)], [(2,)])
+    ids = Tabular(data = [(1,), (2,)], columns = ['id'])
+    result = handler.execute_query("SELECT [o].[id] FROM [dbo].[orders] AS [o] WHERE [o].[id] IN (SELECT [id] FROM ?)", (ids,))
+    assert result.data == [(2,)]
+    assert odbc.LOG[0][2] == ([(1,), (2,)],)
+
+def test_table_valued_parameters_bypass_the_cache(odbc):
+    executor = SQLHandler(server = 'server', database = 'database', uid = 'user', pwd = 'password', cache = QueryCache())
+    odbc.RESULTS['FROM ?'] = ([('id', int)], [(1,)])
+    query = "SELECT [id] FROM ?"
+    executor.execute_query(query, (SQLHandler.to_tvp([(1,)], 'id_list'),))
+    executor.execute_query(query, (SQLHandler.to_tvp([(1,)], 'id_list'),))
+    assert odbc.queries().count(query) == 2
+    assert len(executor.cache) == 0
+
+def test_create_table_type_from_columns(odbc, handler):
+    assert handler.create_table_type('id_list', columns = ['id'], datatypes = ['int'], primary_key = ['id'])
+    query, params = odbc.LOG[0][1], odbc.LOG[0][2]
+    assert query == "IF TYPE_ID(?) IS NULL\nCREATE TYPE [dbo].[id_list] AS TABLE (\n\t[id] int,\n\tPRIMARY KEY ([id])\n)"
+    assert params == ('[dbo].[id_list]',)
+
+def test_create_table_type_maps_python_datatypes_of_data(odbc, handler):
+    data = Tabular(data = [(1, 1.5, Decimal('2.5'), datetime(2026, 10, 17), 'x', True)], columns = ['a', 'b', 'c', 'd', 'e', 'f'])
+    handler.create_table_type('rows', data = data, datatypes = ['int'], schema = 'jra')
+    query = odbc.LOG[0][1]
+    assert "CREATE TYPE [jra].[rows] AS TABLE (\n\t[a] int,\n\t[b] float,\n\t[c] decimal(38, 10),\n\t[d] datetime2,\n\t[e] nvarchar(4000),\n\t[f] bit\n)" in query
+
+def test_create_table_type_needs_columns(handler):
+    with pytest.raises(ValueError):
+        handler.create_table_type('empty')
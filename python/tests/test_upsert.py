@@ -0,0 +1,28 @@
+import pytest
+
+MERGED = ([('action', str), ('rows', int)], [('INSERT', 2), ('UPDATE', 1)])
+
+def test_upsert_stages_merges_and_counts(odbc, handler):
+    odbc.RESULTS['MERGE'] = MERGED
+    counts = handler.upsert('dbo', 't', [(1, 'x'), (2, 'y'), (3, 'z')], keys = ['a'], columns = ['a', 'b'])
+    assert counts == {'inserted': 2, 'updated': 1, 'deleted': 0}
+    queries = odbc.queries()
+    staged = [entry for entry in odbc.LOG if entry[0] == 'executemany']
+    assert staged[0][1].startswith('INSERT INTO #upsert_')
+    assert staged[0][2] == [(1, 'x'), (2, 'y'), (3, 'z')]
+    merge = [query for query in queries if 'MERGE' in query][0]
+    assert 'WHEN NOT MATCHED BY SOURCE' not in merge
+    assert any(query.startswith('DROP TABLE #upsert_') for query in queries)
+
+def test_upsert_does_not_leak_nocount_to_the_pool(odbc, pooled):
+    odbc.RESULTS['MERGE'] = MERGED
+    pooled.upsert('dbo', 't', [(1, 'x')], keys = ['a'], columns = ['a', 'b'])
+    assert len(odbc.CONNECTIONS) == 1
+    assert not odbc.CONNECTIONS[0].nocount
+
+def test_failed_upsert_does_not_leak_nocount_to_the_pool(odbc, pooled):
+    odbc.RESULTS['MERGE'] = odbc.IntegrityError('23000', 'Cannot insert duplicate key row.')
+    with pytest.raises(odbc.IntegrityError):
+        pooled.upsert('dbo', 't', [(1, 'x')], keys = ['a'], columns = ['a', 'b'])
+    assert not odbc.CONNECTIONS[0].nocount
+    assert ('rollback', odbc.CONNECTIONS[0]) in odbc.LOG